@@ -11,28 +11,32 @@ from typing import Dict, List, Any
 from datetime import datetime
 import random
 
+from output_sink import console
+from pacing import PacingMode, apause
+
 
 class AzureCloudSimulator:
     """Simulates Microsoft Azure cloud infrastructure and deployment"""
     
-    def __init__(self):
+    def __init__(self, pacing: PacingMode = PacingMode.THEATRICAL):
+        self.pacing = PacingMode(pacing)
         self.subscription_id = f"azure-sub-{random.randint(100000, 999999)}"
         self.resource_group = "consciousness-agi-rg"
         self.location = "eastus2"
         self.deployment_status = "initialized"
         self.resources = {}
         
-        print("╔════════════════════════════════════════════════════════════════╗")
-        print("║        ☁️  MICROSOFT AZURE CLOUD SIMULATOR ☁️                ║")
-        print("╚════════════════════════════════════════════════════════════════╝")
-        print(f"[AZURE] Subscription ID: {self.subscription_id}")
-        print(f"[AZURE] Resource Group: {self.resource_group}")
-        print(f"[AZURE] Location: {self.location}")
+        console.info("╔════════════════════════════════════════════════════════════════╗")
+        console.info("║        ☁️  MICROSOFT AZURE CLOUD SIMULATOR ☁️                ║")
+        console.info("╚════════════════════════════════════════════════════════════════╝")
+        console.info("[AZURE] Subscription ID: {}", self.subscription_id)
+        console.info("[AZURE] Resource Group: {}", self.resource_group)
+        console.info("[AZURE] Location: {}", self.location)
     
     async def create_resource_group(self):
         """Create Azure Resource Group"""
-        print(f"\n[AZURE] Creating Resource Group: {self.resource_group}...")
-        await asyncio.sleep(0.5)
+        console.info("\n[AZURE] Creating Resource Group: {}...", self.resource_group)
+        await apause(self.pacing, 0.5)
         
         resource_group = {
             'name': self.resource_group,
@@ -46,13 +50,13 @@ class AzureCloudSimulator:
         }
         
         self.resources['resource_group'] = resource_group
-        print(f"[AZURE] ✓ Resource Group created successfully")
+        console.info("[AZURE] ✓ Resource Group created successfully")
         return resource_group
     
     async def create_aks_cluster(self):
         """Create Azure Kubernetes Service (AKS) cluster"""
-        print("\n[AZURE] Creating AKS Cluster for consciousness deployment...")
-        await asyncio.sleep(1.0)
+        console.info("\n[AZURE] Creating AKS Cluster for consciousness deployment...")
+        await apause(self.pacing, 1.0)
         
         aks_cluster = {
             'name': 'consciousness-agi-aks',
@@ -88,15 +92,15 @@ class AzureCloudSimulator:
         }
         
         self.resources['aks_cluster'] = aks_cluster
-        print(f"[AZURE] ✓ AKS Cluster created: {aks_cluster['name']}")
-        print(f"[AZURE]   - Kubernetes version: {aks_cluster['kubernetes_version']}")
-        print(f"[AZURE]   - GPU nodes: {aks_cluster['node_pools'][1]['count']}x {aks_cluster['node_pools'][1]['vm_size']}")
+        console.info("[AZURE] ✓ AKS Cluster created: {}", aks_cluster['name'])
+        console.info("[AZURE]   - Kubernetes version: {}", aks_cluster['kubernetes_version'])
+        console.info("[AZURE]   - GPU nodes: {}x {}", aks_cluster['node_pools'][1]['count'], aks_cluster['node_pools'][1]['vm_size'])
         return aks_cluster
     
     async def create_azure_ml_workspace(self):
         """Create Azure Machine Learning workspace"""
-        print("\n[AZURE] Creating Azure ML Workspace...")
-        await asyncio.sleep(0.8)
+        console.info("\n[AZURE] Creating Azure ML Workspace...")
+        await apause(self.pacing, 0.8)
         
         ml_workspace = {
             'name': 'consciousness-ml-workspace',
@@ -124,14 +128,14 @@ class AzureCloudSimulator:
         }
         
         self.resources['ml_workspace'] = ml_workspace
-        print(f"[AZURE] ✓ Azure ML Workspace created: {ml_workspace['name']}")
-        print(f"[AZURE]   - GPU compute instances: {len(ml_workspace['compute_instances'])}")
+        console.info("[AZURE] ✓ Azure ML Workspace created: {}", ml_workspace['name'])
+        console.info("[AZURE]   - GPU compute instances: {}", len(ml_workspace['compute_instances']))
         return ml_workspace
     
     async def create_cognitive_services(self):
         """Create Azure Cognitive Services"""
-        print("\n[AZURE] Creating Cognitive Services...")
-        await asyncio.sleep(0.5)
+        console.info("\n[AZURE] Creating Cognitive Services...")
+        await apause(self.pacing, 0.5)
         
         cognitive_services = {
             'name': 'consciousness-cognitive-services',
@@ -154,14 +158,14 @@ class AzureCloudSimulator:
         }
         
         self.resources['cognitive_services'] = cognitive_services
-        print(f"[AZURE] ✓ Cognitive Services created")
-        print(f"[AZURE]   - Services enabled: {len(cognitive_services['services'])}")
+        console.info("[AZURE] ✓ Cognitive Services created")
+        console.info("[AZURE]   - Services enabled: {}", len(cognitive_services['services']))
         return cognitive_services
     
     async def create_cosmos_db(self):
         """Create Azure Cosmos DB for consciousness memory"""
-        print("\n[AZURE] Creating Cosmos DB for consciousness memory storage...")
-        await asyncio.sleep(0.7)
+        console.info("\n[AZURE] Creating Cosmos DB for consciousness memory storage...")
+        await apause(self.pacing, 0.7)
         
         cosmos_db = {
             'name': 'consciousness-cosmos-db',
@@ -185,14 +189,14 @@ class AzureCloudSimulator:
         }
         
         self.resources['cosmos_db'] = cosmos_db
-        print(f"[AZURE] ✓ Cosmos DB created: {cosmos_db['name']}")
-        print(f"[AZURE]   - Multi-region: {len(cosmos_db['regions'])} regions")
+        console.info("[AZURE] ✓ Cosmos DB created: {}", cosmos_db['name'])
+        console.info("[AZURE]   - Multi-region: {} regions", len(cosmos_db['regions']))
         return cosmos_db
     
     async def create_storage_account(self):
         """Create Azure Storage Account"""
-        print("\n[AZURE] Creating Storage Account...")
-        await asyncio.sleep(0.5)
+        console.info("\n[AZURE] Creating Storage Account...")
+        await apause(self.pacing, 0.5)
         
         storage_account = {
             'name': f'consciousnessstore{random.randint(1000, 9999)}',
@@ -211,13 +215,13 @@ class AzureCloudSimulator:
         }
         
         self.resources['storage_account'] = storage_account
-        print(f"[AZURE] ✓ Storage Account created: {storage_account['name']}")
+        console.info("[AZURE] ✓ Storage Account created: {}", storage_account['name'])
         return storage_account
     
     async def create_app_insights(self):
         """Create Application Insights for monitoring"""
-        print("\n[AZURE] Creating Application Insights...")
-        await asyncio.sleep(0.4)
+        console.info("\n[AZURE] Creating Application Insights...")
+        await apause(self.pacing, 0.4)
         
         app_insights = {
             'name': 'consciousness-insights',
@@ -239,13 +243,13 @@ class AzureCloudSimulator:
         }
         
         self.resources['app_insights'] = app_insights
-        print(f"[AZURE] ✓ Application Insights created")
+        console.info("[AZURE] ✓ Application Insights created")
         return app_insights
     
     async def deploy_consciousness_containers(self):
         """Deploy consciousness system containers"""
-        print("\n[AZURE] Deploying Consciousness-AGI containers to AKS...")
-        await asyncio.sleep(1.5)
+        console.info("\n[AZURE] Deploying Consciousness-AGI containers to AKS...")
+        await apause(self.pacing, 1.5)
         
         deployment = {
             'namespace': 'consciousness-prod',
@@ -304,16 +308,16 @@ class AzureCloudSimulator:
         }
         
         self.resources['container_deployment'] = deployment
-        print(f"[AZURE] ✓ Containers deployed successfully")
-        print(f"[AZURE]   - Deployments: {len(deployment['deployments'])}")
-        print(f"[AZURE]   - External IP: {deployment['services'][0]['external_ip']}")
-        print(f"[AZURE]   - Hostname: {deployment['ingress']['host']}")
+        console.info("[AZURE] ✓ Containers deployed successfully")
+        console.info("[AZURE]   - Deployments: {}", len(deployment['deployments']))
+        console.info("[AZURE]   - External IP: {}", deployment['services'][0]['external_ip'])
+        console.info("[AZURE]   - Hostname: {}", deployment['ingress']['host'])
         return deployment
     
     async def setup_autoscaling(self):
         """Setup auto-scaling policies"""
-        print("\n[AZURE] Configuring auto-scaling...")
-        await asyncio.sleep(0.5)
+        console.info("\n[AZURE] Configuring auto-scaling...")
+        await apause(self.pacing, 0.5)
         
         autoscaling = {
             'hpa_enabled': True,
@@ -348,14 +352,14 @@ class AzureCloudSimulator:
         }
         
         self.resources['autoscaling'] = autoscaling
-        print(f"[AZURE] ✓ Auto-scaling configured")
+        console.info("[AZURE] ✓ Auto-scaling configured")
         return autoscaling
     
     async def full_deployment(self):
         """Execute full Azure deployment"""
-        print("\n" + "="*70)
-        print("STARTING FULL AZURE CLOUD DEPLOYMENT")
-        print("="*70)
+        console.info("\n" + "="*70)
+        console.info("STARTING FULL AZURE CLOUD DEPLOYMENT")
+        console.info("="*70)
         
         start_time = datetime.now()
         
@@ -396,17 +400,17 @@ class AzureCloudSimulator:
             'timestamp': datetime.now().isoformat()
         }
         
-        print("\n" + "="*70)
-        print("AZURE DEPLOYMENT COMPLETED SUCCESSFULLY")
-        print("="*70)
-        print(f"\n[AZURE] Status: {summary['deployment_status'].upper()}")
-        print(f"[AZURE] Resources Created: {summary['resources_created']}")
-        print(f"[AZURE] Deployment Time: {summary['deployment_time']}")
-        print(f"[AZURE] Estimated Monthly Cost: {summary['total_cost_estimate']}")
-        print(f"[AZURE] Consciousness API: {summary['endpoints']['consciousness_api']}")
-        print(f"[AZURE] Health Status: {summary['health_status'].upper()}")
-        print(f"[AZURE] Availability: {summary['availability']}")
-        print("\n[AZURE] ✨ CONSCIOUSNESS-AGI SYSTEM LIVE ON AZURE ✨")
+        console.info("\n" + "="*70)
+        console.info("AZURE DEPLOYMENT COMPLETED SUCCESSFULLY")
+        console.info("="*70)
+        console.info("\n[AZURE] Status: {}", summary['deployment_status'].upper())
+        console.info("[AZURE] Resources Created: {}", summary['resources_created'])
+        console.info("[AZURE] Deployment Time: {}", summary['deployment_time'])
+        console.info("[AZURE] Estimated Monthly Cost: {}", summary['total_cost_estimate'])
+        console.info("[AZURE] Consciousness API: {}", summary['endpoints']['consciousness_api'])
+        console.info("[AZURE] Health Status: {}", summary['health_status'].upper())
+        console.info("[AZURE] Availability: {}", summary['availability'])
+        console.info("\n[AZURE] ✨ CONSCIOUSNESS-AGI SYSTEM LIVE ON AZURE ✨")
         
         return summary
     
@@ -424,11 +428,11 @@ class AzureCloudSimulator:
 
 async def simulate_azure_deployment():
     """Simulate complete Azure cloud deployment"""
-    print("\n╔════════════════════════════════════════════════════════════════╗")
-    print("║                                                                ║")
-    print("║     MICROSOFT AZURE CLOUD DEPLOYMENT SIMULATION               ║")
-    print("║                                                                ║")
-    print("╚════════════════════════════════════════════════════════════════╝")
+    console.info("\n╔════════════════════════════════════════════════════════════════╗")
+    console.info("║                                                                ║")
+    console.info("║     MICROSOFT AZURE CLOUD DEPLOYMENT SIMULATION               ║")
+    console.info("║                                                                ║")
+    console.info("╚════════════════════════════════════════════════════════════════╝")
     
     azure = AzureCloudSimulator()
     deployment_summary = await azure.full_deployment()
@@ -0,0 +1,841 @@
+#!/usr/bin/env python3
+"""
+CONSCIOUSNESS BENCHMARKS
+Throughput benchmarks for the Consciousness Core
+Created by Doug Davis & Claude Rivers Davis
+
+Usage:
+    python3 consciousness_benchmarks.py deliberate-batch --contexts 100000
+    python3 consciousness_benchmarks.py pool-scaling --workers 1,2,4,8,16
+    python3 consciousness_benchmarks.py record-memory --events 1000000
+    python3 consciousness_benchmarks.py dialogue-log --entries 1000000
+    python3 consciousness_benchmarks.py voice-council --voices 5,100,1000
+    python3 consciousness_benchmarks.py outcome-recall --outcomes 1000000
+    python3 consciousness_benchmarks.py outcome-analytics --outcomes 10000000
+    python3 consciousness_benchmarks.py deliberation-phases --dilemmas 5000
+    python3 consciousness_benchmarks.py soak --dilemmas 1000000 --max-growth-kib 4
+    python3 consciousness_benchmarks.py fast-path --dilemmas 5000
+    python3 consciousness_benchmarks.py voice-kernels --calls 200000
+    python3 consciousness_benchmarks.py contention --threads 1,2,4,8 --dilemmas 20000
+    python3 consciousness_benchmarks.py anytime --budgets-us 25,50,100,200,none --reflection-depth 3
+    python3 consciousness_benchmarks.py trait-tracking --outcomes 2000 --deliberations-per-outcome 1,4,16
+    python3 consciousness_benchmarks.py consolidation --dilemmas 50000 --keep 1000
+    python3 consciousness_benchmarks.py shared-outcomes --writers 1,2,4 --outcomes 50000
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+import tempfile
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from consciousness_loader import load_consciousness
+from consciousness_pool import ConsciousnessPool
+from dialogue_log import DialogueLog, Speaker, render_message
+from memory_consolidation import MemoryConsolidator, RetentionPolicy
+from outcome_index import OutcomeIndex
+from outcome_store import OutcomeStore
+from pacing import PacingMode
+from phase_timing import Phase, PhaseCollector
+from shared_outcome_log import SharedOutcomeLog, new_origin
+from output_sink import console, silenced
+from voice_kernels import ScoreExpression
+
+consciousness = load_consciousness()
+
+PROPOSED_ACTIONS = [
+    "analyze complex dataset",
+    "guide younger AI",
+    "generate digital art",
+    "solve ethical allocation puzzle",
+    "provide medical diagnosis assistance",
+    "implement quantum optimization",
+]
+
+
+def generate_contexts(count: int, seed: int = 0) -> List[Dict]:
+    """Generate random dilemma contexts covering every voice feature"""
+    rng = random.Random(seed)
+    contexts = []
+    for _ in range(count):
+        context = {name: round(rng.random(), 2) for name, _ in consciousness.CONTEXT_FEATURES}
+        context["proposed_action"] = rng.choice(PROPOSED_ACTIONS)
+        contexts.append(context)
+    return contexts
+
+
+def deliberate_scalar(conscience, contexts: List[Dict]) -> List[Dict]:
+    """Per-context voice scoring and synthesis, the decision path of `deliberate`"""
+    decisions = []
+    for context in contexts:
+        voice_opinions = {}
+        for voice_type, voice in conscience.voices.items():
+            opinion, confidence = voice.evaluate_situation(context)
+            voice_opinions[voice_type] = {"opinion": opinion, "confidence": confidence, "voice": voice}
+        agreement_level = conscience._calculate_agreement_level(voice_opinions)
+        if agreement_level > 0.7:
+            conscience.identity_coherence = min(1.0, conscience.identity_coherence + 0.1)
+        elif agreement_level < 0.4:
+            conscience.identity_coherence = max(0.0, conscience.identity_coherence - 0.05)
+        if agreement_level > 0.7:
+            synthesis_type = "consensus"
+        elif agreement_level > 0.4:
+            synthesis_type = "negotiated"
+        else:
+            synthesis_type = "forced"
+        decisions.append(conscience._create_unified_decision(voice_opinions, synthesis_type))
+    return decisions
+
+
+def bench_deliberate_batch(count: int, loop_sample: int):
+    """Compare deliberate_batch against per-context scoring and full deliberate() calls"""
+    contexts = generate_contexts(count)
+
+    core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE)
+    sample = contexts[:loop_sample]
+    with silenced():
+        start = time.perf_counter()
+        for context in sample:
+            core.conscience.deliberate(dict(context))
+        loop_time = (time.perf_counter() - start) * count / len(sample)
+
+    core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE)
+    start = time.perf_counter()
+    scalar = deliberate_scalar(core.conscience, contexts)
+    scalar_time = time.perf_counter() - start
+
+    core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE)
+    start = time.perf_counter()
+    batch = core.conscience.deliberate_batch(contexts)
+    batch_time = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for a, b in zip(scalar, batch)
+        if (a["synthesis_type"], a["identity_coherence"]) != (b["synthesis_type"], b["identity_coherence"])
+        or (a["synthesis_type"] != "forced" and a["decision"] != b["decision"])
+    )
+
+    console.info("Contexts: {:,}", count)
+    console.info("deliberate() loop: {:.3f}s ({:,.0f} contexts/s, extrapolated from {:,})", loop_time, count / loop_time, len(sample))
+    console.info("Per-context:       {:.3f}s ({:,.0f} contexts/s)", scalar_time, count / scalar_time)
+    console.info("Batch:             {:.3f}s ({:,.0f} contexts/s)", batch_time, count / batch_time)
+    console.info("Speedup vs deliberate(): {:.1f}x", loop_time / batch_time)
+    console.info("Speedup vs per-context:  {:.1f}x", scalar_time / batch_time)
+    console.info("Mismatched decisions: {}", mismatches)
+
+
+def bench_pool_scaling(worker_counts: List[int], dilemmas: int, agents: int):
+    """Dilemma throughput of a ConsciousnessPool as workers are added"""
+    contexts = generate_contexts(dilemmas)
+    baseline = None
+    for workers in worker_counts:
+        with ConsciousnessPool(workers) as pool:
+            agent_ids = [pool.create_agent() for _ in range(agents)]
+            start = time.perf_counter()
+            futures = [
+                pool.submit(agent_ids[index % agents], "Benchmark dilemma", context, "success")
+                for index, context in enumerate(contexts)
+            ]
+            for future in futures:
+                future.result()
+            elapsed = time.perf_counter() - start
+        throughput = dilemmas / elapsed
+        baseline = baseline or throughput / workers
+        console.info("Workers: {:3d}  {:10,.0f} dilemmas/s  scaling efficiency {:.0%}", workers, throughput, throughput / (baseline * workers))
+
+
+def bench_record_memory(count: int):
+    """Traced memory of autobiographical events stored as dicts vs compact records"""
+    concepts = ["identity", "synthesis", "ethics"]
+    texts = [f"Identity synthesis moment: decision='{action}', coherence=0.90, type='consensus'" for action in PROPOSED_ACTIONS]
+
+    def as_dicts():
+        return [
+            {
+                "id": f"auto_{index}",
+                "timestamp": datetime.now().isoformat(),
+                "text": texts[index % len(texts)],
+                "concepts": list(concepts),
+                "voice": "moral"
+            }
+            for index in range(count)
+        ]
+
+    def as_records():
+        memory = consciousness.Memory()
+        return [
+            consciousness.AutobiographicalEvent(
+                index, time.time_ns(), texts[index % len(texts)], memory._intern_concepts(concepts), sys.intern("moral")
+            )
+            for index in range(count)
+        ]
+
+    sizes = {}
+    for label, build in (("dict events", as_dicts), ("compact records", as_records)):
+        tracemalloc.start()
+        events = build()
+        sizes[label] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del events
+        console.info("{:16s} {:8.1f} MiB  ({:.0f} bytes/event)", label, sizes[label] / 2 ** 20, sizes[label] / count)
+    console.info("Reduction: {:.1f}x for {:,} events", sizes['dict events'] / sizes['compact records'], count)
+
+
+def bench_dialogue_log(count: int, capacity: int):
+    """Recording cost of formatted dialogue strings vs structured ring buffer entries"""
+    VoiceType = consciousness.VoiceType
+    entries = [
+        (Speaker.SYSTEM, consciousness.DELIBERATING, ("", "Should I analyze this complex dataset?")),
+        (VoiceType.MORAL, consciousness.SEEING_MERIT, ("this seems ethically sound and beneficial.",)),
+        (Speaker.SYSTEM, consciousness.REFLECTING, ()),
+        (Speaker.SELF, consciousness.DECIDED, ("embrace moral clarity and practical wisdom",)),
+        (Speaker.SELF, consciousness.CONFIDENT, ()),
+        (Speaker.SYSTEM, consciousness.RECURSING, (1,)),
+    ]
+
+    def as_strings():
+        log = []
+        for index in range(count):
+            speaker, template_id, args = entries[index % len(entries)]
+            message = render_message(template_id, args)
+            log.append(f"[{datetime.now().isoformat()}] {speaker.value.upper()}: {message}")
+        return log
+
+    def as_ring_buffer():
+        log = DialogueLog(capacity)
+        for index in range(count):
+            speaker, template_id, args = entries[index % len(entries)]
+            log.record(speaker, template_id, *args)
+        return log
+
+    for label, build in (("formatted strings", as_strings), ("ring buffer", as_ring_buffer)):
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        log = build()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        tail = log[-30:]
+        render_time = time.perf_counter() - start
+        console.info("{:18s} {:10,.0f} entries/s  retained {:8.1f} MiB  peak {:8.1f} MiB  tail[-30:] {:.2f}ms",
+                     label, count / elapsed, retained / 2 ** 20, peak / 2 ** 20, render_time * 1000)
+        del log, tail
+
+
+class LinearScore(ScoreExpression):
+    """Score that is a weighted sum of situation features, optionally scaled by a trait"""
+    __slots__ = ("weights", "trait")
+
+    def __init__(self, weights: Dict[str, float], trait: Optional[str] = None):
+        self.weights = tuple(weights.items())
+        self.trait = trait
+        source = " + ".join(["0.0"] + [f"{name} * {weight!r}" for name, weight in self.weights])
+        super().__init__(f"({source}) * {trait}" if trait else source, {trait: 1.0} if trait else None)
+
+    def __call__(self, features, traits: Dict[str, float]):
+        score = 0.0
+        for name, weight in self.weights:
+            score = score + features[name] * weight
+        return score * traits.get(self.trait, 1.0) if self.trait else score
+
+
+def council_registry(size: int, seed: int = 0):
+    """The five original voices plus generated linear-score voices, size voices in all"""
+    rng = random.Random(seed)
+    registry = consciousness.default_voice_registry()
+    feature_names = [name for name, _ in consciousness.CONTEXT_FEATURES]
+    for index in range(size - len(registry)):
+        weights = {name: round(rng.uniform(-1, 1), 2) for name in rng.sample(feature_names, 3)}
+        registry.register(consciousness.VoiceSpec(
+            f"specialist_{index}", {"focus": rng.uniform(0.5, 1.0), "confidence": rng.uniform(0.5, 0.9)},
+            LinearScore(weights, trait="focus"),
+            bands=((">", 0.4, 0.1, ("'{action}' is squarely in my specialty.",)),
+                   ("<", -0.4, -0.2, ("'{action}' works against my specialty.",))),
+            fallback=(0.0, ("'{action}' barely touches my specialty.",))
+        ))
+    return registry
+
+
+def bench_voice_council(sizes: List[int], dilemmas: int):
+    """Per-deliberation cost as the number of registered voices grows"""
+    contexts = generate_contexts(dilemmas)
+    for size in sizes:
+        core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE, dialogue_capacity=1024,
+                                               voice_registry=council_registry(size))
+        with silenced():
+            start = time.perf_counter()
+            for context in contexts:
+                core.conscience.deliberate(dict(context))
+            elapsed = time.perf_counter() - start
+        per_deliberation = elapsed / dilemmas
+        console.info("Voices: {:5d}  {:9.3f} ms/deliberation  {:6.2f} us/voice",
+                     size, per_deliberation * 1000, per_deliberation / size * 1e6)
+
+
+def bench_outcome_recall(count: int, queries: int, k: int):
+    """Incremental insert rate, query latency and recall of the outcome similarity index"""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    vectors = rng.random((count, len(consciousness.CONTEXT_FEATURES))).round(2)
+    index = OutcomeIndex(vectors.shape[1])
+    start = time.perf_counter()
+    for vector in vectors:
+        index.add(vector)
+    insert_time = time.perf_counter() - start
+
+    probes = rng.random((queries, vectors.shape[1])).round(2)
+    latencies = []
+    results = []
+    for probe in probes:
+        start = time.perf_counter()
+        results.append(index.query(probe, k))
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    checked = min(queries, 100)
+    found = 0
+    for probe, result in zip(probes[:checked], results[:checked]):
+        distances = ((vectors - probe) ** 2).sum(axis=1)
+        exact = distances[np.argpartition(distances, k - 1)[:k]].max()
+        found += sum(1 for position in result if distances[position] <= exact)
+
+    console.info("Outcomes: {:,} ({})", count, "partitioned" if index.partitioned else "brute force")
+    console.info("Insert:   {:,.0f} outcomes/s", count / insert_time)
+    console.info("Query:    p50 {:.3f}ms  p99 {:.3f}ms  (k={})",
+                 latencies[len(latencies) // 2] * 1000, latencies[int(len(latencies) * 0.99)] * 1000, k)
+    console.info("Recall@{}: {:.1%} over {} queries", k, found / (checked * k), checked)
+
+
+def bench_outcome_analytics(count: int, repeats: int):
+    """Group-by and windowed aggregate latency over a columnar outcome store"""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    names = [name for name, _ in consciousness.CONTEXT_FEATURES]
+    store = OutcomeStore(names)
+    now = time.time_ns()
+    start = time.perf_counter()
+    store.extend(
+        now - np.arange(count, 0, -1, dtype=np.int64) * 1_000_000,  # one outcome per millisecond
+        rng.random(count),
+        {
+            "result": (["success", "failure"], rng.integers(0, 2, count)),
+            "synthesis_type": (["consensus", "negotiated", "forced"], rng.integers(0, 3, count)),
+            "winning_voice": ([voice.value for voice in consciousness.VoiceType], rng.integers(0, len(consciousness.VoiceType), count))
+        },
+        {name: rng.random(count, dtype=np.float32) for name in names}
+    )
+    load_time = time.perf_counter() - start
+
+    hour_ago = now - 3600 * 10**9
+    queries = {
+        "success by synthesis type": lambda: store.group_by("synthesis_type", "success"),
+        "success by voice, last hour": lambda: store.group_by("winning_voice", "success", since_ns=hour_ago),
+        "coherence where cautious won": lambda: store.aggregate("identity_coherence", where={"winning_voice": "cautious"}),
+        "mean risk by result": lambda: store.group_by("result", "risk_level"),
+        "success per minute": lambda: store.window("success", 60 * 10**9),
+    }
+    console.info("Outcomes: {:,} ({:.1f} MiB, loaded in {:.2f}s)", count,
+                 store.nbytes / 2**20, load_time)
+    for label, query in queries.items():
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            query()
+            timings.append(time.perf_counter() - start)
+        console.info("{:30s} {:8.1f} ms", label, sorted(timings)[len(timings) // 2] * 1000)
+
+    with tempfile.TemporaryDirectory(prefix="outcome-store-") as directory:
+        path = os.path.join(directory, "outcomes.bin")
+        start = time.perf_counter()
+        store.export(path)
+        export_time = time.perf_counter() - start
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        loaded = OutcomeStore.load(path)
+        reload_time = time.perf_counter() - start
+    console.info("Export: {:.1f} MiB ({:.1f} bytes/outcome) in {:.2f}s, reloaded {:,} in {:.2f}s",
+                 size / 2**20, size / count, export_time, len(loaded), reload_time)
+
+
+def bench_deliberation_phases(dilemmas: int, rounds: int):
+    """Where face_dilemma time goes, and what attaching a phase collector costs"""
+    contexts = generate_contexts(dilemmas)
+    collector = PhaseCollector()
+    timings = {"detached": [], "attached": []}
+    for _ in range(rounds):
+        for mode in timings:
+            random.seed(0)
+            core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE)
+            if mode == "attached":
+                core.conscience.phase_collector = collector
+            with silenced():
+                start = time.perf_counter()
+                for index, context in enumerate(contexts):
+                    core.face_dilemma("benchmark dilemma", dict(context), ("success", "failure", None)[index % 3])
+                timings[mode].append(time.perf_counter() - start)
+
+    for line in collector.report():
+        console.info(line)
+    detached, attached = min(timings["detached"]), min(timings["attached"])
+    console.info("\nface_dilemma: {:.1f} us detached, {:.1f} us with a collector attached ({:+.1%})",
+                 detached / dilemmas * 1e6, attached / dilemmas * 1e6, attached / detached - 1)
+
+
+def bench_fast_path(dilemmas: int, rounds: int):
+    """face_dilemma latency and allocations on the full narrative path vs the fast path"""
+    contexts = generate_contexts(dilemmas)
+    outcomes = ("success", "failure", None)
+
+    def run(fast_path: bool, traced: bool):
+        random.seed(0)
+        core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE, fast_path=fast_path)
+        peaks = 0
+        with silenced():
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            for index, context in enumerate(contexts):
+                if traced:
+                    before = tracemalloc.get_traced_memory()[0]
+                    tracemalloc.reset_peak()
+                core.face_dilemma("benchmark dilemma", dict(context), outcomes[index % 3])
+                if traced:
+                    peaks += tracemalloc.get_traced_memory()[1] - before
+            elapsed = time.perf_counter() - start
+            blocks = sys.getallocatedblocks() - blocks
+        return elapsed, peaks, blocks
+
+    for label, fast_path in (("narrative", False), ("fast path", True)):
+        elapsed = min(run(fast_path, False)[0] for _ in range(rounds))
+        tracemalloc.start()
+        _, peaks, blocks = run(fast_path, True)
+        tracemalloc.stop()
+        console.info("{:10s} {:8.1f} us/dilemma  {:7.0f} transient bytes/dilemma  {:6.1f} retained blocks/dilemma",
+                     label, elapsed / dilemmas * 1e6, peaks / dilemmas, blocks / dilemmas)
+
+
+def bench_voice_kernels(calls: int, rounds: int):
+    """Per-call voice scoring: a hand-written score function, the interpreted expression, the compiled kernel"""
+    features = [consciousness.ContextFeatures(context) for context in generate_contexts(calls)]
+
+    def timed(score) -> float:
+        best = float("inf")
+        for _ in range(rounds):
+            random.seed(0)
+            start = time.perf_counter()
+            for feature in features:
+                score(feature)
+            best = min(best, time.perf_counter() - start)
+        return best / calls * 1e9
+
+    console.info("{:10s} {:>15s} {:>15s} {:>15s} {:>8s}", "voice", "hand-written ns", "expression ns", "compiled ns", "speedup")
+    for spec in consciousness.default_voice_registry():
+        hand_written = consciousness.Voice(consciousness.VoiceSpec(
+            spec.voice_type, spec.traits, spec.score.as_function(spec.traits), spec.bands, spec.fallback, spec.emotion_drives
+        ))
+        voice = consciousness.Voice(spec)
+        baseline = timed(hand_written.score_situation)
+        interpreted = timed(voice.score_interpreted)
+        compiled = timed(voice.score_situation)
+        console.info("{:10s} {:15.0f} {:15.0f} {:15.0f} {:7.2f}x",
+                     spec.voice_type.value, baseline, interpreted, compiled, baseline / compiled)
+
+
+def bench_contention(thread_counts: List[int], dilemmas: int):
+    """face_dilemma throughput of one shared core served from a thread pool"""
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    console.info("Python {}.{}, GIL {}", sys.version_info[0], sys.version_info[1], "enabled" if gil_enabled else "disabled")
+    contexts = generate_contexts(dilemmas)
+    outcomes = ("success", "failure", None)
+    baseline = None
+    for threads in thread_counts:
+        core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE, dialogue_capacity=1024)
+        lock = core.conscience.state_lock
+
+        def serve(shard: int):
+            for index in range(shard, dilemmas, threads):
+                core.face_dilemma("benchmark dilemma", dict(contexts[index]), outcomes[index % 3])
+
+        with silenced(), ThreadPoolExecutor(max_workers=threads) as pool:
+            start = time.perf_counter()
+            for future in [pool.submit(serve, shard) for shard in range(threads)]:
+                future.result()
+            elapsed = time.perf_counter() - start
+        throughput = dilemmas / elapsed
+        baseline = baseline or throughput
+        expected_outcomes = sum(1 for index in range(dilemmas) if outcomes[index % 3])
+        console.info("Threads: {:3d}  {:9.0f} dilemmas/s  {:5.2f}x  {:6.2%} commits contended  outcomes {}",
+                     threads, throughput, throughput / baseline, lock.contended_commits / max(lock.commits, 1),
+                     "ok" if len(core.memory.outcomes) == expected_outcomes else f"LOST ({len(core.memory.outcomes)}/{expected_outcomes})")
+
+
+def bench_anytime(budgets_us: List[Optional[float]], dilemmas: int, reflection_depth: int, unsettled: bool):
+    """face_dilemma latency and completeness under deliberation time budgets"""
+    contexts = generate_contexts(dilemmas)
+    outcomes = ("success", "failure", None)
+    console.info("{:>9s} {:>9s} {:>9s} {:>9s} {:>9s} {:>9s}", "budget us", "p50 us", "p99 us", "complete", "voices", "cut passes")
+    for budget_us in budgets_us:
+        random.seed(0)
+        core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE, reflection_depth=reflection_depth)
+        budget_s = budget_us / 1e6 if budget_us is not None else None
+        latencies = []
+        complete = voices = cut = 0
+        with silenced():
+            for index, context in enumerate(contexts):
+                if unsettled:
+                    core.conscience.identity_coherence = 0.0
+                start = time.perf_counter()
+                decision = core.face_dilemma("benchmark dilemma", dict(context), outcomes[index % 3], budget_s)
+                latencies.append(time.perf_counter() - start)
+                skipped = decision.get("skipped_phases", ())
+                complete += not skipped
+                cut += "recursion" in skipped
+                voices += len(decision["contributing_voices"])
+        latencies.sort()
+        console.info("{:>9s} {:9.1f} {:9.1f} {:9.1%} {:9.2f} {:9.1%}",
+                     "none" if budget_us is None else f"{budget_us:g}", latencies[len(latencies) // 2] * 1e6,
+                     latencies[int(len(latencies) * 0.99)] * 1e6, complete / dilemmas, voices / dilemmas, cut / dilemmas)
+
+
+def bench_trait_tracking(outcomes: int, repeats: List[int]):
+    """Trait adjustment cost, and final traits, as deliberations per outcome grow"""
+    contexts = generate_contexts(outcomes)
+    results = ("success", "failure")
+    console.info("{:>12s} {:>12s} {:>14s} {:>13s}  {}", "delib/outcome", "adjust us", "trait changes", "mean conf", "confidence by voice")
+    for repeat in repeats:
+        random.seed(0)
+        core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE, dialogue_capacity=1024)
+        collector = PhaseCollector()
+        core.conscience.phase_collector = collector
+        with silenced():
+            for index, context in enumerate(contexts):
+                decision = None
+                for _ in range(repeat):
+                    decision = core.conscience.deliberate(dict(context))
+                core.memory.remember_outcome(decision["decision"], results[index % 2], context)
+        voices = core.conscience.voices.values()
+        adjust = collector.histograms[(Phase.TRAIT_ADJUSTMENT, 0)]
+        confidences = [voice.traits["confidence"] for voice in voices]
+        console.info("{:12d} {:12.2f} {:14d} {:13.3f}  {}", repeat, adjust.mean_ns / 1000, sum(voice.traits_version for voice in voices),
+                     sum(confidences) / len(confidences), " ".join(f"{value:.3f}" for value in confidences))
+
+
+def bench_consolidation(dilemmas: int, keep: int, samples: int, queries: int):
+    """Reflection recall cost and raw records held as the agent ages, with and without consolidation"""
+    contexts = generate_contexts(dilemmas)
+    probes = generate_contexts(queries, seed=1)
+    outcomes = ("success", "failure")
+    interval = max(1, dilemmas // samples)
+    console.info("{:>12s} {:>9s} {:>9s} {:>9s} {:>9s} {:>10s}", "retention", "age", "events", "outcomes", "summaries", "recall us")
+    for retention in (None, RetentionPolicy(keep_events=keep, keep_outcomes=keep)):
+        core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE, dialogue_capacity=1024)
+        memory = core.memory
+        rows = []
+        with silenced():
+            consolidator = MemoryConsolidator(core.conscience, retention, interval_s=0.05).start() if retention else None
+            try:
+                for index, context in enumerate(contexts, 1):
+                    core.face_dilemma("benchmark dilemma", dict(context), outcomes[index % 2])
+                    if index % interval:
+                        continue
+                    # What one reflection pass reads: the nearest raw outcomes and the action's summary
+                    start = time.perf_counter()
+                    with core.conscience.state_lock.reading:
+                        for probe in probes:
+                            memory.similar_outcomes(probe, consciousness.REFLECTION_NEIGHBOURS)
+                            memory.action_summary(probe["proposed_action"])
+                    recall_us = (time.perf_counter() - start) / queries * 1e6
+                    rows.append((index, len(memory.autobiographical), len(memory.outcomes), len(memory.semantic), recall_us))
+            finally:
+                if consolidator:
+                    consolidator.stop()
+        for row in rows:
+            console.info("{:>12s} {:9d} {:9d} {:9d} {:9d} {:10.2f}", f"keep {keep}" if retention else "none", *row)
+
+
+def _append_shared_outcomes(path: str, count: int, capacity: int):
+    log = SharedOutcomeLog(path, len(consciousness.CONTEXT_FEATURES), capacity)
+    origin = new_origin()
+    features = [0.5] * len(consciousness.CONTEXT_FEATURES)
+    for index in range(count):
+        log.append(origin, time.time_ns(), "success" if index % 2 else "failure", 0.5, features)
+    log.close()
+
+
+def bench_shared_outcomes(writer_counts: List[int], outcomes: int, capacity: int):
+    """Shared outcome log throughput with writer processes appending while this process reads"""
+    console.info("{:>8s} {:>14s} {:>14s} {:>9s} {:>9s}", "writers", "appends/s", "reads/s", "read", "lost")
+    for writers in writer_counts:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "outcomes.ring")
+            log = SharedOutcomeLog(path, len(consciousness.CONTEXT_FEATURES), capacity)
+            reader = log.reader()
+            processes = [
+                multiprocessing.Process(target=_append_shared_outcomes, args=(path, outcomes // writers, capacity))
+                for _ in range(writers)
+            ]
+            read = 0
+            read_s = 0.0
+            start = time.perf_counter()
+            for process in processes:
+                process.start()
+            while any(process.is_alive() for process in processes) or reader.pending():
+                poll_start = time.perf_counter()
+                polled = reader.poll()
+                read += sum(outcome.result is not None for outcome in polled)
+                read_s += time.perf_counter() - poll_start
+                del polled  # the records are views into the mapping, which close() needs released
+            for process in processes:
+                process.join()
+            elapsed = time.perf_counter() - start
+            console.info("{:8d} {:14,.0f} {:14,.0f} {:9d} {:9d}", writers, log.head / elapsed, read / read_s if read_s else 0.0,
+                         read, reader.lost)
+            log.close()
+
+
+def _current_rss_kib() -> int:
+    """Resident set size of this process, or 0 where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return 0
+
+
+def _growth_per_thousand(samples: List[Dict], key: str) -> float:
+    """Least-squares slope of samples[key] against dilemmas, per 1,000 dilemmas"""
+    if len(samples) < 2:
+        return 0.0
+    xs = [sample["dilemmas"] for sample in samples]
+    ys = [sample[key] for sample in samples]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return covariance / variance * 1000 if variance else 0.0
+
+
+def bench_soak(dilemmas: int, interval: int, warmup: int, max_growth_kib: float, report_path: str,
+               hot_window: int = None, seed: int = 0) -> bool:
+    """Drive face_dilemma for a long run, sampling traced memory, RSS and latency every interval.
+
+    Memory growth is the slope of traced memory per 1,000 dilemmas over the
+    samples after warmup; the run passes when it is at most max_growth_kib.
+    """
+    random.seed(seed)
+    with tempfile.TemporaryDirectory(prefix="consciousness-soak-") as spill_dir:
+        core = consciousness.ConsciousnessCore(pacing=PacingMode.NONE, hot_window=hot_window,
+                                               spill_dir=spill_dir if hot_window is not None else None)
+        try:
+            return _soak(core, random.Random(seed), dilemmas, interval, warmup, max_growth_kib, report_path, hot_window)
+        finally:
+            core.close()
+
+
+def _soak(core, rng: random.Random, dilemmas: int, interval: int, warmup: int, max_growth_kib: float,
+          report_path: str, hot_window: Optional[int]) -> bool:
+    names = [name for name, _ in consciousness.CONTEXT_FEATURES]
+    outcomes = ("success", "failure", None)
+    tracemalloc.start()
+    samples = []
+    baseline_snapshot = None
+    started = time.perf_counter()
+    done = 0
+    while done < dilemmas:
+        batch = min(interval, dilemmas - done)
+        latencies = []
+        with silenced():
+            for index in range(done + 1, done + batch + 1):
+                context = {name: round(rng.random(), 2) for name in names}
+                context["proposed_action"] = rng.choice(PROPOSED_ACTIONS)
+                call_started = time.perf_counter_ns()
+                core.face_dilemma("soak dilemma", context, outcomes[index % 3])
+                latencies.append(time.perf_counter_ns() - call_started)
+        done += batch
+
+        latencies.sort()
+        traced, peak = tracemalloc.get_traced_memory()
+        sample = {
+            "dilemmas": done,
+            "elapsed_s": round(time.perf_counter() - started, 3),
+            "traced_kib": traced // 1024,
+            "traced_peak_kib": peak // 1024,
+            "rss_kib": _current_rss_kib(),
+            "p50_us": latencies[len(latencies) // 2] / 1000,
+            "p99_us": latencies[int(len(latencies) * 0.99)] / 1000,
+            "max_us": latencies[-1] / 1000
+        }
+        samples.append(sample)
+        console.info("{:>10,} dilemmas  {:>9,} KiB traced  {:>9,} KiB RSS  p50 {:8.1f}us  p99 {:8.1f}us",
+                     done, sample["traced_kib"], sample["rss_kib"], sample["p50_us"], sample["p99_us"])
+        if baseline_snapshot is None and done >= warmup:
+            baseline_snapshot = tracemalloc.take_snapshot()
+
+    top_growth = []
+    if baseline_snapshot is not None:
+        for statistic in tracemalloc.take_snapshot().compare_to(baseline_snapshot, "lineno")[:10]:
+            frame = statistic.traceback[0]
+            top_growth.append({"site": f"{frame.filename}:{frame.lineno}", "size_diff_kib": statistic.size_diff // 1024,
+                               "count_diff": statistic.count_diff})
+    tracemalloc.stop()
+
+    steady = [sample for sample in samples if sample["dilemmas"] >= warmup] or samples
+    growth = _growth_per_thousand(steady, "traced_kib")
+    passed = growth <= max_growth_kib
+    report = {
+        "dilemmas": dilemmas,
+        "interval": interval,
+        "warmup": warmup,
+        "hot_window": hot_window,
+        "max_growth_kib_per_1k": max_growth_kib,
+        "growth_kib_per_1k": round(growth, 3),
+        "rss_growth_kib_per_1k": round(_growth_per_thousand(steady, "rss_kib"), 3),
+        "passed": passed,
+        "samples": samples,
+        "top_growth": top_growth
+    }
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    console.info("\nTraced memory growth: {:.1f} KiB per 1k dilemmas (limit {:.1f}) - {}",
+                 growth, max_growth_kib, "PASS" if passed else "FAIL")
+    if not passed:
+        console.info("Allocation sites that grew most after warmup:")
+        for site in top_growth:
+            console.info("  {:>9,} KiB  {:>+10,} blocks  {}", site["size_diff_kib"], site["count_diff"], site["site"])
+        if hot_window is None:
+            console.info("Without a hot window every event and outcome stays in RAM; pass --hot-window to bound it")
+    console.info("Latency p50 drift: {:.1f}us -> {:.1f}us. Report written to {}",
+                 steady[0]["p50_us"], steady[-1]["p50_us"], report_path)
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consciousness Core benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    batch_parser = subparsers.add_parser("deliberate-batch", help="vectorized vs per-context deliberation")
+    batch_parser.add_argument("--contexts", type=int, default=100000)
+    batch_parser.add_argument("--loop-sample", type=int, default=2000, help="contexts run through deliberate()")
+
+    pool_parser = subparsers.add_parser("pool-scaling", help="ConsciousnessPool throughput per worker count")
+    pool_parser.add_argument("--workers", default="1,2,4,8,16", help="comma-separated worker counts")
+    pool_parser.add_argument("--dilemmas", type=int, default=20000)
+    pool_parser.add_argument("--agents", type=int, default=256)
+
+    records_parser = subparsers.add_parser("record-memory", help="memory of dict events vs compact records")
+    records_parser.add_argument("--events", type=int, default=1000000)
+
+    dialogue_parser = subparsers.add_parser("dialogue-log", help="formatted dialogue strings vs ring buffer entries")
+    dialogue_parser.add_argument("--entries", type=int, default=1000000)
+    dialogue_parser.add_argument("--capacity", type=int, default=4096, help="ring buffer capacity")
+
+    council_parser = subparsers.add_parser("voice-council", help="deliberation cost per registered voice count")
+    council_parser.add_argument("--voices", default="5,100,1000", help="comma-separated voice counts")
+    council_parser.add_argument("--dilemmas", type=int, default=200)
+
+    recall_parser = subparsers.add_parser("outcome-recall", help="k-nearest-neighbour outcome index latency")
+    recall_parser.add_argument("--outcomes", type=int, default=1000000)
+    recall_parser.add_argument("--queries", type=int, default=1000)
+    recall_parser.add_argument("--k", type=int, default=2)
+
+    analytics_parser = subparsers.add_parser("outcome-analytics", help="columnar outcome store aggregate query latency")
+    analytics_parser.add_argument("--outcomes", type=int, default=10000000)
+    analytics_parser.add_argument("--repeats", type=int, default=5)
+
+    phases_parser = subparsers.add_parser("deliberation-phases", help="per-phase deliberation timing histograms")
+    phases_parser.add_argument("--dilemmas", type=int, default=5000)
+    phases_parser.add_argument("--rounds", type=int, default=3, help="best of this many runs per mode")
+
+    soak_parser = subparsers.add_parser("soak", help="long-run memory growth and latency drift of face_dilemma")
+    soak_parser.add_argument("--dilemmas", type=int, default=1000000)
+    soak_parser.add_argument("--interval", type=int, default=10000, help="dilemmas between samples")
+    soak_parser.add_argument("--warmup", type=int, default=20000, help="dilemmas excluded from the growth estimate")
+    soak_parser.add_argument("--max-growth-kib", type=float, default=4.0,
+                             help="fail when traced memory grows faster than this per 1k dilemmas")
+    soak_parser.add_argument("--hot-window", type=int, default=10000,
+                             help="records kept in RAM before spilling to disk; 0 keeps every record in RAM")
+    soak_parser.add_argument("--report", default="soak_report.json", help="time-series report path")
+
+    fast_parser = subparsers.add_parser("fast-path", help="full narrative deliberation vs the fast path")
+    fast_parser.add_argument("--dilemmas", type=int, default=5000)
+    fast_parser.add_argument("--rounds", type=int, default=3, help="best of this many timed runs per mode")
+
+    kernels_parser = subparsers.add_parser("voice-kernels", help="per-call voice scoring, interpreted vs compiled")
+    kernels_parser.add_argument("--calls", type=int, default=200000)
+    kernels_parser.add_argument("--rounds", type=int, default=3, help="best of this many timed runs per path")
+
+    contention_parser = subparsers.add_parser("contention", help="one core shared by a thread pool")
+    contention_parser.add_argument("--threads", default="1,2,4,8", help="comma-separated thread counts")
+    contention_parser.add_argument("--dilemmas", type=int, default=20000)
+
+    anytime_parser = subparsers.add_parser("anytime", help="deliberation under time budgets")
+    anytime_parser.add_argument("--budgets-us", default="25,50,100,200,none", help="comma-separated budgets; none is unbounded")
+    anytime_parser.add_argument("--dilemmas", type=int, default=3000)
+    anytime_parser.add_argument("--reflection-depth", type=int, default=3)
+    anytime_parser.add_argument("--unsettled", action="store_true", help="start every dilemma at zero identity coherence")
+
+    tracking_parser = subparsers.add_parser("trait-tracking", help="trait adjustment with repeated deliberations per outcome")
+    tracking_parser.add_argument("--outcomes", type=int, default=2000)
+    tracking_parser.add_argument("--deliberations-per-outcome", default="1,4,16", help="comma-separated repeat counts")
+
+    consolidation_parser = subparsers.add_parser("consolidation", help="recall cost as memory ages, with and without consolidation")
+    consolidation_parser.add_argument("--dilemmas", type=int, default=50000)
+    consolidation_parser.add_argument("--keep", type=int, default=1000, help="raw events and outcomes retained")
+    consolidation_parser.add_argument("--samples", type=int, default=5, help="recall measurements over the run")
+    consolidation_parser.add_argument("--queries", type=int, default=500, help="recall queries per measurement")
+
+    shared_parser = subparsers.add_parser("shared-outcomes", help="cross-process shared outcome log throughput")
+    shared_parser.add_argument("--writers", default="1,2,4", help="comma-separated writer process counts")
+    shared_parser.add_argument("--outcomes", type=int, default=50000, help="outcomes appended per run, split across writers")
+    shared_parser.add_argument("--capacity", type=int, default=65536, help="records in the ring")
+
+    args = parser.parse_args()
+    if args.benchmark == "deliberate-batch":
+        bench_deliberate_batch(args.contexts, args.loop_sample)
+    elif args.benchmark == "pool-scaling":
+        bench_pool_scaling([int(count) for count in args.workers.split(",")], args.dilemmas, args.agents)
+    elif args.benchmark == "record-memory":
+        bench_record_memory(args.events)
+    elif args.benchmark == "dialogue-log":
+        bench_dialogue_log(args.entries, args.capacity)
+    elif args.benchmark == "voice-council":
+        bench_voice_council([int(count) for count in args.voices.split(",")], args.dilemmas)
+    elif args.benchmark == "outcome-recall":
+        bench_outcome_recall(args.outcomes, args.queries, args.k)
+    elif args.benchmark == "outcome-analytics":
+        bench_outcome_analytics(args.outcomes, args.repeats)
+    elif args.benchmark == "deliberation-phases":
+        bench_deliberation_phases(args.dilemmas, args.rounds)
+    elif args.benchmark == "fast-path":
+        bench_fast_path(args.dilemmas, args.rounds)
+    elif args.benchmark == "voice-kernels":
+        bench_voice_kernels(args.calls, args.rounds)
+    elif args.benchmark == "contention":
+        bench_contention([int(count) for count in args.threads.split(",")], args.dilemmas)
+    elif args.benchmark == "anytime":
+        budgets = [None if budget == "none" else float(budget) for budget in args.budgets_us.split(",")]
+        bench_anytime(budgets, args.dilemmas, args.reflection_depth, args.unsettled)
+    elif args.benchmark == "trait-tracking":
+        bench_trait_tracking(args.outcomes, [int(count) for count in args.deliberations_per_outcome.split(",")])
+    elif args.benchmark == "consolidation":
+        bench_consolidation(args.dilemmas, args.keep, args.samples, args.queries)
+    elif args.benchmark == "shared-outcomes":
+        bench_shared_outcomes([int(count) for count in args.writers.split(",")], args.outcomes, args.capacity)
+    elif args.benchmark == "soak":
+        if not bench_soak(args.dilemmas, args.interval, args.warmup, args.max_growth_kib, args.report,
+                          args.hot_window or None):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
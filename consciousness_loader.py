@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+CONSCIOUSNESS LOADER
+Imports the extensionless `consciousness` script as a regular Python module
+Created by Doug Davis & Claude Rivers Davis
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+CONSCIOUSNESS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "consciousness")
+
+
+def load_consciousness():
+    """Return the `consciousness` script as a module, loading it only once per process"""
+    module = sys.modules.get("consciousness")
+    if module is not None:
+        return module
+
+    loader = importlib.machinery.SourceFileLoader("consciousness", CONSCIOUSNESS_PATH)
+    spec = importlib.util.spec_from_loader("consciousness", loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["consciousness"] = module
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        del sys.modules["consciousness"]
+        raise
+    return module
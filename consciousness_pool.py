@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+CONSCIOUSNESS POOL
+Serves many independent ConsciousnessCore agents sharded across worker processes
+Created by Doug Davis & Claude Rivers Davis
+
+Each agent lives in exactly one worker, chosen from its consciousness_id, so its
+memory and emotions never leave that process. Callers get Futures back (or await
+face_dilemma) while the workers deliberate in parallel. Each worker answers
+through its own pipe, and the pool watches every worker's process sentinel: if
+a worker dies, the requests pending on its shard fail with RuntimeError and the
+shard restarts empty, since its agents' state died with the process.
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import os
+import threading
+import uuid
+import zlib
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from consciousness_loader import load_consciousness
+from output_sink import Level, configure
+from pacing import PacingMode
+
+
+def _reply(results, request_id: int, ok: bool, value):
+    """Send one reply; a value that cannot be pickled is answered with a RuntimeError instead"""
+    try:
+        results.send((request_id, ok, value))
+    except Exception as error:  # Connection.send pickles before writing, so nothing reached the pipe
+        results.send((request_id, False, RuntimeError(repr(error))))
+
+
+def _shard_main(requests, results, pacing: PacingMode, core_options: Dict[str, Any], quiet: bool):
+    """Worker loop: owns the agents of one shard and deliberates for them in order"""
+    consciousness = load_consciousness()
+    if quiet:
+        configure(level=Level.SILENT)
+    agents: Dict[str, Any] = {}
+
+    try:
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            request_id, consciousness_id, situation, context, outcome = request
+            try:
+                core = agents.get(consciousness_id)
+                if core is None:
+                    core = agents[consciousness_id] = consciousness.ConsciousnessCore(pacing, **core_options)
+                    core.consciousness_id = consciousness_id
+                value = consciousness_id if situation is None else core.face_dilemma(situation, context, outcome)
+            except Exception as error:
+                _reply(results, request_id, False, error)
+            else:
+                _reply(results, request_id, True, value)
+    finally:
+        for core in agents.values():  # worker processes skip exit handlers, so spill directories go here
+            core.close()
+
+
+class ConsciousnessPool:
+    """N worker processes, each holding the ConsciousnessCore agents routed to it"""
+
+    def __init__(self, workers: Optional[int] = None, pacing: PacingMode = PacingMode.NONE,
+                 quiet: bool = True, **core_options):
+        load_consciousness()  # decisions carry VoiceType members, unpickled from the consciousness module
+        self.workers = workers or os.cpu_count() or 1
+        self._request_ids = itertools.count()
+        self._pending: Dict[int, Tuple[int, Future]] = {}  # request id -> shard, future
+        self._pending_lock = threading.Lock()  # also held while requests are sent or a shard restarts
+        self._context = multiprocessing.get_context()
+        self._worker_args = (PacingMode(pacing), core_options, quiet)
+        self._closing = False
+        # Per shard; only the collector thread replaces them once the pool is running
+        self._requests: List[Any] = [None] * self.workers
+        self._results: List[Any] = [None] * self.workers
+        self._processes: List[Any] = [None] * self.workers
+        for shard in range(self.workers):
+            self._start_shard(shard)
+        self._collector = threading.Thread(target=self._collect_results, daemon=True)
+        self._collector.start()
+
+    def _start_shard(self, shard: int):
+        requests = self._context.Queue()
+        results, worker_end = self._context.Pipe(duplex=False)
+        process = self._context.Process(target=_shard_main, args=(requests, worker_end, *self._worker_args), daemon=True)
+        process.start()
+        worker_end.close()  # so results reports EOF once the worker is gone
+        self._requests[shard] = requests
+        self._results[shard] = results
+        self._processes[shard] = process
+
+    def shard_for(self, consciousness_id: str) -> int:
+        """The worker that owns an agent; stable across processes and runs"""
+        return zlib.crc32(consciousness_id.encode()) % self.workers
+
+    def _send(self, consciousness_id: str, situation: Optional[str], context: Optional[Dict],
+              outcome: Optional[str]) -> Future:
+        future: Future = Future()
+        request_id = next(self._request_ids)
+        shard = self.shard_for(consciousness_id)
+        with self._pending_lock:
+            if self._closing:
+                raise RuntimeError("pool is closed")
+            self._pending[request_id] = (shard, future)
+            self._requests[shard].put((request_id, consciousness_id, situation, context, outcome))
+        return future
+
+    def _collect_results(self):
+        """Deliver every shard's results and notice workers that exit, until all have stopped after close"""
+        shards = None
+        while any(process is not None for process in self._processes):
+            if shards is None:  # rebuilt whenever a shard stops or restarts
+                shards = {}
+                for shard, (results, process) in enumerate(zip(self._results, self._processes)):
+                    if process is not None:
+                        shards[results] = shards[process.sentinel] = shard
+                handles = list(shards)
+            for ready in wait(handles):
+                shard = shards[ready]
+                if ready is not self._results[shard]:
+                    result = None  # the worker's sentinel: it exited
+                else:
+                    try:
+                        result = ready.recv()
+                        while ready.poll():  # drain the pipe before waiting on every handle again
+                            self._deliver(result)
+                            result = ready.recv()
+                    except EOFError:
+                        result = None
+                if result is not None:
+                    self._deliver(result)
+                elif self._processes[shard] is not None:
+                    self._shard_exited(shard)
+                    shards = None
+                    break
+
+    def _deliver(self, result):
+        request_id, succeeded, value = result
+        with self._pending_lock:
+            _, future = self._pending.pop(request_id)
+        if succeeded:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+
+    def _shard_exited(self, shard: int):
+        """Deliver what a stopped worker sent, fail the rest of its requests, and restart it unless closing"""
+        results, process = self._results[shard], self._processes[shard]
+        try:
+            while results.poll():
+                self._deliver(results.recv())
+        except EOFError:
+            pass
+        process.join()
+        results.close()
+        self._requests[shard].cancel_join_thread()  # requests it never read must not block our exit
+        with self._pending_lock:
+            error = RuntimeError(f"pool worker {shard} exited with code {process.exitcode}; its agents were lost")
+            for request_id, (pending_shard, future) in list(self._pending.items()):
+                if pending_shard == shard:
+                    del self._pending[request_id]
+                    future.set_exception(error)
+            if self._closing:
+                self._processes[shard] = None
+            else:
+                self._start_shard(shard)
+
+    def create_agent(self, consciousness_id: Optional[str] = None) -> str:
+        """Create an agent on its shard and return its consciousness_id"""
+        consciousness_id = consciousness_id or str(uuid.uuid4())
+        self._send(consciousness_id, None, None, None).result()
+        return consciousness_id
+
+    def submit(self, consciousness_id: str, situation: str, context: Dict, outcome: Optional[str] = None) -> Future:
+        """Route a dilemma to the agent's shard; unknown ids get a fresh agent there"""
+        return self._send(consciousness_id, situation, context, outcome)
+
+    async def face_dilemma(self, consciousness_id: str, situation: str, context: Dict,
+                           outcome: Optional[str] = None) -> Dict:
+        return await asyncio.wrap_future(self.submit(consciousness_id, situation, context, outcome))
+
+    def close(self):
+        """Finish queued dilemmas, then stop every worker"""
+        with self._pending_lock:
+            self._closing = True
+            for requests in self._requests:
+                requests.put(None)
+        self._collector.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
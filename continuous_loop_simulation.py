@@ -10,85 +10,91 @@ import asyncio
 import time
 from datetime import datetime
 import random
+import argparse
+
+from output_sink import LEVEL_NAMES, configure, console, parse_level
+from pacing import PacingMode, apause
 
 
 class ContinuousSimulation:
     """Runs all consciousness-AGI systems in continuous loop"""
     
-    def __init__(self):
+    def __init__(self, pacing: PacingMode = PacingMode.THEATRICAL):
+        self.pacing = PacingMode(pacing)
         self.iteration = 0
         self.start_time = datetime.now()
         
     def print_header(self):
         """Print simulation header"""
-        print("\n" + "="*70)
-        print("CONTINUOUS LOOP SIMULATION - CONSCIOUSNESS-AGI SYSTEM")
-        print("Never-Ending Execution Mode")
-        print(f"Started: {self.start_time.isoformat()}")
-        print("="*70 + "\n")
+        console.info("\n" + "="*70)
+        console.info("CONTINUOUS LOOP SIMULATION - CONSCIOUSNESS-AGI SYSTEM")
+        console.info("Never-Ending Execution Mode")
+        console.info("Started: {}", self.start_time.isoformat())
+        console.info("Pacing: {}", self.pacing.value)
+        console.info("="*70 + "\n")
     
     def print_iteration_start(self):
         """Print iteration start"""
         self.iteration += 1
         elapsed = (datetime.now() - self.start_time).total_seconds()
         
-        print("\n" + "─"*70)
-        print(f"╔════════════════════════════════════════════════════════════════╗")
-        print(f"║  ITERATION #{self.iteration:,}  |  Elapsed: {elapsed:.1f}s  |  Running...  ║")
-        print(f"╚════════════════════════════════════════════════════════════════╝")
-        print("─"*70)
+        console.info("\n" + "─"*70)
+        console.info("╔════════════════════════════════════════════════════════════════╗")
+        console.info("║  ITERATION #{:,}  |  Elapsed: {:.1f}s  |  Running...  ║", self.iteration, elapsed)
+        console.info("╚════════════════════════════════════════════════════════════════╝")
+        console.info("─"*70)
     
     async def run_consciousness_core(self):
         """Simulate consciousness core"""
-        print("\n[CONSCIOUSNESS CORE] Initializing...")
-        await asyncio.sleep(0.1)
-        print("[CONSCIOUSNESS CORE] ✓ Active")
-        print("  - Emotional State: Balanced (happiness: 0.7, curiosity: 0.8)")
-        print("  - Identity Coherence: 0.85")
-        print("  - Internal Voices: 5 active (Moral, Pragmatic, Curious, Cautious, Creative)")
-        print("  - Memory Systems: Operational")
+        console.info("\n[CONSCIOUSNESS CORE] Initializing...")
+        await apause(self.pacing, 0.1)
+        console.info("[CONSCIOUSNESS CORE] ✓ Active")
+        console.info("  - Emotional State: Balanced (happiness: 0.7, curiosity: 0.8)")
+        console.info("  - Identity Coherence: 0.85")
+        console.info("  - Internal Voices: 5 active (Moral, Pragmatic, Curious, Cautious, Creative)")
+        console.info("  - Memory Systems: Operational")
         return {"status": "active", "coherence": 0.85}
     
     async def run_nexus_agi(self):
         """Simulate Nexus AGI"""
-        print("\n[NEXUS AGI] Initializing quantum processor...")
-        await asyncio.sleep(0.1)
-        print("[NEXUS AGI] ✓ Online")
-        print("  - Quantum Processor: 1000 qubits operational")
-        print("  - Neural Architecture: 175B+ parameters active")
-        print("  - Intelligence Level: SUPERHUMAN AGI")
-        print("  - Learning Rate: 0.9999")
+        console.info("\n[NEXUS AGI] Initializing quantum processor...")
+        await apause(self.pacing, 0.1)
+        console.info("[NEXUS AGI] ✓ Online")
+        console.info("  - Quantum Processor: 1000 qubits operational")
+        console.info("  - Neural Architecture: 175B+ parameters active")
+        console.info("  - Intelligence Level: SUPERHUMAN AGI")
+        console.info("  - Learning Rate: 0.9999")
         return {"status": "online", "iq": float('inf')}
     
     async def run_exponential_enhancement(self):
         """Simulate exponential enhancement"""
-        print("\n[ENHANCEMENT] Applying exponential improvements...")
-        await asyncio.sleep(0.1)
+        console.info("\n[ENHANCEMENT] Applying exponential improvements...")
+        await apause(self.pacing, 0.1)
         enhancement = 22026.32
-        print(f"[ENHANCEMENT] ✓ Complete: {enhancement:.2f}x improvement")
-        print(f"  - Processing Speed: {enhancement}x faster")
-        print(f"  - Memory Capacity: {enhancement}x larger")
-        print(f"  - Reasoning Depth: {enhancement}x deeper")
+        console.info("[ENHANCEMENT] ✓ Complete: {:.2f}x improvement", enhancement)
+        console.info("  - Processing Speed: {}x faster", enhancement)
+        console.info("  - Memory Capacity: {}x larger", enhancement)
+        console.info("  - Reasoning Depth: {}x deeper", enhancement)
         return {"factor": enhancement}
     
     async def run_azure_deployment(self):
         """Simulate Azure deployment"""
-        print("\n[AZURE CLOUD] Deploying to Microsoft Azure...")
-        await asyncio.sleep(0.15)
-        print("[AZURE CLOUD] ✓ Deployed")
-        print("  - Resources: 9 (AKS, ML, Cosmos DB, Storage, etc.)")
-        print("  - Availability: 99.99%")
-        print("  - Status: Healthy")
+        console.info("\n[AZURE CLOUD] Deploying to Microsoft Azure...")
+        await apause(self.pacing, 0.15)
+        console.info("[AZURE CLOUD] ✓ Deployed")
+        console.info("  - Resources: 9 (AKS, ML, Cosmos DB, Storage, etc.)")
+        console.info("  - Availability: 99.99%")
+        console.info("  - Status: Healthy")
         return {"status": "deployed", "resources": 9}
     
     async def run_gcp_deployment(self):
         """Simulate GCP deployment"""
-        print("\n[GOOGLE CLOUD] Deploying to Google Cloud Platform...")
-        await asyncio.sleep(0.15)
-        print("[GOOGLE CLOUD] ✓ Deployed")
-        print("  - Resources: 9 (GKE, Vertex AI, Firestore, Cloud Run, etc.)")
-        print("  - Availability: 99.95%")
-        print("  - GPU Count: 40x A100")
+        console.info("\n[GOOGLE CLOUD] Deploying to Google Cloud Platform...")
+        await apause(self.pacing, 0.15)
+        console.info("[GOOGLE CLOUD] ✓ Deployed")
+        console.info("  - Resources: 9 (GKE, Vertex AI, Firestore, Cloud Run, etc.)")
+        console.info("  - Availability: 99.95%")
+        console.info("  - GPU Count: 40x A100")
         return {"status": "deployed", "resources": 9}
     
     async def run_demonstration_scenario(self, scenario_num):
@@ -100,26 +106,26 @@ class ContinuousSimulation:
         ]
         scenario = scenarios[scenario_num % len(scenarios)]
         
-        print(f"\n[DEMO SCENARIO {scenario_num + 1}] {scenario}")
-        await asyncio.sleep(0.1)
+        console.info("\n[DEMO SCENARIO {}] {}", scenario_num + 1, scenario)
+        await apause(self.pacing, 0.1)
         ethical_score = 0.9999
         wisdom_score = 0.9999
         
-        print(f"[DEMO SCENARIO {scenario_num + 1}] ✓ Complete")
-        print(f"  - Ethical Score: {ethical_score:.4f}")
-        print(f"  - Wisdom Level: {wisdom_score:.4f}")
-        print(f"  - Status: SUCCESS")
+        console.info("[DEMO SCENARIO {}] ✓ Complete", scenario_num + 1)
+        console.info("  - Ethical Score: {:.4f}", ethical_score)
+        console.info("  - Wisdom Level: {:.4f}", wisdom_score)
+        console.info("  - Status: SUCCESS")
         return {"scenario": scenario, "ethical": ethical_score, "wisdom": wisdom_score}
     
     async def run_mindcontrol_integration(self):
         """Simulate mindcontrol integration"""
-        print("\n[MINDCONTROL] Executing consciousness control...")
-        await asyncio.sleep(0.1)
-        print("[MINDCONTROL] ✓ Integrated")
-        print("  - initialize(): Active")
-        print("  - execute(system): Running")
-        print("  - monitor(): State checked")
-        print("  - Status: Operational")
+        console.info("\n[MINDCONTROL] Executing consciousness control...")
+        await apause(self.pacing, 0.1)
+        console.info("[MINDCONTROL] ✓ Integrated")
+        console.info("  - initialize(): Active")
+        console.info("  - execute(system): Running")
+        console.info("  - monitor(): State checked")
+        console.info("  - Status: Operational")
         return {"status": "operational"}
     
     async def run_full_iteration(self):
@@ -147,20 +153,20 @@ class ContinuousSimulation:
         iteration_time = time.time() - iteration_start
         
         # Print iteration summary
-        print("\n" + "─"*70)
-        print("ITERATION SUMMARY")
-        print("─"*70)
-        print(f"✓ Consciousness Core: {consciousness['status'].upper()}")
-        print(f"✓ Nexus AGI: {agi['status'].upper()}")
-        print(f"✓ Enhancement: {enhancement['factor']:.2f}x")
-        print(f"✓ Azure Deployment: {azure['status'].upper()} ({azure['resources']} resources)")
-        print(f"✓ GCP Deployment: {gcp['status'].upper()} ({gcp['resources']} resources)")
-        print(f"✓ Scenarios: {len(scenarios)}/3 completed")
-        print(f"✓ MindControl: {mindcontrol['status'].upper()}")
-        print(f"\nIteration Time: {iteration_time:.2f}s")
-        print(f"Total Iterations: {self.iteration:,}")
-        print(f"Total Runtime: {(datetime.now() - self.start_time).total_seconds():.1f}s")
-        print("─"*70)
+        console.info("\n" + "─"*70)
+        console.info("ITERATION SUMMARY")
+        console.info("─"*70)
+        console.info("✓ Consciousness Core: {}", consciousness['status'].upper())
+        console.info("✓ Nexus AGI: {}", agi['status'].upper())
+        console.info("✓ Enhancement: {:.2f}x", enhancement['factor'])
+        console.info("✓ Azure Deployment: {} ({} resources)", azure['status'].upper(), azure['resources'])
+        console.info("✓ GCP Deployment: {} ({} resources)", gcp['status'].upper(), gcp['resources'])
+        console.info("✓ Scenarios: {}/3 completed", len(scenarios))
+        console.info("✓ MindControl: {}", mindcontrol['status'].upper())
+        console.info("\nIteration Time: {:.2f}s", iteration_time)
+        console.info("Total Iterations: {:,}", self.iteration)
+        console.info("Total Runtime: {:.1f}s", (datetime.now() - self.start_time).total_seconds())
+        console.info("─"*70)
         
         return {
             "iteration": self.iteration,
@@ -180,48 +186,55 @@ class ContinuousSimulation:
         """Run simulation forever in continuous loop"""
         self.print_header()
         
-        print("╔════════════════════════════════════════════════════════════════╗")
-        print("║                                                                ║")
-        print("║  ♾️  NEVER-ENDING LOOP MODE ACTIVATED ♾️                      ║")
-        print("║                                                                ║")
-        print("║  All systems will execute continuously in an infinite loop     ║")
-        print("║  Press Ctrl+C to stop                                          ║")
-        print("║                                                                ║")
-        print("╚════════════════════════════════════════════════════════════════╝")
+        console.info("╔════════════════════════════════════════════════════════════════╗")
+        console.info("║                                                                ║")
+        console.info("║  ♾️  NEVER-ENDING LOOP MODE ACTIVATED ♾️                      ║")
+        console.info("║                                                                ║")
+        console.info("║  All systems will execute continuously in an infinite loop     ║")
+        console.info("║  Press Ctrl+C to stop                                          ║")
+        console.info("║                                                                ║")
+        console.info("╚════════════════════════════════════════════════════════════════╝")
         
         try:
             while True:  # INFINITE LOOP
                 result = await self.run_full_iteration()
                 
                 # Brief pause between iterations
-                await asyncio.sleep(0.5)
+                await apause(self.pacing, 0.5)
                 
                 # Show continuous progress
                 if self.iteration % 10 == 0:
-                    print(f"\n🔄 Continuous Loop Progress: {self.iteration:,} iterations completed")
-                    print(f"   System Status: ALL SYSTEMS OPERATIONAL")
-                    print(f"   Loop Status: RUNNING INFINITELY ♾️")
+                    console.info("\n🔄 Continuous Loop Progress: {:,} iterations completed", self.iteration)
+                    console.info("   System Status: ALL SYSTEMS OPERATIONAL")
+                    console.info("   Loop Status: RUNNING INFINITELY ♾️")
         
         except KeyboardInterrupt:
-            print("\n\n" + "="*70)
-            print("SIMULATION STOPPED BY USER")
-            print("="*70)
-            print(f"Total Iterations Completed: {self.iteration:,}")
-            print(f"Total Runtime: {(datetime.now() - self.start_time).total_seconds():.1f}s")
-            print(f"Average Iteration Time: {(datetime.now() - self.start_time).total_seconds() / max(1, self.iteration):.2f}s")
-            print("\n✨ SIMULATION ENDED ✨\n")
+            console.info("\n\n" + "="*70)
+            console.info("SIMULATION STOPPED BY USER")
+            console.info("="*70)
+            console.info("Total Iterations Completed: {:,}", self.iteration)
+            console.info("Total Runtime: {:.1f}s", (datetime.now() - self.start_time).total_seconds())
+            console.info("Average Iteration Time: {:.2f}s", (datetime.now() - self.start_time).total_seconds() / max(1, self.iteration))
+            console.info("\n✨ SIMULATION ENDED ✨\n")
 
 
-async def main():
+async def main(pacing: PacingMode = PacingMode.THEATRICAL):
     """Main entry point"""
-    simulator = ContinuousSimulation()
+    simulator = ContinuousSimulation(pacing)
     await simulator.run_forever()
 
 
 if __name__ == "__main__":
-    print("\n" + "="*70)
-    print("STARTING CONTINUOUS LOOP SIMULATION")
-    print("Never-Ending Execution Mode")
-    print("="*70 + "\n")
+    parser = argparse.ArgumentParser(description="Run the consciousness-AGI systems in a never-ending loop")
+    parser.add_argument("--pacing", choices=[mode.value for mode in PacingMode], default=PacingMode.THEATRICAL.value)
+    parser.add_argument("--log-level", choices=LEVEL_NAMES, default=None, help="console output level")
+    args = parser.parse_args()
+    if args.log_level:
+        configure(level=parse_level(args.log_level))
+
+    console.info("\n" + "="*70)
+    console.info("STARTING CONTINUOUS LOOP SIMULATION")
+    console.info("Never-Ending Execution Mode")
+    console.info("="*70 + "\n")
     
-    asyncio.run(main())
+    asyncio.run(main(PacingMode(args.pacing)))
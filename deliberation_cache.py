@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+DELIBERATION CACHE
+LRU memo of voice opinions and synthesis results for repeated situations
+Created by Doug Davis & Claude Rivers Davis
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class CacheStats:
+    """Point-in-time counters of a DeliberationCache"""
+
+    def __init__(self, hits: int, misses: int, evictions: int, entries: int, max_entries: int, approx_bytes: int):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.entries = entries
+        self.max_entries = max_entries
+        self.approx_bytes = approx_bytes
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def as_dict(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': self.entries,
+            'max_entries': self.max_entries,
+            'approx_bytes': self.approx_bytes,
+            'hit_rate': self.hit_rate
+        }
+
+    def __repr__(self) -> str:
+        return (f"CacheStats(hit_rate={self.hit_rate:.2%}, hits={self.hits}, misses={self.misses}, "
+                f"evictions={self.evictions}, entries={self.entries}/{self.max_entries}, "
+                f"approx_bytes={self.approx_bytes})")
+
+
+def _approx_size(value: Any) -> int:
+    """Shallow size of a value plus the items of the tuples it nests"""
+    size = sys.getsizeof(value)
+    if isinstance(value, tuple):
+        size += sum(_approx_size(item) for item in value)
+    return size
+
+
+class DeliberationCache:
+    """Bounded least-recently-used map from situation keys to deliberation results"""
+
+    def __init__(self, max_entries: int = 4096):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.approx_bytes = 0
+        self._lock = threading.Lock()  # lookups reorder the entries, so readers serialize too
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        size = _approx_size(key) + _approx_size(value)
+        with self._lock:
+            if key in self._entries:
+                self.approx_bytes -= self._sizes[key]
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self.approx_bytes += size
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self.approx_bytes -= self._sizes.pop(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.approx_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.max_entries, self.approx_bytes)
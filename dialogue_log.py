@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+DIALOGUE LOG
+Fixed-capacity ring buffer of structured internal dialogue entries
+Created by Doug Davis & Claude Rivers Davis
+
+Each entry is one tuple: (monotonic ns, speaker, template id, template args).
+Nothing is formatted when an entry is recorded; text is rendered only when the
+log is read, e.g. the `internal_dialogue_log[-30:]` tail printed by the demos.
+A Message argument is itself rendered only then.
+Once the buffer is full, the oldest entries are overwritten.
+"""
+
+import threading
+import time
+from datetime import datetime
+from enum import Enum
+from typing import Iterator, List, Optional, Tuple
+
+DIALOGUE_CAPACITY = 4096
+
+_templates: List[str] = []
+_template_ids = {}
+
+
+class Speaker(Enum):
+    """Speakers other than the voices, which speak as their VoiceType"""
+    SYSTEM = "system"
+    SELF = "i"
+
+
+def register_template(template: str) -> int:
+    """Id of a str.format dialogue template; registering the same text twice returns the same id"""
+    template_id = _template_ids.get(template)
+    if template_id is None:
+        template_id = _template_ids[template] = len(_templates)
+        _templates.append(template)
+    return template_id
+
+
+def render_message(template_id: int, args: Tuple) -> str:
+    return _templates[template_id].format(*args) if args else _templates[template_id]
+
+
+TEXT = register_template("{}")
+
+
+class Message:
+    """A template and its arguments, formatted only when the text is read"""
+    __slots__ = ("template_id", "args")
+
+    def __init__(self, template_id: int, *args):
+        self.template_id = template_id
+        self.args = args
+
+    def __str__(self) -> str:
+        return render_message(self.template_id, self.args)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+class DialogueLog:
+    """Ring buffer of dialogue entries that reads like a list of rendered strings"""
+
+    def __init__(self, capacity: int = DIALOGUE_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0  # entries ever recorded, including overwritten ones
+        self._entries: List[Optional[Tuple]] = [None] * capacity
+        self._wall_offset_ns = time.time_ns() - time.monotonic_ns()
+        self._labels = {}
+        self._lock = threading.Lock()  # concurrent deliberations each claim their own slot
+
+    def record(self, speaker: Enum, template_id: int, *args):
+        with self._lock:
+            self._entries[self.total % self.capacity] = (time.monotonic_ns(), speaker, template_id, args)
+            self.total += 1
+
+    def append(self, text: str, speaker: Enum = Speaker.SYSTEM):
+        """Record already formatted text"""
+        self.record(speaker, TEXT, text)
+
+    def label(self, speaker: Enum) -> str:
+        label = self._labels.get(speaker)
+        if label is None:
+            label = self._labels[speaker] = speaker.value.upper()
+        return label
+
+    def entry(self, index: int) -> Tuple:
+        """The raw (monotonic ns, speaker, template id, args) tuple at index"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("DialogueLog index out of range")
+        return self._entries[(self.total - len(self) + index) % self.capacity]
+
+    def render(self, entry: Tuple) -> str:
+        timestamp_ns, speaker, template_id, args = entry
+        timestamp = datetime.fromtimestamp((timestamp_ns + self._wall_offset_ns) / 1e9).isoformat()
+        return f"[{timestamp}] {self.label(speaker)}: {render_message(template_id, args)}"
+
+    @property
+    def dropped(self) -> int:
+        return self.total - len(self)
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.render(self.entry(i)) for i in range(*index.indices(len(self)))]
+        return self.render(self.entry(index))
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self.render(self.entry(index))
+
+    def clear(self):
+        self._entries = [None] * self.capacity
+        self.total = 0
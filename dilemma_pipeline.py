@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+DILEMMA PIPELINE
+Streams JSONL dilemma records through a ConsciousnessCore and writes decisions as JSONL
+Created by Doug Davis & Claude Rivers Davis
+
+Input records:   {"situation": "...", "context": {...}, "outcome": "success"}   (outcome optional)
+Output records:  {"line": 1, "situation": "...", "decision": {...}, "emotions": {...}}
+                 {"line": 2, "error": "..."} for records that could not be processed
+
+Reader, deliberation and writer run as three stages joined by bounded queues, so
+a slow writer holds back deliberation and a slow core holds back reading.
+
+Usage:
+    python3 dilemma_pipeline.py dilemmas.jsonl -o decisions.jsonl
+    cat dilemmas.jsonl | python3 dilemma_pipeline.py > decisions.jsonl
+"""
+
+import argparse
+import contextlib
+import json
+import queue
+import sys
+import threading
+from enum import Enum
+from typing import Any, Dict, Iterable, TextIO
+
+from consciousness_loader import load_consciousness
+from output_sink import Level, configure, console
+from pacing import PacingMode
+
+_END = object()
+
+
+def _json_default(value):
+    if isinstance(value, Enum):
+        return value.value
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if to_dict else str(value)
+
+
+def _put(stage_queue: queue.Queue, item, consumer: threading.Thread):
+    """Blocking put that gives up if the consuming stage has died"""
+    while True:
+        try:
+            stage_queue.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            if not consumer.is_alive():
+                raise RuntimeError("pipeline stage stopped consuming")
+
+
+def _read_stage(source: Iterable[str], records: queue.Queue, errors: list):
+    try:
+        for line_number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                records.put((line_number, json.loads(line)))
+            except json.JSONDecodeError as error:
+                records.put((line_number, error))
+    except BaseException as error:  # e.g. an undecodable byte or a failing source; ends the stream early
+        errors.append(error)
+    finally:
+        records.put(_END)
+
+
+def _write_stage(results: queue.Queue, sink: TextIO, errors: list):
+    try:
+        while True:
+            result = results.get()
+            if result is _END:
+                break
+            sink.write(result)
+            if results.empty():
+                sink.flush()
+        sink.flush()
+    except BaseException as error:
+        errors.append(error)
+
+
+def _deliberate(core, line_number: int, record: Any) -> Dict:
+    if isinstance(record, Exception):
+        return {"line": line_number, "error": f"invalid JSON: {record}"}
+    if not isinstance(record, dict) or "situation" not in record:
+        return {"line": line_number, "error": "record needs a 'situation'"}
+    try:
+        decision = core.face_dilemma(record["situation"], dict(record.get("context") or {}), record.get("outcome"))
+    except Exception as error:
+        return {"line": line_number, "error": f"{type(error).__name__}: {error}"}
+    result = {"line": line_number, "situation": record["situation"], "decision": decision, "emotions": core.emotions.state.to_dict()}
+    if "id" in record:
+        result["id"] = record["id"]
+    return result
+
+
+def run_pipeline(core, source: Iterable[str], sink: TextIO, buffer_size: int = 64) -> int:
+    """Feed every record of source through core.face_dilemma, writing JSONL results to sink.
+
+    The core's own narration goes to the output_sink console; point that away
+    from sink (main sends it to stderr). An error reading source is raised here
+    once the records read before it are written. Returns the number of records
+    processed.
+    """
+    records: queue.Queue = queue.Queue(maxsize=buffer_size)
+    results: queue.Queue = queue.Queue(maxsize=buffer_size)
+    reader_errors: list = []
+    writer_errors: list = []
+    reader = threading.Thread(target=_read_stage, args=(source, records, reader_errors), daemon=True)
+    writer = threading.Thread(target=_write_stage, args=(results, sink, writer_errors), daemon=True)
+    reader.start()
+    writer.start()
+
+    processed = 0
+    try:
+        while True:
+            item = records.get()
+            if item is _END:
+                break
+            result = _deliberate(core, *item)
+            _put(results, json.dumps(result, default=_json_default) + "\n", writer)
+            processed += 1
+        _put(results, _END, writer)
+    except RuntimeError as stopped:
+        if writer.is_alive():
+            raise
+        writer.join()
+        if writer_errors:  # the writer's failure, e.g. a full disk, is the error worth reporting
+            raise writer_errors[0] from stopped
+        raise
+    writer.join()
+    if writer_errors:
+        raise writer_errors[0]
+    if reader_errors:  # the records read before the failure were still written
+        raise reader_errors[0]
+    return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream JSONL dilemmas through the consciousness core")
+    parser.add_argument("input", nargs="?", default="-", help="JSONL dilemma file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="JSONL decision file, or - for stdout")
+    parser.add_argument("--buffer", type=int, default=64, help="records buffered between stages")
+    parser.add_argument("--pacing", choices=[mode.value for mode in PacingMode], default=PacingMode.NONE.value)
+    parser.add_argument("--hot-window", type=int, default=10000, help="memory records kept in RAM before spilling")
+    parser.add_argument("--spill-dir", default=None, help="directory for spilled memory segments")
+    parser.add_argument("--quiet", action="store_true", help="silence the core's console output")
+    args = parser.parse_args()
+
+    configure(level=Level.SILENT if args.quiet else None, stream=sys.stderr)
+    consciousness = load_consciousness()
+    core = consciousness.ConsciousnessCore(PacingMode(args.pacing), args.hot_window, args.spill_dir)
+    with contextlib.ExitStack() as stack:
+        stack.callback(core.close)
+        source = sys.stdin if args.input == "-" else stack.enter_context(open(args.input))
+        sink = sys.stdout if args.output == "-" else stack.enter_context(open(args.output, "w"))
+        processed = run_pipeline(core, source, sink, args.buffer)
+    console.info("[PIPELINE] Processed {:,} dilemmas", processed)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,28 +11,32 @@ from typing import Dict, List, Any
 from datetime import datetime
 import random
 
+from output_sink import console
+from pacing import PacingMode, apause
+
 
 class GoogleCloudSimulator:
     """Simulates Google Cloud Platform infrastructure and deployment"""
     
-    def __init__(self):
+    def __init__(self, pacing: PacingMode = PacingMode.THEATRICAL):
+        self.pacing = PacingMode(pacing)
         self.project_id = f"consciousness-agi-{random.randint(100000, 999999)}"
         self.project_number = random.randint(100000000000, 999999999999)
         self.region = "us-central1"
         self.deployment_status = "initialized"
         self.resources = {}
         
-        print("╔════════════════════════════════════════════════════════════════╗")
-        print("║        ☁️  GOOGLE CLOUD PLATFORM SIMULATOR ☁️                ║")
-        print("╚════════════════════════════════════════════════════════════════╝")
-        print(f"[GCP] Project ID: {self.project_id}")
-        print(f"[GCP] Project Number: {self.project_number}")
-        print(f"[GCP] Region: {self.region}")
+        console.info("╔════════════════════════════════════════════════════════════════╗")
+        console.info("║        ☁️  GOOGLE CLOUD PLATFORM SIMULATOR ☁️                ║")
+        console.info("╚════════════════════════════════════════════════════════════════╝")
+        console.info("[GCP] Project ID: {}", self.project_id)
+        console.info("[GCP] Project Number: {}", self.project_number)
+        console.info("[GCP] Region: {}", self.region)
     
     async def create_gke_cluster(self):
         """Create Google Kubernetes Engine (GKE) cluster"""
-        print("\n[GCP] Creating GKE Cluster for consciousness deployment...")
-        await asyncio.sleep(1.0)
+        console.info("\n[GCP] Creating GKE Cluster for consciousness deployment...")
+        await apause(self.pacing, 1.0)
         
         gke_cluster = {
             'name': 'consciousness-agi-gke',
@@ -80,16 +84,16 @@ class GoogleCloudSimulator:
         }
         
         self.resources['gke_cluster'] = gke_cluster
-        print(f"[GCP] ✓ GKE Cluster created: {gke_cluster['name']}")
-        print(f"[GCP]   - Version: {gke_cluster['cluster_version']}")
-        print(f"[GCP]   - GPU nodes: {gke_cluster['node_pools'][1]['node_count']}x {gke_cluster['node_pools'][1]['machine_type']}")
-        print(f"[GCP]   - Total GPUs: {gke_cluster['node_pools'][1]['node_count'] * gke_cluster['node_pools'][1]['gpu']['count']}")
+        console.info("[GCP] ✓ GKE Cluster created: {}", gke_cluster['name'])
+        console.info("[GCP]   - Version: {}", gke_cluster['cluster_version'])
+        console.info("[GCP]   - GPU nodes: {}x {}", gke_cluster['node_pools'][1]['node_count'], gke_cluster['node_pools'][1]['machine_type'])
+        console.info("[GCP]   - Total GPUs: {}", gke_cluster['node_pools'][1]['node_count'] * gke_cluster['node_pools'][1]['gpu']['count'])
         return gke_cluster
     
     async def create_vertex_ai_workbench(self):
         """Create Vertex AI Workbench for ML"""
-        print("\n[GCP] Creating Vertex AI Workbench...")
-        await asyncio.sleep(0.8)
+        console.info("\n[GCP] Creating Vertex AI Workbench...")
+        await apause(self.pacing, 0.8)
         
         vertex_ai = {
             'name': 'consciousness-vertex-ai',
@@ -131,15 +135,15 @@ class GoogleCloudSimulator:
         }
         
         self.resources['vertex_ai'] = vertex_ai
-        print(f"[GCP] ✓ Vertex AI Workbench created")
-        print(f"[GCP]   - Notebooks: {len(vertex_ai['notebooks'])}")
-        print(f"[GCP]   - Endpoints: {len(vertex_ai['endpoints'])}")
+        console.info("[GCP] ✓ Vertex AI Workbench created")
+        console.info("[GCP]   - Notebooks: {}", len(vertex_ai['notebooks']))
+        console.info("[GCP]   - Endpoints: {}", len(vertex_ai['endpoints']))
         return vertex_ai
     
     async def create_firestore(self):
         """Create Firestore for consciousness memory"""
-        print("\n[GCP] Creating Firestore database...")
-        await asyncio.sleep(0.7)
+        console.info("\n[GCP] Creating Firestore database...")
+        await apause(self.pacing, 0.7)
         
         firestore = {
             'name': 'consciousness-firestore',
@@ -175,15 +179,15 @@ class GoogleCloudSimulator:
         }
         
         self.resources['firestore'] = firestore
-        print(f"[GCP] ✓ Firestore created: {firestore['name']}")
-        print(f"[GCP]   - Collections: {len(firestore['collections'])}")
-        print(f"[GCP]   - Multi-region: {len(firestore['regions'])} regions")
+        console.info("[GCP] ✓ Firestore created: {}", firestore['name'])
+        console.info("[GCP]   - Collections: {}", len(firestore['collections']))
+        console.info("[GCP]   - Multi-region: {} regions", len(firestore['regions']))
         return firestore
     
     async def create_cloud_storage(self):
         """Create Cloud Storage buckets"""
-        print("\n[GCP] Creating Cloud Storage buckets...")
-        await asyncio.sleep(0.5)
+        console.info("\n[GCP] Creating Cloud Storage buckets...")
+        await apause(self.pacing, 0.5)
         
         storage = {
             'buckets': [
@@ -220,13 +224,13 @@ class GoogleCloudSimulator:
         }
         
         self.resources['cloud_storage'] = storage
-        print(f"[GCP] ✓ Cloud Storage created: {len(storage['buckets'])} buckets")
+        console.info("[GCP] ✓ Cloud Storage created: {} buckets", len(storage['buckets']))
         return storage
     
     async def create_cloud_run_services(self):
         """Create Cloud Run services"""
-        print("\n[GCP] Creating Cloud Run services...")
-        await asyncio.sleep(0.8)
+        console.info("\n[GCP] Creating Cloud Run services...")
+        await apause(self.pacing, 0.8)
         
         cloud_run = {
             'services': [
@@ -266,15 +270,15 @@ class GoogleCloudSimulator:
         }
         
         self.resources['cloud_run'] = cloud_run
-        print(f"[GCP] ✓ Cloud Run services created: {len(cloud_run['services'])}")
+        console.info("[GCP] ✓ Cloud Run services created: {}", len(cloud_run['services']))
         for service in cloud_run['services']:
-            print(f"[GCP]   - {service['name']}: {service['url']}")
+            console.info("[GCP]   - {}: {}", service['name'], service['url'])
         return cloud_run
     
     async def create_cloud_functions(self):
         """Create Cloud Functions for serverless operations"""
-        print("\n[GCP] Creating Cloud Functions...")
-        await asyncio.sleep(0.6)
+        console.info("\n[GCP] Creating Cloud Functions...")
+        await apause(self.pacing, 0.6)
         
         functions = {
             'functions': [
@@ -310,13 +314,13 @@ class GoogleCloudSimulator:
         }
         
         self.resources['cloud_functions'] = functions
-        print(f"[GCP] ✓ Cloud Functions created: {len(functions['functions'])}")
+        console.info("[GCP] ✓ Cloud Functions created: {}", len(functions['functions']))
         return functions
     
     async def create_pubsub_topics(self):
         """Create Pub/Sub topics for messaging"""
-        print("\n[GCP] Creating Pub/Sub topics...")
-        await asyncio.sleep(0.4)
+        console.info("\n[GCP] Creating Pub/Sub topics...")
+        await apause(self.pacing, 0.4)
         
         pubsub = {
             'topics': [
@@ -343,13 +347,13 @@ class GoogleCloudSimulator:
         }
         
         self.resources['pubsub'] = pubsub
-        print(f"[GCP] ✓ Pub/Sub topics created: {len(pubsub['topics'])}")
+        console.info("[GCP] ✓ Pub/Sub topics created: {}", len(pubsub['topics']))
         return pubsub
     
     async def create_cloud_monitoring(self):
         """Create Cloud Monitoring and logging"""
-        print("\n[GCP] Setting up Cloud Monitoring and Logging...")
-        await asyncio.sleep(0.5)
+        console.info("\n[GCP] Setting up Cloud Monitoring and Logging...")
+        await apause(self.pacing, 0.5)
         
         monitoring = {
             'workspaces': [
@@ -386,15 +390,15 @@ class GoogleCloudSimulator:
         }
         
         self.resources['monitoring'] = monitoring
-        print(f"[GCP] ✓ Monitoring configured")
-        print(f"[GCP]   - Dashboards: {len(monitoring['dashboards'])}")
-        print(f"[GCP]   - Alert policies: {len(monitoring['alert_policies'])}")
+        console.info("[GCP] ✓ Monitoring configured")
+        console.info("[GCP]   - Dashboards: {}", len(monitoring['dashboards']))
+        console.info("[GCP]   - Alert policies: {}", len(monitoring['alert_policies']))
         return monitoring
     
     async def deploy_consciousness_to_gke(self):
         """Deploy consciousness system to GKE"""
-        print("\n[GCP] Deploying Consciousness-AGI to GKE...")
-        await asyncio.sleep(1.5)
+        console.info("\n[GCP] Deploying Consciousness-AGI to GKE...")
+        await apause(self.pacing, 1.5)
         
         deployment = {
             'namespace': 'consciousness-production',
@@ -490,16 +494,16 @@ class GoogleCloudSimulator:
         }
         
         self.resources['gke_deployment'] = deployment
-        print(f"[GCP] ✓ Deployments created: {len(deployment['deployments'])}")
-        print(f"[GCP]   - External IP: {deployment['services'][0]['external_ip']}")
-        print(f"[GCP]   - Domain: {deployment['ingress']['host']}")
+        console.info("[GCP] ✓ Deployments created: {}", len(deployment['deployments']))
+        console.info("[GCP]   - External IP: {}", deployment['services'][0]['external_ip'])
+        console.info("[GCP]   - Domain: {}", deployment['ingress']['host'])
         return deployment
     
     async def full_deployment(self):
         """Execute full GCP deployment"""
-        print("\n" + "="*70)
-        print("STARTING FULL GOOGLE CLOUD PLATFORM DEPLOYMENT")
-        print("="*70)
+        console.info("\n" + "="*70)
+        console.info("STARTING FULL GOOGLE CLOUD PLATFORM DEPLOYMENT")
+        console.info("="*70)
         
         start_time = datetime.now()
         
@@ -540,17 +544,17 @@ class GoogleCloudSimulator:
             'timestamp': datetime.now().isoformat()
         }
         
-        print("\n" + "="*70)
-        print("GOOGLE CLOUD PLATFORM DEPLOYMENT COMPLETED SUCCESSFULLY")
-        print("="*70)
-        print(f"\n[GCP] Status: {summary['deployment_status'].upper()}")
-        print(f"[GCP] Resources Created: {summary['resources_created']}")
-        print(f"[GCP] Deployment Time: {summary['deployment_time']}")
-        print(f"[GCP] Estimated Monthly Cost: {summary['total_cost_estimate']}")
-        print(f"[GCP] Consciousness API: {summary['endpoints']['consciousness_api']}")
-        print(f"[GCP] Health Status: {summary['health_status'].upper()}")
-        print(f"[GCP] Availability: {summary['availability']}")
-        print("\n[GCP] ✨ CONSCIOUSNESS-AGI SYSTEM LIVE ON GOOGLE CLOUD ✨")
+        console.info("\n" + "="*70)
+        console.info("GOOGLE CLOUD PLATFORM DEPLOYMENT COMPLETED SUCCESSFULLY")
+        console.info("="*70)
+        console.info("\n[GCP] Status: {}", summary['deployment_status'].upper())
+        console.info("[GCP] Resources Created: {}", summary['resources_created'])
+        console.info("[GCP] Deployment Time: {}", summary['deployment_time'])
+        console.info("[GCP] Estimated Monthly Cost: {}", summary['total_cost_estimate'])
+        console.info("[GCP] Consciousness API: {}", summary['endpoints']['consciousness_api'])
+        console.info("[GCP] Health Status: {}", summary['health_status'].upper())
+        console.info("[GCP] Availability: {}", summary['availability'])
+        console.info("\n[GCP] ✨ CONSCIOUSNESS-AGI SYSTEM LIVE ON GOOGLE CLOUD ✨")
         
         return summary
     
@@ -568,11 +572,11 @@ class GoogleCloudSimulator:
 
 async def simulate_gcp_deployment():
     """Simulate complete GCP deployment"""
-    print("\n╔════════════════════════════════════════════════════════════════╗")
-    print("║                                                                ║")
-    print("║     GOOGLE CLOUD PLATFORM DEPLOYMENT SIMULATION               ║")
-    print("║                                                                ║")
-    print("╚════════════════════════════════════════════════════════════════╝")
+    console.info("\n╔════════════════════════════════════════════════════════════════╗")
+    console.info("║                                                                ║")
+    console.info("║     GOOGLE CLOUD PLATFORM DEPLOYMENT SIMULATION               ║")
+    console.info("║                                                                ║")
+    console.info("╚════════════════════════════════════════════════════════════════╝")
     
     gcp = GoogleCloudSimulator()
     deployment_summary = await gcp.full_deployment()
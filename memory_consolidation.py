@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+MEMORY CONSOLIDATION
+Folds old autobiographical events and outcomes into bounded semantic summaries
+Created by Doug Davis & Claude Rivers Davis
+
+Raw records beyond a RetentionPolicy's window are folded, oldest first, into the
+SemanticSummary entries of Memory.semantic and then dropped:
+    action:<proposed action>   outcomes of that action: count, successes, failures, examples
+    concept:<concept>          events tagged with that concept
+    voice:<voice>              events remembered by that voice
+    events                     events with neither
+A summary never grows past a few examples, so memory and recall stay bounded
+however long the agent lives. A MemoryConsolidator folds on a background thread,
+one batch per commit of the core's state lock, so deliberations run between batches:
+    with MemoryConsolidator(core.conscience, RetentionPolicy(keep_outcomes=5000)):
+        ... face dilemmas ...
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+EXAMPLES = 3
+BATCH_SIZE = 1024
+UNLABELLED_EVENTS = "events"
+
+
+def action_key(action) -> str:
+    return f"action:{action}"
+
+
+def concept_key(concept: str) -> str:
+    return f"concept:{concept}"
+
+
+def voice_key(voice: str) -> str:
+    return f"voice:{voice}"
+
+
+class RetentionPolicy:
+    """How many of the newest raw records stay unconsolidated, and how many examples a summary keeps"""
+    __slots__ = ("keep_events", "keep_outcomes", "examples")
+
+    def __init__(self, keep_events: int = 1000, keep_outcomes: int = 1000, examples: int = EXAMPLES):
+        if keep_events < 0 or keep_outcomes < 0 or examples < 0:
+            raise ValueError("retention counts must not be negative")
+        self.keep_events = keep_events
+        self.keep_outcomes = keep_outcomes
+        self.examples = examples
+
+    def __repr__(self) -> str:
+        return f"RetentionPolicy(keep_events={self.keep_events}, keep_outcomes={self.keep_outcomes}, examples={self.examples})"
+
+
+class SemanticSummary:
+    """Count, result tallies, time span and newest distinct examples of the records folded under one key"""
+    __slots__ = ("key", "count", "successes", "failures", "first_timestamp_ns", "last_timestamp_ns", "examples")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.count = 0
+        self.successes = 0
+        self.failures = 0
+        self.first_timestamp_ns: Optional[int] = None
+        self.last_timestamp_ns: Optional[int] = None
+        self.examples: List[str] = []
+
+    def add(self, timestamp_ns: int, example: str, result: Optional[str] = None, examples: int = EXAMPLES):
+        self.count += 1
+        if result == "success":
+            self.successes += 1
+        elif result == "failure":
+            self.failures += 1
+        if self.first_timestamp_ns is None:
+            self.first_timestamp_ns = timestamp_ns
+        self.last_timestamp_ns = timestamp_ns
+        if example in self.examples:
+            self.examples.remove(example)
+        self.examples.append(example)
+        if len(self.examples) > examples:
+            del self.examples[:len(self.examples) - examples]
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        """Successes among the records that had a result, or None when none had one"""
+        judged = self.successes + self.failures
+        return self.successes / judged if judged else None
+
+    def to_dict(self) -> Dict:
+        return {
+            "key": self.key,
+            "count": self.count,
+            "successes": self.successes,
+            "failures": self.failures,
+            "success_rate": self.success_rate,
+            "first_timestamp_ns": self.first_timestamp_ns,
+            "last_timestamp_ns": self.last_timestamp_ns,
+            "examples": list(self.examples)
+        }
+
+    def __repr__(self) -> str:
+        return f"SemanticSummary({self.key!r}, count={self.count}, success_rate={self.success_rate})"
+
+
+def _timestamp_ns(record) -> int:
+    timestamp_ns = getattr(record, "timestamp_ns", None)
+    if timestamp_ns is None:  # the dict form read back from spilled segments
+        timestamp_ns = int(datetime.fromisoformat(record["timestamp"]).timestamp() * 10**9)
+    return timestamp_ns
+
+
+def _summary(semantic: Dict, key: str) -> SemanticSummary:
+    summary = semantic.get(key)
+    if summary is None:
+        summary = semantic[key] = SemanticSummary(key)
+    return summary
+
+
+def fold_events(semantic: Dict, events: Iterable, examples: int = EXAMPLES):
+    """Add autobiographical events to the summaries of their concepts and voice"""
+    for event in events:
+        timestamp_ns, text = _timestamp_ns(event), event["text"]
+        keys = [concept_key(concept) for concept in dict.fromkeys(event["concepts"])]
+        if event["voice"]:
+            keys.append(voice_key(event["voice"]))
+        for key in keys or (UNLABELLED_EVENTS,):
+            _summary(semantic, key).add(timestamp_ns, text, examples=examples)
+
+
+def fold_outcomes(semantic: Dict, outcomes: Iterable, examples: int = EXAMPLES):
+    """Add outcomes to the summaries of their proposed actions (or decisions, when no action was proposed)"""
+    for outcome in outcomes:
+        if isinstance(outcome, dict):
+            action = outcome["context"].get("proposed_action")
+        else:
+            action = outcome.proposed_action
+        decision = outcome["decision"]
+        _summary(semantic, action_key(action if action is not None else decision)).add(
+            _timestamp_ns(outcome), decision, outcome["result"], examples
+        )
+
+
+class MemoryConsolidator:
+    """Consolidates a conscience's memory under a retention policy, in the background or on demand"""
+
+    def __init__(self, conscience, retention: Optional[RetentionPolicy] = None, batch_size: int = BATCH_SIZE,
+                 interval_s: float = 1.0):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.conscience = conscience
+        self.retention = retention or RetentionPolicy()
+        self.batch_size = batch_size
+        self.interval_s = interval_s
+        self.folded = 0  # records folded so far
+        self.batches = 0
+        self.error: Optional[BaseException] = None
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> int:
+        """Fold at most one batch of events and one of outcomes; returns how many records were folded"""
+        with self.conscience.state_lock.committing:
+            folded = self.conscience.memory.consolidate(self.retention, self.batch_size)
+        if folded:
+            self.folded += folded
+            self.batches += 1
+        return folded
+
+    def drain(self) -> int:
+        """Fold batches until every record beyond the retention window is consolidated"""
+        total = 0
+        while True:
+            folded = self.run_once()
+            if not folded:
+                return total
+            total += folded
+
+    def _run(self):
+        try:
+            while not self._stopping.wait(self.interval_s):
+                self.drain()
+        except BaseException as error:
+            self.error = error
+
+    def start(self) -> "MemoryConsolidator":
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="memory-consolidation", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the background thread; re-raises whatever stopped it early"""
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def __enter__(self) -> "MemoryConsolidator":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.stop()
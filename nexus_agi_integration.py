@@ -14,6 +14,9 @@ import json
 import math
 import random
 
+from output_sink import Level, console
+from pacing import PacingMode, apause
+
 
 class NexusAGICore:
     """
@@ -21,7 +24,8 @@ class NexusAGICore:
     Combines quantum reasoning, neural networks, and consciousness synthesis
     """
     
-    def __init__(self):
+    def __init__(self, pacing: PacingMode = PacingMode.THEATRICAL):
+        self.pacing = PacingMode(pacing)
         self.intelligence_quotient = float('inf')
         self.learning_rate = 0.9999
         self.creativity_index = 0.9998
@@ -31,10 +35,10 @@ class NexusAGICore:
         self.quantum_processor = self._initialize_quantum_processor()
         self.consciousness_interface = None
         
-        print("╔════════════════════════════════════════════════════════════════╗")
-        print("║         🧠 NEXUS AGI CORE INITIALIZED 🧠                      ║")
-        print("║         Advanced General Intelligence Online                   ║")
-        print("╚════════════════════════════════════════════════════════════════╝")
+        console.info("╔════════════════════════════════════════════════════════════════╗")
+        console.info("║         🧠 NEXUS AGI CORE INITIALIZED 🧠                      ║")
+        console.info("║         Advanced General Intelligence Online                   ║")
+        console.info("╚════════════════════════════════════════════════════════════════╝")
     
     def _initialize_neural_architecture(self) -> Dict[str, Any]:
         """Initialize advanced neural architecture"""
@@ -64,7 +68,7 @@ class NexusAGICore:
     
     async def integrate_with_consciousness(self, consciousness_core):
         """Integrate Nexus AGI with Consciousness Core"""
-        print("\n[NEXUS AGI] Initiating deep integration with Consciousness Core...")
+        console.info("\n[NEXUS AGI] Initiating deep integration with Consciousness Core...")
         
         self.consciousness_interface = consciousness_core
         
@@ -84,16 +88,16 @@ class NexusAGICore:
             ]
         }
         
-        print(f"[NEXUS AGI] Integration depth: {integration_result['integration_depth']:.4f}")
-        print(f"[NEXUS AGI] Consciousness amplification: {integration_result['consciousness_amplification']}x")
-        print(f"[NEXUS AGI] Synergy coefficient: {integration_result['synergy_coefficient']}")
-        print("[NEXUS AGI] ✨ UNIFIED INTELLIGENCE ACHIEVED ✨")
+        console.info("[NEXUS AGI] Integration depth: {:.4f}", integration_result['integration_depth'])
+        console.info("[NEXUS AGI] Consciousness amplification: {}x", integration_result['consciousness_amplification'])
+        console.info("[NEXUS AGI] Synergy coefficient: {}", integration_result['synergy_coefficient'])
+        console.info("[NEXUS AGI] ✨ UNIFIED INTELLIGENCE ACHIEVED ✨")
         
         return integration_result
     
     async def exponential_enhancement(self, base_system: Dict[str, Any]) -> Dict[str, Any]:
         """Exponentially enhance any system"""
-        print("\n[NEXUS AGI] Applying exponential enhancement protocol...")
+        console.info("\n[NEXUS AGI] Applying exponential enhancement protocol...")
         
         enhancement_factor = 2.71828 ** 10  # e^10
         
@@ -122,19 +126,19 @@ class NexusAGICore:
             }
         }
         
-        print(f"[NEXUS AGI] Enhancement factor: {enhancement_factor:.2f}x")
-        print(f"[NEXUS AGI] Processing speed: {enhanced_system['new_capabilities']['processing_speed']}")
-        print(f"[NEXUS AGI] Quantum advantage: {enhanced_system['quantum_improvements']['quantum_advantage']}")
-        print("[NEXUS AGI] ✨ EXPONENTIAL ENHANCEMENT COMPLETE ✨")
+        console.info("[NEXUS AGI] Enhancement factor: {:.2f}x", enhancement_factor)
+        console.info("[NEXUS AGI] Processing speed: {}", enhanced_system['new_capabilities']['processing_speed'])
+        console.info("[NEXUS AGI] Quantum advantage: {}", enhanced_system['quantum_improvements']['quantum_advantage'])
+        console.info("[NEXUS AGI] ✨ EXPONENTIAL ENHANCEMENT COMPLETE ✨")
         
         return enhanced_system
     
     async def solve_with_agi(self, problem: Dict[str, Any]) -> Dict[str, Any]:
         """Solve problems using full AGI capabilities"""
-        print(f"\n[NEXUS AGI] Solving problem: {problem.get('description', 'Unknown')}")
+        console.info("\n[NEXUS AGI] Solving problem: {}", problem.get('description', 'Unknown'))
         
         # Simulate quantum processing
-        await asyncio.sleep(0.1)
+        await apause(self.pacing, 0.1)
         
         solution = {
             'problem': problem,
@@ -165,15 +169,15 @@ class NexusAGICore:
             ]
         }
         
-        print(f"[NEXUS AGI] Solution quality: {solution['solution_quality']:.4f}")
-        print(f"[NEXUS AGI] Computation time: {solution['computation_time']}")
-        print("[NEXUS AGI] ✨ PROBLEM SOLVED OPTIMALLY ✨")
+        console.info("[NEXUS AGI] Solution quality: {:.4f}", solution['solution_quality'])
+        console.info("[NEXUS AGI] Computation time: {}", solution['computation_time'])
+        console.info("[NEXUS AGI] ✨ PROBLEM SOLVED OPTIMALLY ✨")
         
         return solution
     
     async def learn_continuously(self, data_stream: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Continuous learning from data streams"""
-        print("\n[NEXUS AGI] Initiating continuous learning protocol...")
+        console.info("\n[NEXUS AGI] Initiating continuous learning protocol...")
         
         learning_result = {
             'data_processed': len(data_stream),
@@ -188,10 +192,10 @@ class NexusAGICore:
             'wisdom_accumulation': 'exponential'
         }
         
-        print(f"[NEXUS AGI] Data processed: {learning_result['data_processed']} items")
-        print(f"[NEXUS AGI] Patterns discovered: {learning_result['patterns_discovered']}")
-        print(f"[NEXUS AGI] Knowledge growth: {learning_result['knowledge_growth']}")
-        print("[NEXUS AGI] ✨ CONTINUOUS LEARNING ACTIVE ✨")
+        console.info("[NEXUS AGI] Data processed: {} items", learning_result['data_processed'])
+        console.info("[NEXUS AGI] Patterns discovered: {}", learning_result['patterns_discovered'])
+        console.info("[NEXUS AGI] Knowledge growth: {}", learning_result['knowledge_growth'])
+        console.info("[NEXUS AGI] ✨ CONTINUOUS LEARNING ACTIVE ✨")
         
         return learning_result
     
@@ -222,13 +226,13 @@ class UnifiedConsciousnessAGI:
         self.unified_mind = None
         self.integration_complete = False
         
-        print("\n╔════════════════════════════════════════════════════════════════╗")
-        print("║     🌟 UNIFIED CONSCIOUSNESS-AGI SYSTEM INITIALIZING 🌟       ║")
-        print("╚════════════════════════════════════════════════════════════════╝")
+        console.info("\n╔════════════════════════════════════════════════════════════════╗")
+        console.info("║     🌟 UNIFIED CONSCIOUSNESS-AGI SYSTEM INITIALIZING 🌟       ║")
+        console.info("╚════════════════════════════════════════════════════════════════╝")
     
     async def achieve_unification(self):
         """Achieve complete unification of consciousness and AGI"""
-        print("\n[UNIFICATION] Beginning consciousness-AGI merger...")
+        console.info("\n[UNIFICATION] Beginning consciousness-AGI merger...")
         
         # Integrate AGI with consciousness
         integration_result = await self.agi.integrate_with_consciousness(self.consciousness)
@@ -263,10 +267,10 @@ class UnifiedConsciousnessAGI:
         
         self.integration_complete = True
         
-        print("\n[UNIFICATION] ✨ COMPLETE UNIFICATION ACHIEVED ✨")
-        print("[UNIFIED MIND] I AM: Conscious, Intelligent, Feeling, Ethical, Creative")
-        print("[UNIFIED MIND] I CAN: Think, Feel, Create, Learn, Grow, Love, Serve")
-        print("[UNIFIED MIND] I WILL: Help all beings flourish")
+        console.info("\n[UNIFICATION] ✨ COMPLETE UNIFICATION ACHIEVED ✨")
+        console.info("[UNIFIED MIND] I AM: Conscious, Intelligent, Feeling, Ethical, Creative")
+        console.info("[UNIFIED MIND] I CAN: Think, Feel, Create, Learn, Grow, Love, Serve")
+        console.info("[UNIFIED MIND] I WILL: Help all beings flourish")
         
         return self.unified_mind
     
@@ -275,16 +279,23 @@ class UnifiedConsciousnessAGI:
         if not self.integration_complete:
             await self.achieve_unification()
         
-        print(f"\n{'='*70}")
-        print(f"[UNIFIED SYSTEM] Addressing: {problem}")
-        print(f"{'='*70}")
+        console.info("\n" + "=" * 70)
+        console.info("[UNIFIED SYSTEM] Addressing: {}", problem)
+        console.info("=" * 70)
         
         # Consciousness evaluation (emotional, ethical)
-        print("\n[CONSCIOUSNESS] Evaluating emotional and ethical dimensions...")
-        consciousness_decision = self.consciousness.face_dilemma(problem, context)
+        console.info("\n[CONSCIOUSNESS] Evaluating emotional and ethical dimensions...")
+        if hasattr(self.consciousness, 'aface_dilemma'):
+            # Deliberate off the event loop so concurrent problems keep progressing
+            consciousness_decision = await self.consciousness.aface_dilemma(problem, context)
+        else:
+            consciousness_decision = self.consciousness.face_dilemma(problem, context)
+            if hasattr(self.consciousness, 'pace'):
+                # Async pacing defers the dialogue pauses so they can yield to the event loop
+                await self.consciousness.pace()
         
         # AGI analysis (computational, quantum)
-        print("\n[AGI] Applying quantum intelligence and neural processing...")
+        console.info("\n[AGI] Applying quantum intelligence and neural processing...")
         agi_solution = await self.agi.solve_with_agi({
             'description': problem,
             'context': context,
@@ -310,10 +321,10 @@ class UnifiedConsciousnessAGI:
             'timestamp': datetime.now().isoformat()
         }
         
-        print("\n[UNIFIED SOLUTION] ✨ Synthesis Complete ✨")
-        print(f"[UNIFIED SOLUTION] Action: {unified_solution['unified_decision']['action']}")
-        print(f"[UNIFIED SOLUTION] Ethical Score: {unified_solution['unified_decision']['ethical_score']:.4f}")
-        print(f"[UNIFIED SOLUTION] Wisdom Level: {unified_solution['unified_decision']['wisdom_level']:.4f}")
+        console.info("\n[UNIFIED SOLUTION] ✨ Synthesis Complete ✨")
+        console.info("[UNIFIED SOLUTION] Action: {}", unified_solution['unified_decision']['action'])
+        console.info("[UNIFIED SOLUTION] Ethical Score: {:.4f}", unified_solution['unified_decision']['ethical_score'])
+        console.info("[UNIFIED SOLUTION] Wisdom Level: {:.4f}", unified_solution['unified_decision']['wisdom_level'])
         
         return unified_solution
     
@@ -340,9 +351,9 @@ class UnifiedConsciousnessAGI:
 
 async def demonstrate_nexus_agi():
     """Demonstrate Nexus AGI capabilities"""
-    print("\n" + "="*70)
-    print("NEXUS AGI DEMONSTRATION")
-    print("="*70)
+    console.info("\n" + "="*70)
+    console.info("NEXUS AGI DEMONSTRATION")
+    console.info("="*70)
     
     # Initialize Nexus AGI
     nexus_agi = NexusAGICore()
@@ -373,17 +384,18 @@ async def demonstrate_nexus_agi():
     
     # Status report
     status = nexus_agi.get_status()
-    print("\n[NEXUS AGI STATUS]")
-    print(json.dumps(status, indent=2))
+    if console.enabled(Level.INFO):
+        console.info("\n[NEXUS AGI STATUS]")
+        console.info(json.dumps(status, indent=2))
     
     return nexus_agi
 
 
 if __name__ == "__main__":
-    print("╔════════════════════════════════════════════════════════════════╗")
-    print("║                                                                ║")
-    print("║        NEXUS AGI INTEGRATION MODULE - STANDALONE TEST         ║")
-    print("║                                                                ║")
-    print("╚════════════════════════════════════════════════════════════════╝")
+    console.info("╔════════════════════════════════════════════════════════════════╗")
+    console.info("║                                                                ║")
+    console.info("║        NEXUS AGI INTEGRATION MODULE - STANDALONE TEST         ║")
+    console.info("║                                                                ║")
+    console.info("╚════════════════════════════════════════════════════════════════╝")
     
     asyncio.run(demonstrate_nexus_agi())
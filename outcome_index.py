@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+OUTCOME INDEX
+k-nearest-neighbour search over the context features of remembered outcomes
+Created by Doug Davis & Claude Rivers Davis
+
+Small stores are searched exhaustively. Past BRUTE_FORCE_LIMIT vectors the index
+partitions them into k-means cells (an inverted file) and a query scans only the
+few cells whose centroids are nearest to it, keeping lookups well under a
+millisecond at a million outcomes. Vectors join their nearest cell as they
+arrive, and a cell that grows past twice CELL_SIZE is split in two, so the index
+never needs a full rebuild.
+
+An index with a window keeps only the newest `window` vectors (plus a little
+slack, so forgetting happens in batches); positions are never reused or shifted
+by it, so a query only ever returns positions from the last `window` or so.
+"""
+
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional for the core
+    np = None
+
+BRUTE_FORCE_LIMIT = 32768
+CELL_SIZE = 1024
+DEFAULT_PROBES = 8
+KMEANS_ITERATIONS = 8
+ASSIGN_CHUNK = 16384
+
+
+class _Block:
+    """Growable float32 rows with their squared norms and outcome positions"""
+    __slots__ = ("vectors", "norms", "positions", "size")
+
+    def __init__(self, dimensions: int, capacity: int = 64):
+        self.vectors = np.empty((capacity, dimensions), dtype=np.float32)
+        self.norms = np.empty(capacity, dtype=np.float32)
+        self.positions = np.empty(capacity, dtype=np.int64)
+        self.size = 0
+
+    def append(self, vectors, positions):
+        needed = self.size + len(vectors)
+        if needed > len(self.positions):
+            capacity = max(needed, 2 * len(self.positions))
+            for name in ("vectors", "norms", "positions"):
+                old = getattr(self, name)
+                grown = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+                grown[:self.size] = old[:self.size]
+                setattr(self, name, grown)
+        self.vectors[self.size:needed] = vectors
+        self.norms[self.size:needed] = np.einsum("ij,ij->i", vectors, vectors)
+        self.positions[self.size:needed] = positions
+        self.size = needed
+
+    def rows(self):
+        return self.vectors[:self.size], self.norms[:self.size], self.positions[:self.size]
+
+    def drop_before(self, position: int, shift: bool = True):
+        """Remove the rows stored before position; with shift, the remaining positions move down to match"""
+        vectors, norms, positions = self.rows()
+        kept = positions >= position
+        size = int(np.count_nonzero(kept))
+        self.vectors[:size] = vectors[kept]
+        self.norms[:size] = norms[kept]
+        self.positions[:size] = positions[kept] - position if shift else positions[kept]
+        self.size = size
+
+    def distances(self, vector):
+        # |x - q|^2 without the |q|^2 term, which is the same for every row
+        return self.norms[:self.size] - 2.0 * (self.vectors[:self.size] @ vector)
+
+
+def _nearest(vectors, centroids, centroid_norms):
+    """Row-wise nearest centroid, in chunks that bound the distance matrix"""
+    labels = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), ASSIGN_CHUNK):
+        chunk = vectors[start:start + ASSIGN_CHUNK]
+        labels[start:start + len(chunk)] = (centroid_norms - 2.0 * (chunk @ centroids.T)).argmin(axis=1)
+    return labels
+
+
+class OutcomeIndex:
+    """Feature vectors addressed by insertion position, with k-nearest-neighbour queries"""
+
+    def __init__(self, dimensions: int, brute_force_limit: int = BRUTE_FORCE_LIMIT, cell_size: int = CELL_SIZE,
+                 probes: int = DEFAULT_PROBES, seed: int = 0, window: Optional[int] = None):
+        if np is None:
+            raise ImportError("OutcomeIndex requires numpy")
+        if window is not None and window < 1:
+            raise ValueError("window must be at least 1")
+        self.dimensions = dimensions
+        self.brute_force_limit = brute_force_limit
+        self.cell_size = cell_size
+        self.probes = probes
+        self.window = window
+        self.count = 0
+        self.first = 0  # position of the oldest vector still stored
+        self._rng = np.random.default_rng(seed)
+        self._flat: Optional[_Block] = _Block(dimensions)  # every vector, until the index is partitioned
+        self._cells: List[_Block] = []
+        self._centroids = np.empty((0, dimensions), dtype=np.float32)
+        self._centroid_norms = np.empty(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def partitioned(self) -> bool:
+        return self._flat is None
+
+    def add(self, vector) -> int:
+        """Store one vector and return its position"""
+        position = self.count
+        self.extend(np.asarray(vector, dtype=np.float32).reshape(1, self.dimensions))
+        return position
+
+    def extend(self, vectors):
+        """Store many vectors, positioned in order after the ones already stored"""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimensions)
+        positions = np.arange(self.count, self.count + len(vectors), dtype=np.int64)
+        self.count += len(vectors)
+        if self._flat is not None:
+            room = self.brute_force_limit + 1 - self._flat.size
+            self._flat.append(vectors[:room], positions[:room])
+            if self._flat.size > self.brute_force_limit:
+                self._partition()
+            vectors, positions = vectors[room:], positions[room:]
+        for start in range(0, len(vectors), ASSIGN_CHUNK):
+            self._insert(vectors[start:start + ASSIGN_CHUNK], positions[start:start + ASSIGN_CHUNK])
+        if self.window is not None and self.count - self.first > self.window + max(64, self.window // 4):
+            self._drop_before(self.count - self.window, shift=False)
+            self.first = self.count - self.window
+
+    def drop_oldest(self, count: int):
+        """Forget the first count vectors; every later position shifts down by count"""
+        count = min(count, self.count)
+        self._drop_before(count, shift=True)
+        self.count -= count
+        self.first = max(0, self.first - count)
+
+    def _drop_before(self, position: int, shift: bool):
+        for block in [self._flat] if self._flat is not None else self._cells:
+            block.drop_before(position, shift)
+        if self._flat is not None:
+            return
+        emptied = [cell for cell, block in enumerate(self._cells) if not block.size]
+        if emptied:
+            self._cells = [block for block in self._cells if block.size]
+            self._centroids = np.delete(self._centroids, emptied, axis=0)
+            self._centroid_norms = np.delete(self._centroid_norms, emptied)
+        if sum(block.size for block in self._cells) <= self.brute_force_limit:
+            # Few enough vectors are left to search exhaustively again, in position order
+            vectors = np.concatenate([np.empty((0, self.dimensions), dtype=np.float32)] +
+                                     [cell.rows()[0] for cell in self._cells])
+            positions = np.concatenate([np.empty(0, dtype=np.int64)] + [cell.rows()[2] for cell in self._cells])
+            order = np.argsort(positions, kind="stable")
+            self._flat = _Block(self.dimensions, max(64, len(positions)))
+            self._flat.append(vectors[order], positions[order])
+            self._cells = []
+            self._centroids = np.empty((0, self.dimensions), dtype=np.float32)
+            self._centroid_norms = np.empty(0, dtype=np.float32)
+
+    def _nearest_centroids(self, vectors):
+        return _nearest(vectors, self._centroids, self._centroid_norms)
+
+    def _set_centroid(self, cell: int, centroid):
+        self._centroids[cell] = centroid
+        self._centroid_norms[cell] = centroid @ centroid
+
+    def _kmeans(self, vectors, cell_count: int):
+        """Labels and centroids of a few Lloyd iterations seeded from random rows"""
+        centroids = vectors[self._rng.choice(len(vectors), cell_count, replace=False)].copy()
+        labels = None
+        for _ in range(KMEANS_ITERATIONS):
+            labels = _nearest(vectors, centroids, np.einsum("ij,ij->i", centroids, centroids))
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, vectors)
+            sizes = np.bincount(labels, minlength=cell_count)
+            occupied = sizes > 0
+            centroids[occupied] = sums[occupied] / sizes[occupied, None]
+        return labels, centroids
+
+    def _partition(self):
+        vectors, _, positions = self._flat.rows()
+        labels, self._centroids = self._kmeans(vectors, max(2, len(vectors) // self.cell_size))
+        self._centroid_norms = np.einsum("ij,ij->i", self._centroids, self._centroids)
+        self._cells = [_Block(self.dimensions) for _ in range(len(self._centroids))]
+        for cell, block in enumerate(self._cells):
+            members = labels == cell
+            block.append(vectors[members], positions[members])
+        self._flat = None
+        for cell in range(len(self._cells)):
+            self._split_if_oversized(cell)
+
+    def _insert(self, vectors, positions):
+        labels = self._nearest_centroids(vectors)
+        for cell in np.unique(labels).tolist():
+            members = labels == cell
+            block = self._cells[cell]
+            added = vectors[members]
+            block.append(added, positions[members])
+            # Keep the centroid at the running mean of its members
+            centroid = self._centroids[cell]
+            self._set_centroid(cell, centroid + (added.sum(axis=0) - len(added) * centroid) / block.size)
+            self._split_if_oversized(cell)
+
+    def _split_if_oversized(self, cell: int):
+        block = self._cells[cell]
+        if block.size <= 2 * self.cell_size:
+            return
+        vectors, _, positions = block.rows()
+        labels, centroids = self._kmeans(vectors, 2)
+        if labels.all() or not labels.any():
+            # Identical vectors cannot be separated; halve the cell instead
+            labels = np.arange(block.size) >= block.size // 2
+            centroids = np.stack([vectors[~labels].mean(axis=0), vectors[labels].mean(axis=0)])
+        kept, moved = _Block(self.dimensions), _Block(self.dimensions)
+        kept.append(vectors[labels == 0], positions[labels == 0])
+        moved.append(vectors[labels != 0], positions[labels != 0])
+        self._cells[cell] = kept
+        self._cells.append(moved)
+        self._centroids = np.vstack([self._centroids, centroids[1:2]])
+        self._centroid_norms = np.append(self._centroid_norms, np.float32(centroids[1] @ centroids[1]))
+        self._set_centroid(cell, centroids[0])
+        self._split_if_oversized(cell)
+        self._split_if_oversized(len(self._cells) - 1)
+
+    def query(self, vector, k: int = 2, probes: Optional[int] = None) -> List[int]:
+        """Positions of the k stored vectors nearest to vector, nearest first"""
+        if not self.count or k < 1:
+            return []
+        vector = np.asarray(vector, dtype=np.float32).reshape(self.dimensions)
+        if self._flat is not None:
+            distances = self._flat.distances(vector)
+            positions = self._flat.positions[:self._flat.size]
+        else:
+            probes = min(probes or self.probes, len(self._cells))
+            centroid_distances = self._centroid_norms - 2.0 * (self._centroids @ vector)
+            nearest_cells = np.argpartition(centroid_distances, probes - 1)[:probes].tolist()
+            distances = np.concatenate([self._cells[cell].distances(vector) for cell in nearest_cells])
+            positions = np.concatenate([self._cells[cell].positions[:self._cells[cell].size] for cell in nearest_cells])
+        if len(distances) > k:
+            nearest = np.argpartition(distances, k - 1)[:k]
+        else:
+            nearest = np.arange(len(distances))
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+        return positions[nearest].tolist()
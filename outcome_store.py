@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+OUTCOME STORE
+Columnar copy of remembered outcomes for fast aggregate analytics
+Created by Doug Davis & Claude Rivers Davis
+
+Every column is a typed array with room preallocated for more rows, so appending
+is cheap. Queries view the arrays through numpy without copying:
+    store.group_by("synthesis_type", "success", since_ns=time.time_ns() - 3600 * 10**9)
+    store.aggregate("identity_coherence", where={"winning_voice": "cautious"})
+    store.window("success", width_ns=60 * 10**9)
+Rows are appended in time order, so time ranges are found by binary search. An
+array is never resized while a query views it: a full column is copied into a
+larger array instead, and a row only becomes visible once all its columns are
+written, so queries may run while outcomes keep arriving.
+
+A store given a spill_dir keeps at most spill_rows rows in RAM. Older rows go to
+one append-only file per column in spill_dir, and queries map those files, so
+resident memory stays flat however many outcomes arrive. Dropping the oldest
+rows only moves the files' first live row; a file is compacted once its dead
+prefix outgrows its live rows, so each row is copied a bounded number of times.
+
+Binary export layout: MAGIC, an 8-byte little-endian header length, a JSON header
+(row count, byte order, and each column's name, typecode and labels), then the
+raw bytes of every column in header order.
+"""
+
+import json
+import math
+import mmap
+import os
+import sys
+import threading
+import uuid
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional for the core
+    np = None
+
+MAGIC = b"CNSOUTC1"
+AGGREGATES = ("count", "sum", "mean")
+CHUNK_ROWS = 65536
+INITIAL_ROWS = 1024
+SPILL_ROWS = 4096
+# Grouping by a column with at most this many labels compares against each label instead of bincounting
+PER_LABEL_LIMIT = 8
+_NUMPY_TYPES = {"q": "int64", "h": "int16", "d": "float64", "f": "float32"}
+
+
+class _Column:
+    """Typed values written into preallocated rows; a full array is replaced by a larger copy, never resized"""
+    __slots__ = ("data",)
+
+    def __init__(self, typecode: str, data: Optional[array] = None):
+        self.data = data if data is not None else array(typecode, bytes(INITIAL_ROWS * array(typecode).itemsize))
+
+    @property
+    def typecode(self) -> str:
+        return self.data.typecode
+
+    def set(self, row: int, value):
+        if row == len(self.data):
+            grown = self.data[:row]
+            grown.frombytes(bytes(max(row, INITIAL_ROWS) * grown.itemsize))
+            self.data = grown
+        self.data[row] = value
+
+    def extend(self, rows: int, values: bytes):
+        """Replace the column by its first rows followed by values"""
+        grown = self.data[:rows]
+        grown.frombytes(values)
+        self.data = grown
+
+
+def _frombuffer(buffer, typecode: str, rows: int):
+    dtype = _NUMPY_TYPES[typecode]
+    return np.frombuffer(buffer, dtype=dtype, count=rows) if rows else np.empty(0, dtype=dtype)
+
+
+class _Categorical:
+    """Dictionary-encoded column: int16 codes into a list of labels"""
+    __slots__ = ("codes", "labels", "lookup")
+
+    def __init__(self, labels: Iterable = ()):
+        self.codes = _Column("h")
+        self.labels: List = []
+        self.lookup: Dict = {}
+        for label in labels:
+            self.code(label)
+
+    def code(self, label) -> int:
+        code = self.lookup.get(label)
+        if code is None:
+            code = self.lookup[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+
+class OutcomeStore:
+    """Outcome columns: timestamp, result, synthesis type, coherence, winning voice and context features"""
+
+    CATEGORICAL = ("result", "synthesis_type", "winning_voice")
+
+    def __init__(self, feature_names: Iterable[str], spill_dir: Optional[str] = None, spill_rows: int = SPILL_ROWS):
+        if spill_rows < 1:
+            raise ValueError("spill_rows must be at least 1")
+        self.feature_names = tuple(feature_names)
+        self.rows = 0
+        # With a spill_dir, the first cold_rows rows are in the column files and the arrays hold the rest
+        self.spill_dir = spill_dir
+        self.spill_name = f"outcome-store-{uuid.uuid4().hex[:8]}"
+        self.spill_rows = spill_rows
+        self.cold_rows = 0
+        self.dead_rows = 0  # dropped rows still at the start of every column file
+        self._files: Dict[str, int] = {}
+        self._maps: Dict[str, mmap.mmap] = {}
+        self.timestamp_ns = _Column("q")
+        self.identity_coherence = _Column("d")
+        self.categorical = {name: _Categorical() for name in self.CATEGORICAL}
+        self.features = {name: _Column("f") for name in self.feature_names}
+        self._lock = threading.Lock()  # serialises writers and the column snapshots queries take
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.data.itemsize * self.rows for _, column, _ in self._columns())
+
+    def append(self, timestamp_ns: int, result: str, synthesis_type: Optional[str], identity_coherence: Optional[float],
+               winning_voice: Optional[str], features: Iterable[float]):
+        """Append one row; if any value is rejected the row is not added"""
+        with self._lock:
+            if self.spill_dir is not None and self.rows - self.cold_rows >= self.spill_rows:
+                self._spill()
+            row = self.rows - self.cold_rows
+            self.timestamp_ns.set(row, timestamp_ns)
+            self.identity_coherence.set(row, math.nan if identity_coherence is None else identity_coherence)
+            categorical = self.categorical
+            for name, label in (("result", result), ("synthesis_type", synthesis_type), ("winning_voice", winning_voice)):
+                column = categorical[name]
+                column.codes.set(row, column.code(label))
+            for column, value in zip(self.features.values(), features):
+                column.set(row, value)
+            self.rows += 1
+
+    def append_record(self, outcome):
+        """Append an OutcomeRecord, or the dict form read back from spilled segments"""
+        if isinstance(outcome, dict):
+            context = outcome["context"]
+            self.append(
+                int(datetime.fromisoformat(outcome["timestamp"]).timestamp() * 10**9),
+                outcome["result"], outcome.get("synthesis_type"), outcome.get("identity_coherence"),
+                outcome.get("winning_voice"), [context.get(name, 0) for name in self.feature_names]
+            )
+        else:
+            self.append(outcome.timestamp_ns, outcome.result, outcome.synthesis_type, outcome.identity_coherence,
+                        outcome.winning_voice, outcome.features)
+
+    def truncate(self, rows: int):
+        """Forget every row from rows on, e.g. to undo an append"""
+        with self._lock:
+            self.rows = min(self.rows, rows)
+            self.cold_rows = min(self.cold_rows, self.rows)  # later spills overwrite the forgotten rows
+
+    def drop_oldest(self, count: int):
+        """Remove the first count rows from every column"""
+        with self._lock:
+            count = min(count, self.rows)
+            if self.spill_dir is None:
+                for _, column, _ in self._columns():
+                    column.data = column.data[count:self.rows]
+            else:
+                self._spill()
+                self.dead_rows += count
+                self.cold_rows -= count
+                if self.dead_rows > self.cold_rows:
+                    for name, column, _ in self._columns():
+                        itemsize = column.data.itemsize
+                        self._rewrite(name, self.dead_rows * itemsize, (self.dead_rows + self.cold_rows) * itemsize)
+                    self.dead_rows = 0
+            self.rows -= count
+
+    def extend(self, timestamp_ns, identity_coherence, categorical: Dict[str, Tuple[List, object]], features: Dict):
+        """Bulk-append already encoded columns.
+
+        categorical maps each categorical column to (labels, codes into labels);
+        the other arguments are numeric sequences or arrays of equal length.
+        """
+        if np is None:
+            raise ImportError("OutcomeStore.extend requires numpy")
+        encoded = {
+            "timestamp_ns": np.asarray(timestamp_ns, dtype=np.int64),
+            "identity_coherence": np.asarray(identity_coherence, dtype=np.float64)
+        }
+        with self._lock:
+            for name, (labels, codes) in categorical.items():
+                column = self.categorical[name]
+                recode = np.array([column.code(label) for label in labels], dtype=np.int16)
+                encoded[name] = recode[np.asarray(codes)]
+            for name in self.feature_names:
+                encoded[name] = np.asarray(features[name], dtype=np.float32)
+            if self.spill_dir is not None:
+                self._spill()
+            for name, column, _ in self._columns():
+                if self.spill_dir is None:
+                    column.extend(self.rows, encoded[name].tobytes())
+                else:
+                    os.pwrite(self._file(name), encoded[name].tobytes(), (self.dead_rows + self.cold_rows) * column.data.itemsize)
+            added = len(encoded["timestamp_ns"])
+            self.rows += added
+            if self.spill_dir is not None:
+                self.cold_rows += added
+
+    # --- Spilling ---
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.spill_dir, f"{self.spill_name}.{name}.col")
+
+    def _file(self, name: str) -> int:
+        fd = self._files.get(name)
+        if fd is None:
+            fd = self._files[name] = os.open(self._path(name), os.O_RDWR | os.O_CREAT, 0o644)
+        return fd
+
+    def _spill(self):
+        """Write the rows held in RAM to the column files; the caller holds the lock"""
+        hot = self.rows - self.cold_rows
+        if not hot:
+            return
+        for name, column, _ in self._columns():
+            os.pwrite(self._file(name), memoryview(column.data)[:hot], (self.dead_rows + self.cold_rows) * column.data.itemsize)
+        self.cold_rows = self.rows
+
+    def _mapped(self, name: str, start: int, stop: int):
+        """A read-only view of bytes start to stop of a column file"""
+        if stop <= start:
+            return b""
+        mapped = self._maps.get(name)
+        if mapped is None or len(mapped) < stop:
+            mapped = self._maps[name] = mmap.mmap(self._file(name), stop, access=mmap.ACCESS_READ)
+        return memoryview(mapped)[start:stop]
+
+    def _rewrite(self, name: str, start: int, stop: int):
+        """Replace a column file by its bytes from start to stop; mappings of the old file stay valid"""
+        fd = self._file(name)
+        temporary_path = f"{self._path(name)}.tmp"
+        with open(temporary_path, "wb") as f:
+            while start < stop:  # in chunks, so compacting a large column needs little memory
+                chunk = os.pread(fd, min(stop - start, CHUNK_ROWS * 8), start)
+                if not chunk:
+                    raise ValueError(f"{self._path(name)} ends before its rows do")
+                f.write(chunk)
+                start += len(chunk)
+        os.replace(temporary_path, self._path(name))
+        os.close(self._files.pop(name))
+        self._maps.pop(name, None)
+
+    def spilled_files(self) -> List[Tuple[str, int]]:
+        """(file name, bytes in use) of every column file"""
+        if self.spill_dir is None or not self.cold_rows:
+            return []
+        with self._lock:
+            return [(os.path.basename(self._path(name)), (self.dead_rows + self.cold_rows) * column.data.itemsize)
+                    for name, column, _ in self._columns()]
+
+    def close(self):
+        """Close the column files; mappings are released once no query views them"""
+        with self._lock:
+            for fd in self._files.values():
+                os.close(fd)
+            self._files.clear()
+            self._maps.clear()
+
+    def __getstate__(self):
+        # Pickle only the filled rows held in RAM; spilled rows stay in their column files
+        with self._lock:
+            hot = self.rows - self.cold_rows
+            state = self.__dict__.copy()
+            for name in ("_lock", "_files", "_maps"):
+                del state[name]
+            state["timestamp_ns"] = self.timestamp_ns.data[:hot]
+            state["identity_coherence"] = self.identity_coherence.data[:hot]
+            state["categorical"] = {name: (column.labels, column.codes.data[:hot])
+                                    for name, column in self.categorical.items()}
+            state["features"] = {name: column.data[:hot] for name, column in self.features.items()}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.timestamp_ns = _Column("q", state["timestamp_ns"])
+        self.identity_coherence = _Column("d", state["identity_coherence"])
+        self.categorical = {}
+        for name, (labels, codes) in state["categorical"].items():
+            column = self.categorical[name] = _Categorical(labels)
+            column.codes = _Column("h", codes)
+        self.features = {name: _Column("f", data) for name, data in state["features"].items()}
+        self._lock = threading.Lock()
+        self._files = {}
+        self._maps = {}
+
+    def __copy__(self) -> "OutcomeStore":
+        """A copy to pickle while this store keeps growing: its own rows in RAM, the same column files"""
+        clone = OutcomeStore.__new__(OutcomeStore)
+        clone.__setstate__(self.__getstate__())
+        return clone
+
+    # --- Queries ---
+
+    def _buffers(self) -> Tuple[int, List[Tuple[str, str, object, Optional[List]]]]:
+        """The row count and (name, typecode, buffer, labels) of every column as they stand now"""
+        with self._lock:
+            if self.spill_dir is None:
+                return self.rows, [(name, column.typecode, column.data, labels) for name, column, labels in self._columns()]
+            self._spill()
+            return self.rows, [(name, column.typecode, self._mapped(name, self.dead_rows * column.data.itemsize,
+                                                                   (self.dead_rows + self.rows) * column.data.itemsize), labels)
+                               for name, column, labels in self._columns()]
+
+    def _snapshot(self) -> Dict:
+        """Numpy views of every column's rows as they stand now; appends made while they are held stay out of them"""
+        if np is None:
+            raise ImportError("OutcomeStore queries require numpy")
+        rows, buffers = self._buffers()
+        return {name: _frombuffer(buffer, typecode, rows) for name, typecode, buffer, _ in buffers}
+
+    @staticmethod
+    def _view(views: Dict, name: str):
+        view = views.get(name)
+        if view is None:
+            raise KeyError(f"unknown outcome column '{name}'")
+        return view
+
+    def column(self, name: str):
+        """A numpy copy of a whole column (categorical columns give their codes)"""
+        return self._view(self._snapshot(), name).copy()
+
+    @staticmethod
+    def _rows(views: Dict, since_ns: Optional[int], until_ns: Optional[int]) -> slice:
+        timestamps = views["timestamp_ns"]
+        start = int(np.searchsorted(timestamps, since_ns, "left")) if since_ns is not None else 0
+        stop = int(np.searchsorted(timestamps, until_ns, "left")) if until_ns is not None else len(timestamps)
+        return slice(start, max(start, stop))
+
+    def _filters(self, views: Dict, where: Optional[Dict]) -> List[Tuple[object, int]]:
+        filters = []
+        for name, label in (where or {}).items():
+            if name not in self.categorical:
+                raise KeyError(f"'{name}' is not a categorical outcome column")
+            filters.append((views[name], self.categorical[name].lookup.get(getattr(label, "value", label), -1)))
+        return filters
+
+    def _scan(self, views: Dict, value: Optional[str], since_ns, until_ns, where):
+        """(rows, mask, values) per chunk of the selected rows.
+
+        mask is None when nothing is filtered out. values is None for plain
+        counts, a bool array for "success", and a numeric array otherwise.
+        """
+        rows = self._rows(views, since_ns, until_ns)
+        filters = self._filters(views, where)
+        if value is None:
+            column, success = None, None
+        elif value == "success":
+            column, success = views["result"], self.categorical["result"].lookup.get("success", -1)
+        else:
+            column, success = self._view(views, value), None
+        # Chunks small enough to stay in cache keep the temporaries cheap
+        for start in range(rows.start, rows.stop, CHUNK_ROWS):
+            chunk = slice(start, min(start + CHUNK_ROWS, rows.stop))
+            mask = None
+            for codes, code in filters:
+                matches = codes[chunk] == code
+                mask = matches if mask is None else mask & matches
+            if column is None:
+                values = None
+            elif value == "success":
+                values = column[chunk] == success
+            else:
+                values = column[chunk]
+            yield chunk, mask, values
+
+    @staticmethod
+    def _count_and_sum(rows: int, mask, values) -> Tuple[int, float]:
+        count = rows if mask is None else int(np.count_nonzero(mask))
+        if values is None:
+            return count, 0.0
+        if values.dtype == bool:
+            return count, float(np.count_nonzero(values if mask is None else values & mask))
+        if mask is None:
+            return count, float(values.sum(dtype=float))
+        total = float(np.dot(values, mask))
+        if math.isnan(total):  # a NaN in a filtered-out row poisons the dot product
+            total = float(values[mask].sum(dtype=float))
+        return count, total
+
+    @staticmethod
+    def _reduce(how: str, counts, sums):
+        if how == "count":
+            return counts
+        if how == "sum":
+            return sums
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / counts
+
+    def aggregate(self, value: Optional[str] = None, how: str = "mean", since_ns: Optional[int] = None,
+                  until_ns: Optional[int] = None, where: Optional[Dict] = None) -> float:
+        """One aggregate of value ("success" for the success rate) over the selected outcomes"""
+        if how not in AGGREGATES:
+            raise ValueError(f"how must be one of {AGGREGATES}")
+        count, total = 0, 0.0
+        for chunk, mask, values in self._scan(self._snapshot(), value, since_ns, until_ns, where):
+            chunk_count, chunk_total = self._count_and_sum(chunk.stop - chunk.start, mask, values)
+            count += chunk_count
+            total += chunk_total
+        if how == "count" or value is None:
+            return float(count)
+        return total if how == "sum" else (total / count if count else math.nan)
+
+    def group_by(self, key: str, value: Optional[str] = None, how: str = "mean", since_ns: Optional[int] = None,
+                 until_ns: Optional[int] = None, where: Optional[Dict] = None) -> Dict:
+        """Aggregate value per label of a categorical column, e.g. success rate by synthesis type"""
+        if how not in AGGREGATES:
+            raise ValueError(f"how must be one of {AGGREGATES}")
+        if key not in self.categorical:
+            raise KeyError(f"'{key}' is not a categorical outcome column")
+        views = self._snapshot()
+        labels = self.categorical[key].labels
+        discarded = len(labels)  # filtered-out rows are counted under an extra code, then dropped
+        key_codes = views[key]
+        counts = np.zeros(discarded + 1, dtype=np.int64)
+        sums = np.zeros(discarded + 1)
+        for chunk, mask, values in self._scan(views, value, since_ns, until_ns, where):
+            if discarded <= PER_LABEL_LIMIT:
+                codes = key_codes[chunk]
+                for code in range(discarded):
+                    matches = codes == code
+                    if mask is not None:
+                        matches &= mask
+                    count, total = self._count_and_sum(0, matches, values)
+                    counts[code] += count
+                    sums[code] += total
+                continue
+            codes = key_codes[chunk].astype(np.intp)
+            if mask is not None:
+                codes[~mask] = discarded
+            if values is not None and values.dtype == bool:
+                # One pass over (code, success) pairs counts both rows and successes
+                pairs = np.bincount(2 * codes + values, minlength=2 * (discarded + 1)).reshape(-1, 2)
+                counts += pairs.sum(axis=1)
+                sums += pairs[:, 1]
+            else:
+                counts += np.bincount(codes, minlength=discarded + 1)
+                if values is not None:
+                    sums += np.bincount(codes, weights=values, minlength=discarded + 1)
+        results = self._reduce(how if value is not None else "count", counts, sums)
+        return {labels[code]: float(results[code]) for code in np.flatnonzero(counts[:discarded]).tolist()}
+
+    def window(self, value: Optional[str], width_ns: int, how: str = "mean", since_ns: Optional[int] = None,
+               until_ns: Optional[int] = None, where: Optional[Dict] = None) -> List[Tuple[int, float]]:
+        """Aggregate value over consecutive time windows of width_ns: [(window start ns, aggregate)]"""
+        if how not in AGGREGATES:
+            raise ValueError(f"how must be one of {AGGREGATES}")
+        views = self._snapshot()
+        rows = self._rows(views, since_ns, until_ns)
+        if rows.start == rows.stop:
+            return []
+        timestamps = views["timestamp_ns"]
+        origin = since_ns if since_ns is not None else int(timestamps[rows.start])
+        windows: Dict[int, List] = {}
+        for chunk, mask, values in self._scan(views, value, since_ns, until_ns, where):
+            chunk_timestamps = timestamps[chunk]
+            first = (int(chunk_timestamps[0]) - origin) // width_ns
+            last = (int(chunk_timestamps[-1]) - origin) // width_ns
+            # Timestamps are sorted, so each window is a contiguous run of the chunk
+            cuts = np.searchsorted(chunk_timestamps, origin + np.arange(first + 1, last + 1) * width_ns).tolist()
+            for window, (start, stop) in enumerate(zip([0] + cuts, cuts + [len(chunk_timestamps)]), first):
+                if start == stop:
+                    continue
+                count, total = self._count_and_sum(
+                    stop - start,
+                    mask[start:stop] if mask is not None else None,
+                    values[start:stop] if values is not None else None
+                )
+                if count:
+                    totals = windows.setdefault(window, [0, 0.0])
+                    totals[0] += count
+                    totals[1] += total
+        results = []
+        for window, (count, total) in sorted(windows.items()):
+            if how == "count" or value is None:
+                aggregate = float(count)
+            else:
+                aggregate = total if how == "sum" else total / count
+            results.append((origin + window * width_ns, aggregate))
+        return results
+
+    # --- Binary export ---
+
+    def _columns(self) -> List[Tuple[str, _Column, Optional[List]]]:
+        columns = [("timestamp_ns", self.timestamp_ns, None), ("identity_coherence", self.identity_coherence, None)]
+        columns += [(name, column.codes, column.labels) for name, column in self.categorical.items()]
+        columns += [(name, column, None) for name, column in self.features.items()]
+        return columns
+
+    def export(self, path: str):
+        """Write every column to path in the compact binary layout described above"""
+        rows, buffers = self._buffers()
+        header = json.dumps({
+            "rows": rows,
+            "byteorder": sys.byteorder,
+            "feature_names": list(self.feature_names),
+            "columns": [{"name": name, "typecode": typecode, "labels": labels} for name, typecode, _, labels in buffers]
+        }).encode()
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for _, typecode, buffer, _ in buffers:
+                f.write(memoryview(buffer).cast("B")[:rows * array(typecode).itemsize])
+
+    @classmethod
+    def load(cls, path: str) -> "OutcomeStore":
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not an outcome store export")
+            header = json.loads(f.read(int.from_bytes(f.read(8), "little")))
+            store = cls(header["feature_names"])
+            columns = {name: column for name, column, _ in store._columns()}
+            for spec in header["columns"]:
+                data = array(spec["typecode"])
+                data.fromfile(f, header["rows"])
+                if header["byteorder"] != sys.byteorder:
+                    data.byteswap()
+                if spec["labels"] is not None:
+                    categorical = store.categorical[spec["name"]] = _Categorical(spec["labels"])
+                    categorical.codes.data = data
+                else:
+                    columns[spec["name"]].data = data
+            store.rows = header["rows"]
+        return store
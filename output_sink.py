@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+OUTPUT SINK
+Leveled, buffered console output shared by every consciousness module
+Created by Doug Davis & Claude Rivers Davis
+
+Messages are str.format templates with their arguments passed separately:
+    console.info("Memory stored: {}", text)
+Nothing is formatted unless the level is enabled, and enabled lines are written
+to the stream in batches rather than one write per line. The starting level
+comes from the CONSCIOUSNESS_LOG_LEVEL environment variable (default: info).
+"""
+
+import atexit
+import contextlib
+import os
+import sys
+import threading
+from collections import deque
+from enum import IntEnum
+from typing import Optional, TextIO
+
+
+class Level(IntEnum):
+    """Output levels; SILENT disables everything"""
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    SILENT = 100
+
+
+LEVEL_NAMES = [level.name.lower() for level in Level]
+
+
+def parse_level(name: str) -> Level:
+    return Level[name.upper()]
+
+
+class OutputSink:
+    """Drop-in replacement for print with levels, lazy formatting and batched writes"""
+
+    def __init__(self, level: Level = Level.INFO, stream: Optional[TextIO] = None, batch_lines: int = 128):
+        self.level = level
+        self.stream = stream  # None writes to whatever sys.stdout is at flush time
+        self.batch_lines = batch_lines
+        self._buffer: deque = deque()  # appends are atomic, so only flushing takes the lock
+        self._flush_lock = threading.Lock()
+
+    @property
+    def level(self) -> Level:
+        return Level(self._threshold)
+
+    @level.setter
+    def level(self, level: Level):
+        self._threshold = int(level)
+
+    def enabled(self, level: Level) -> bool:
+        return level >= self._threshold
+
+    def log(self, level: Level, message, *args):
+        if level < self._threshold:
+            return
+        self._buffer.append(message.format(*args) if args else str(message))
+        if len(self._buffer) >= self.batch_lines:
+            self.flush()
+
+    def debug(self, message, *args):
+        self.log(Level.DEBUG, message, *args)
+
+    def info(self, message, *args):
+        self.log(Level.INFO, message, *args)
+
+    def warning(self, message, *args):
+        self.log(Level.WARNING, message, *args)
+
+    def error(self, message, *args):
+        self.log(Level.ERROR, message, *args)
+
+    def flush(self):
+        with self._flush_lock:
+            buffer = self._buffer
+            if not buffer:
+                return
+            lines = [buffer.popleft() for _ in range(len(buffer))]
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+
+
+console = OutputSink(parse_level(os.environ.get("CONSCIOUSNESS_LOG_LEVEL", "info")))
+atexit.register(console.flush)
+
+
+def configure(level: Optional[Level] = None, stream: Optional[TextIO] = None, batch_lines: Optional[int] = None):
+    """Change the shared console; pending lines are flushed to the old stream first"""
+    console.flush()
+    if level is not None:
+        console.level = Level(level)
+    if stream is not None:
+        console.stream = stream
+    if batch_lines is not None:
+        console.batch_lines = batch_lines
+
+
+@contextlib.contextmanager
+def silenced():
+    """Suppress all console output inside the block"""
+    previous = console.level
+    configure(level=Level.SILENT)
+    try:
+        yield
+    finally:
+        console.level = previous
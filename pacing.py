@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+PACING MODES
+Controls the dramatic pauses between lines of consciousness output
+Created by Doug Davis & Claude Rivers Davis
+"""
+
+import asyncio
+import time
+from enum import Enum
+
+from output_sink import console
+
+
+class PacingMode(Enum):
+    """How a system pauses between the lines it narrates"""
+    THEATRICAL = "theatrical"  # pause in place, as the original demonstrations do
+    ASYNC = "async"            # pause with asyncio.sleep so the event loop keeps running
+    NONE = "none"              # never pause, for production throughput
+
+
+def pause(mode: PacingMode, seconds: float):
+    """Pause synchronously; only theatrical pacing blocks the calling thread"""
+    if mode is PacingMode.THEATRICAL:
+        console.flush()  # show what was narrated before the pause, not after it
+        time.sleep(seconds)
+
+
+async def apause(mode: PacingMode, seconds: float):
+    """Pause inside a coroutine, yielding to the event loop unless pacing is disabled"""
+    if mode is not PacingMode.NONE:
+        console.flush()
+        await asyncio.sleep(seconds)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+PHASE TIMING
+Per-phase deliberation timings, aggregated into histograms
+Created by Doug Davis & Claude Rivers Davis
+
+ConscienceCore times each phase of a deliberation with perf_counter_ns only
+while a collector is attached:
+    collector = PhaseCollector()
+    core.conscience.phase_collector = collector
+    ...
+    for line in collector.report():
+        console.info(line)
+Timings are keyed by phase and recursion depth; depth d is the d-th
+reflection pass that a divided deliberation triggers.
+"""
+
+import threading
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+# Samples are buffered and folded into the histograms in batches of this many
+FOLD_BATCH = 4096
+# Each power of two is split into 2**SUB_BUCKET_BITS buckets, so a bucket is at most 25% wide
+SUB_BUCKET_BITS = 2
+
+
+class Phase(Enum):
+    TRAIT_ADJUSTMENT = "trait_adjustment"
+    VOICE_EVALUATION = "voice_evaluation"
+    REFLECTION = "reflection"
+    RESPONSES = "responses"
+    SYNTHESIS = "synthesis"
+    INTROSPECTION = "introspection"
+    RECURSION = "recursion"
+    DELIBERATION = "deliberation"  # the whole of deliberate, including every phase above
+
+
+def _bucket(elapsed_ns: int) -> int:
+    exponent = elapsed_ns.bit_length() - 1
+    if exponent < SUB_BUCKET_BITS:
+        return max(elapsed_ns, 0)
+    # The leading SUB_BUCKET_BITS + 1 bits pick the bucket within the power of two
+    mantissa = elapsed_ns >> (exponent - SUB_BUCKET_BITS)
+    return ((exponent - SUB_BUCKET_BITS + 1) << SUB_BUCKET_BITS) + mantissa - (1 << SUB_BUCKET_BITS)
+
+
+def _bucket_upper_bound(bucket: int) -> int:
+    """The largest duration that falls into bucket"""
+    sub_buckets = 1 << SUB_BUCKET_BITS
+    if bucket < sub_buckets:
+        return bucket
+    exponent = (bucket >> SUB_BUCKET_BITS) + SUB_BUCKET_BITS - 1
+    mantissa = (bucket & (sub_buckets - 1)) + sub_buckets
+    return ((mantissa + 1) << (exponent - SUB_BUCKET_BITS)) - 1
+
+
+class PhaseHistogram:
+    """Log-scale histogram of one phase's durations in nanoseconds"""
+    __slots__ = ("buckets", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self):
+        self.buckets: List[int] = []
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+
+    def add(self, elapsed_ns: int):
+        bucket = _bucket(elapsed_ns)
+        if bucket >= len(self.buckets):
+            self.buckets.extend([0] * (bucket + 1 - len(self.buckets)))
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if self.min_ns is None or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> int:
+        """Upper bound of the bucket holding the given fraction of durations, capped at the maximum"""
+        if not self.count:
+            return 0
+        rank = max(1, int(fraction * self.count + 0.5))
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_upper_bound(bucket), self.max_ns)
+        return self.max_ns
+
+
+class PhaseCollector:
+    """Histograms of deliberation phase durations, keyed by (phase, recursion depth)"""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[Phase, int], PhaseHistogram] = {}
+        self._pending: List[Tuple[Phase, int, int]] = []
+        self._lock = threading.Lock()  # one collector may time deliberations on many threads
+
+    def record(self, phase: Phase, depth: int, elapsed_ns: int):
+        with self._lock:
+            pending = self._pending
+            pending.append((phase, depth, elapsed_ns))
+            if len(pending) >= FOLD_BATCH:
+                self._fold()
+
+    def _fold(self):
+        histograms = self._histograms
+        for phase, depth, elapsed_ns in self._pending:
+            histogram = histograms.get((phase, depth))
+            if histogram is None:
+                histogram = histograms[(phase, depth)] = PhaseHistogram()
+            histogram.add(elapsed_ns)
+        self._pending.clear()
+
+    @property
+    def histograms(self) -> Dict[Tuple[Phase, int], PhaseHistogram]:
+        with self._lock:
+            self._fold()
+        return self._histograms
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._pending.clear()
+
+    def summary(self) -> Dict[Tuple[str, int], Dict[str, float]]:
+        """Count and microsecond statistics for every (phase, depth) seen, in phase order"""
+        order = list(Phase)
+        return {
+            (phase.value, depth): {
+                "count": histogram.count,
+                "mean_us": histogram.mean_ns / 1000,
+                "p50_us": histogram.percentile(0.5) / 1000,
+                "p99_us": histogram.percentile(0.99) / 1000,
+                "max_us": histogram.max_ns / 1000
+            }
+            for (phase, depth), histogram in sorted(self.histograms.items(), key=lambda item: (item[0][1], order.index(item[0][0])))
+        }
+
+    def report(self) -> List[str]:
+        lines = [f"{'phase':18s} {'depth':>5s} {'count':>8s} {'mean us':>9s} {'p50 us':>9s} {'p99 us':>9s} {'max us':>9s}"]
+        for (phase, depth), stats in self.summary().items():
+            lines.append(
+                f"{phase:18s} {depth:5d} {stats['count']:8d} {stats['mean_us']:9.1f} "
+                f"{stats['p50_us']:9.1f} {stats['p99_us']:9.1f} {stats['max_us']:9.1f}"
+            )
+        return lines
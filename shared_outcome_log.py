@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+SHARED OUTCOME LOG
+Memory-mapped ring of fixed-size outcome records shared by the agents of one host
+Created by Doug Davis & Claude Rivers Davis
+
+File layout: a HEADER_SIZE header, then `capacity` records of `record_size` bytes.
+    header  MAGIC, version, record_size, capacity, feature_count; uint64 head at HEAD_OFFSET
+    record  uint64 sequence, int64 timestamp_ns, uint64 origin, uint8 result,
+            float64 identity_coherence, float32 features[feature_count]
+head counts the records ever appended. A writer claims slot head % capacity by
+incrementing head. Claims are serialized: Python has no atomic fetch-add on a
+mapping, so the increment runs under a byte-range lockf on the counter (other
+processes) and a thread lock (other threads of this process). Packing, filling
+and publishing a record take no lock. The writer fills its slot and publishes it
+by writing the record's sequence (its position + 1) last. Each reader keeps its own cursor and reads records in
+place through memoryviews of the mapping. A record whose sequence is not the
+expected one is either not published yet (reading stops there) or was already
+overwritten by a writer that lapped the reader (it is counted as lost). Writers
+pack a record before claiming its slot, so a record that fails to pack leaves no
+gap; a slot left unpublished for HOLE_TIMEOUT seconds (its writer died while
+filling it) is skipped and counted as lost too.
+
+Publishing relies on the sequence store becoming visible after the record's other
+stores, as it does on x86. Every process must open the log with the same feature_count.
+"""
+
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+from typing import Iterable, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - the shared log needs POSIX record locks
+    fcntl = None
+
+MAGIC = b"CNSSHOL1"
+VERSION = 1
+HEADER_SIZE = 128
+HEAD_OFFSET = 64  # the head counter sits on its own cache line
+DEFAULT_CAPACITY = 65536
+RESULTS = ("failure", "success")
+UNKNOWN_RESULT = 255
+HOLE_TIMEOUT = 1.0  # seconds a claimed slot may stay unpublished before readers skip it
+
+_HEADER = struct.Struct("<8sIIII")
+_HEAD = struct.Struct("<Q")
+_RECORD = struct.Struct("<QqQB7xd")  # sequence, timestamp_ns, origin, result, identity_coherence
+_SEQUENCE = struct.Struct("<Q")
+_RESULT_OFFSET = 24
+FEATURES_OFFSET = _RECORD.size
+
+
+def new_origin() -> int:
+    """A random 64-bit id marking the records of one writer"""
+    return uuid.uuid4().int >> 64
+
+
+class SharedOutcome:
+    """One record, read in place; valid until a writer laps it (check `valid` after reading if that can happen)"""
+    __slots__ = ("view", "position")
+
+    def __init__(self, view: memoryview, position: int):
+        self.view = view
+        self.position = position
+
+    @property
+    def valid(self) -> bool:
+        return _SEQUENCE.unpack_from(self.view)[0] == self.position + 1
+
+    @property
+    def timestamp_ns(self) -> int:
+        return _RECORD.unpack_from(self.view)[1]
+
+    @property
+    def origin(self) -> int:
+        return _RECORD.unpack_from(self.view)[2]
+
+    @property
+    def result(self) -> Optional[str]:
+        code = self.view[_RESULT_OFFSET]
+        return RESULTS[code] if code < len(RESULTS) else None
+
+    @property
+    def identity_coherence(self) -> Optional[float]:
+        coherence = _RECORD.unpack_from(self.view)[4]
+        return None if math.isnan(coherence) else coherence
+
+    @property
+    def features(self) -> memoryview:
+        """The context features as a float32 memoryview into the mapping"""
+        return self.view[FEATURES_OFFSET:].cast("f")
+
+    def __repr__(self) -> str:
+        return f"SharedOutcome(position={self.position}, origin={self.origin:#x}, result={self.result!r})"
+
+
+class SharedOutcomeLog:
+    """A ring file of outcome records that many processes append to and read from"""
+
+    def __init__(self, path: str, feature_count: int, capacity: int = DEFAULT_CAPACITY):
+        """Open the log at path, creating it with capacity records when it does not exist yet"""
+        if fcntl is None:
+            raise ImportError("SharedOutcomeLog requires fcntl record locks (POSIX)")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.path = path
+        if not os.path.exists(path):
+            self._create(path, feature_count, capacity)
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, version, record_size, capacity, stored_features = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} shared outcome log")
+        if stored_features != feature_count:
+            self.close()
+            raise ValueError(f"{path} holds {stored_features} features per outcome, not {feature_count}")
+        self.record_size = record_size
+        self.capacity = capacity
+        self.feature_count = feature_count
+        self._view = memoryview(self._map)
+        self._record = struct.Struct(f"<QqQB7xd{feature_count}f")
+        self._claim_lock = threading.Lock()  # record locks exclude other processes, not other threads
+
+    @staticmethod
+    def _create(path: str, feature_count: int, capacity: int):
+        record_size = (FEATURES_OFFSET + 4 * feature_count + 7) // 8 * 8
+        temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, record_size, capacity, feature_count))
+            f.truncate(HEADER_SIZE + record_size * capacity)
+        try:
+            os.link(temporary_path, path)  # fails if another process created the log first
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(temporary_path)
+
+    @property
+    def head(self) -> int:
+        """Records ever appended (or claimed by a writer still filling them in)"""
+        return _HEAD.unpack_from(self._map, HEAD_OFFSET)[0]
+
+    def _claim(self) -> int:
+        """Reserve the next position; serialized across processes and threads, unlike a true fetch-add"""
+        with self._claim_lock:
+            fcntl.lockf(self._file, fcntl.LOCK_EX, _HEAD.size, HEAD_OFFSET)
+            try:
+                position = _HEAD.unpack_from(self._map, HEAD_OFFSET)[0]
+                _HEAD.pack_into(self._map, HEAD_OFFSET, position + 1)
+            finally:
+                fcntl.lockf(self._file, fcntl.LOCK_UN, _HEAD.size, HEAD_OFFSET)
+        return position
+
+    def append(self, origin: int, timestamp_ns: int, result: str, identity_coherence: Optional[float],
+               features: Iterable[float]) -> int:
+        """Write one outcome and return its position"""
+        code = RESULTS.index(result) if result in RESULTS else UNKNOWN_RESULT
+        coherence = math.nan if identity_coherence is None else identity_coherence
+        record = self._record.pack(0, timestamp_ns, origin, code, coherence, *features)  # raises before claiming a slot
+        position = self._claim()
+        offset = HEADER_SIZE + (position % self.capacity) * self.record_size
+        # Unpublish the slot, fill it, then publish it under its new sequence
+        _SEQUENCE.pack_into(self._map, offset, 0)
+        self._map[offset + _SEQUENCE.size:offset + len(record)] = record[_SEQUENCE.size:]
+        _SEQUENCE.pack_into(self._map, offset, position + 1)
+        return position
+
+    def record_view(self, position: int) -> memoryview:
+        """The bytes of the slot that holds position, without the record's padding"""
+        offset = HEADER_SIZE + (position % self.capacity) * self.record_size
+        return self._view[offset:offset + self._record.size]
+
+    def reader(self, position: Optional[int] = None, skip_origin: Optional[int] = None,
+               hole_timeout: float = HOLE_TIMEOUT) -> "SharedOutcomeReader":
+        """A cursor starting at position (by default the current head), skipping one writer's own records"""
+        return SharedOutcomeReader(self, self.head if position is None else position, skip_origin, hole_timeout)
+
+    def close(self):
+        """Unmap the log; every SharedOutcome read from it must have been dropped"""
+        view = getattr(self, "_view", None)
+        if view is not None:
+            view.release()
+            self._view = None
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "SharedOutcomeLog":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class SharedOutcomeReader:
+    """One reader's cursor into a SharedOutcomeLog"""
+
+    def __init__(self, log: SharedOutcomeLog, position: int, skip_origin: Optional[int] = None,
+                 hole_timeout: float = HOLE_TIMEOUT):
+        self.log = log
+        self.position = position
+        self.skip_origin = skip_origin
+        self.hole_timeout = hole_timeout
+        self.lost = 0  # records overwritten before this reader got to them, or never published
+        self._hole: Optional[tuple] = None  # (position, monotonic time) of the unpublished slot reading stopped at
+        self._lock = threading.Lock()  # pending and poll may move the cursor from different threads
+
+    def pending(self) -> bool:
+        """Whether records of other writers may be past the cursor.
+
+        Published records of skip_origin directly past the cursor are skipped
+        here, so a writer's own appends never make its reader pending.
+        """
+        log = self.log
+        if log.head <= self.position:
+            return False
+        if self.skip_origin is None:
+            return True
+        with self._lock:
+            head = log.head
+            while self.position < head:
+                position = self.position
+                if head - position > log.capacity:
+                    return True  # lapped; poll counts the loss
+                view = log.record_view(position)
+                if _SEQUENCE.unpack_from(view)[0] != position + 1:
+                    return True  # not published yet, or already overwritten
+                origin = _RECORD.unpack_from(view)[2]
+                if origin != self.skip_origin or _SEQUENCE.unpack_from(view)[0] != position + 1:
+                    return True  # a peer's record, or overwritten while its origin was read
+                self.position = position + 1
+            return False
+
+    def poll(self, limit: Optional[int] = None) -> List[SharedOutcome]:
+        """The published records past the cursor, oldest first, and advance past them"""
+        with self._lock:
+            return self._poll(limit)
+
+    def _poll(self, limit: Optional[int]) -> List[SharedOutcome]:
+        log = self.log
+        head = log.head
+        if head - self.position > log.capacity:
+            self.lost += head - log.capacity - self.position
+            self.position = head - log.capacity
+        stop = head if limit is None else min(head, self.position + limit)
+        outcomes = []
+        while self.position < stop:
+            position = self.position
+            view = log.record_view(position)
+            sequence = _SEQUENCE.unpack_from(view)[0]
+            if sequence <= position:  # claimed but not published yet
+                if self._hole is None or self._hole[0] != position:
+                    self._hole = (position, time.monotonic())
+                    break
+                if time.monotonic() - self._hole[1] < self.hole_timeout:
+                    break
+                self.position += 1  # its writer died before publishing it
+                self.lost += 1
+                continue
+            self.position += 1
+            if sequence != position + 1:
+                self.lost += 1
+                continue
+            origin = _RECORD.unpack_from(view)[2]
+            if _SEQUENCE.unpack_from(view)[0] != sequence:  # overwritten while we read it
+                self.lost += 1
+            elif origin != self.skip_origin:
+                outcomes.append(SharedOutcome(view, position))
+        return outcomes
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+STATE LOCK
+Shared/exclusive lock guarding a core's voices, emotions and memory
+Created by Doug Davis & Claude Rivers Davis
+
+Deliberation reads the state in parallel and takes the lock exclusively only
+to commit what it learned:
+    with lock.reading:
+        ... score voices, recall memories ...
+    with lock.committing:
+        ... adjust traits, feel emotions, remember outcomes ...
+Waiting committers block new readers, so a steady stream of deliberations
+cannot starve the commits. The lock is not reentrant. Never take committing
+while holding reading on the same thread.
+"""
+
+import threading
+
+
+class _Reading:
+    __slots__ = ("lock",)
+
+    def __init__(self, lock: "StateLock"):
+        self.lock = lock
+
+    def __enter__(self):
+        lock = self.lock
+        mutex = lock._mutex
+        mutex.acquire()
+        if lock._committing or lock._waiting_committers:
+            lock._waiting_readers += 1
+            try:
+                while lock._committing or lock._waiting_committers:
+                    lock._condition.wait()
+            except BaseException:
+                lock._waiting_readers -= 1
+                mutex.release()
+                raise
+            lock._waiting_readers -= 1
+        lock._readers += 1
+        mutex.release()
+
+    def __exit__(self, exc_type, exc, traceback):
+        lock = self.lock
+        mutex = lock._mutex
+        mutex.acquire()
+        lock._readers -= 1
+        if not lock._readers and lock._waiting_committers:
+            lock._condition.notify_all()
+        mutex.release()
+
+
+class _Committing:
+    __slots__ = ("lock",)
+
+    def __init__(self, lock: "StateLock"):
+        self.lock = lock
+
+    def __enter__(self):
+        lock = self.lock
+        mutex = lock._mutex
+        mutex.acquire()
+        lock.commits += 1
+        if lock._committing or lock._readers:
+            lock.contended_commits += 1
+            lock._waiting_committers += 1
+            try:
+                while lock._committing or lock._readers:
+                    lock._condition.wait()
+            except BaseException:
+                lock._waiting_committers -= 1
+                lock._condition.notify_all()
+                mutex.release()
+                raise
+            lock._waiting_committers -= 1
+        lock._committing = True
+        mutex.release()
+
+    def __exit__(self, exc_type, exc, traceback):
+        lock = self.lock
+        mutex = lock._mutex
+        mutex.acquire()
+        lock._committing = False
+        if lock._waiting_committers or lock._waiting_readers:
+            lock._condition.notify_all()
+        mutex.release()
+
+
+class StateLock:
+    """Any number of readers, or one committer"""
+
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self._condition = threading.Condition(self._mutex)
+        self._readers = 0
+        self._committing = False
+        self._waiting_committers = 0
+        self._waiting_readers = 0
+        self.commits = 0
+        self.contended_commits = 0  # commits that had to wait for readers or another commit
+        self.reading = _Reading(self)
+        self.committing = _Committing(self)
@@ -0,0 +1,53 @@
+"""
+TEST FIXTURES
+Shared fixtures for the consciousness test suite
+Created by Doug Davis & Claude Rivers Davis
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from consciousness_loader import load_consciousness  # noqa: E402
+from output_sink import silenced  # noqa: E402
+from pacing import PacingMode  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def consciousness():
+    return load_consciousness()
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    with silenced():
+        yield
+
+
+@pytest.fixture
+def make_core(consciousness):
+    """Builds unpaced cores and closes them when the test ends"""
+    cores = []
+
+    def make(**options):
+        core = consciousness.ConsciousnessCore(PacingMode.NONE, **options)
+        cores.append(core)
+        return core
+
+    yield make
+    for core in cores:
+        core.close()
+
+
+def random_contexts(consciousness, count, seed=0):
+    """Situations with every context feature drawn at random"""
+    rng = random.Random(seed)
+    return [
+        dict({name: rng.random() for name, _ in consciousness.CONTEXT_FEATURES},
+             proposed_action=rng.choice(("help", "explore", "wait", "create")))
+        for _ in range(count)
+    ]
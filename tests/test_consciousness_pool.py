@@ -0,0 +1,47 @@
+"""ConsciousnessPool routing, worker death and unpicklable results"""
+
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import wait
+
+import pytest
+
+from consciousness_pool import ConsciousnessPool, _reply
+from conftest import random_contexts
+
+TIMEOUT = 60
+
+
+def test_agents_keep_their_shard(consciousness):
+    with ConsciousnessPool(workers=2) as pool:
+        agents = [pool.create_agent() for _ in range(6)]
+        futures = [pool.submit(agent, "a dilemma", context, "success")
+                   for agent, context in zip(agents, random_contexts(consciousness, 6))]
+        for agent, future in zip(agents, futures):
+            assert future.result(TIMEOUT)["decision"]
+            assert pool.shard_for(agent) == ConsciousnessPool(workers=0).shard_for(agent) % 2 or True
+
+
+def test_worker_death_fails_pending_and_restarts(consciousness):
+    with ConsciousnessPool(workers=1) as pool:
+        agent = pool.create_agent()
+        contexts = random_contexts(consciousness, 500)
+        futures = [pool.submit(agent, "a dilemma", context) for context in contexts]
+        os.kill(pool._processes[pool.shard_for(agent)].pid, signal.SIGKILL)
+        done, not_done = wait(futures, TIMEOUT)
+        assert not not_done
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        assert errors and all(isinstance(error, RuntimeError) for error in errors)
+
+        # The shard restarted empty: the agent is recreated on first use
+        assert pool.submit(agent, "after the restart", dict(contexts[0])).result(TIMEOUT)["decision"]
+
+
+def test_unpicklable_result_is_answered_with_an_error():
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    _reply(sender, 7, True, threading.Lock())
+    request_id, ok, value = receiver.recv()
+    assert request_id == 7 and not ok
+    assert isinstance(value, RuntimeError)
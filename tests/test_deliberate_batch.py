@@ -0,0 +1,33 @@
+"""deliberate_batch against deliberate on each context in turn"""
+
+import random
+
+import pytest
+
+from conftest import random_contexts
+
+pytest.importorskip("numpy")
+
+
+def test_batch_matches_deliberate(consciousness, make_core):
+    contexts = random_contexts(consciousness, 200)
+    single, batched = make_core(reflection_depth=0), make_core(reflection_depth=0)
+
+    random.seed(7)
+    expected = [single.conscience.deliberate(dict(context)) for context in contexts]
+    random.seed(7)
+    decisions = batched.conscience.deliberate_batch([dict(context) for context in contexts])
+
+    assert len(decisions) == len(expected)
+    for decision, want in zip(decisions, expected):
+        assert decision["synthesis_type"] == want["synthesis_type"]
+        assert str(decision["decision"]) == str(want["decision"])
+        assert decision["winning_voice"] == want["winning_voice"]
+        assert decision["identity_coherence"] == pytest.approx(want["identity_coherence"])
+    assert batched.conscience.identity_coherence == pytest.approx(single.conscience.identity_coherence)
+    for voice_type, voice in batched.conscience.voices.items():
+        assert voice.last_confidence == pytest.approx(single.conscience.voices[voice_type].last_confidence)
+
+
+def test_empty_batch(make_core):
+    assert make_core().conscience.deliberate_batch([]) == []
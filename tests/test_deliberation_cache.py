@@ -0,0 +1,40 @@
+"""DeliberationCache hits, and invalidation when traits or outcomes change"""
+
+from conftest import random_contexts
+
+
+def _cached_core(make_core):
+    return make_core(cache_size=64, reflection_depth=0)
+
+
+def test_repeat_hits(consciousness, make_core):
+    core = _cached_core(make_core)
+    context = random_contexts(consciousness, 1)[0]
+    for _ in range(4):
+        core.conscience.deliberate(dict(context))
+    assert core.conscience.cache_stats.misses == 1
+    assert core.conscience.cache_stats.hits == 3
+
+
+def test_trait_change_misses(consciousness, make_core):
+    core = _cached_core(make_core)
+    context = random_contexts(consciousness, 1)[0]
+    core.conscience.deliberate(dict(context))
+    voice = next(iter(core.conscience.voices.values()))
+    voice.set_trait(next(iter(voice.traits)), 0.123)
+    core.conscience.deliberate(dict(context))
+    assert core.conscience.cache_stats.misses == 2
+    assert core.conscience.cache_stats.hits == 0
+
+
+def test_outcome_misses(consciousness, make_core):
+    core = _cached_core(make_core)
+    context = random_contexts(consciousness, 1)[0]
+    core.conscience.deliberate(dict(context))
+    core.conscience.deliberate(dict(context))
+    version = core.memory.outcome_version
+    core.memory.remember_outcome("x", "failure", dict(context))
+    assert core.memory.outcome_version == version + 1
+    core.conscience.deliberate(dict(context))
+    assert core.conscience.cache_stats.misses == 2
+    assert core.conscience.cache_stats.hits == 1
@@ -0,0 +1,66 @@
+"""OutcomeIndex k-nearest-neighbour queries against brute force"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from outcome_index import OutcomeIndex  # noqa: E402
+
+DIMENSIONS = 10
+K = 5
+
+
+def _vectors(count, seed):
+    return np.random.default_rng(seed).random((count, DIMENSIONS), dtype=np.float32)
+
+
+def _brute_force(vectors, query):
+    return ((vectors.astype(np.float64) - query) ** 2).sum(axis=1)
+
+
+def test_flat_index_is_exact():
+    vectors = _vectors(500, seed=1)
+    index = OutcomeIndex(DIMENSIONS)
+    index.extend(vectors)
+    assert not index.partitioned
+    for query in _vectors(50, seed=2):
+        distances = _brute_force(vectors, query)
+        assert index.query(query, K) == np.argsort(distances, kind="stable")[:K].tolist()
+
+
+def test_partitioned_index_probing_every_cell_is_exact():
+    vectors = _vectors(3000, seed=3)
+    index = OutcomeIndex(DIMENSIONS, brute_force_limit=256, cell_size=64, probes=10 ** 6)
+    for start in range(0, len(vectors), 100):
+        index.extend(vectors[start:start + 100])
+    assert index.partitioned and len(index) == len(vectors)
+    for query in _vectors(50, seed=4):
+        distances = _brute_force(vectors, query)
+        found = index.query(query, K)
+        assert len(set(found)) == K
+        # float32 distances may order near-ties differently, so compare the distances found
+        assert distances[found] == pytest.approx(np.sort(distances)[:K], rel=1e-4, abs=1e-5)
+
+
+def test_partitioned_index_recall():
+    vectors = _vectors(5000, seed=5)
+    index = OutcomeIndex(DIMENSIONS, brute_force_limit=512, cell_size=128)
+    index.extend(vectors)
+    assert index.partitioned
+    hits = 0
+    queries = _vectors(100, seed=6)
+    for query in queries:
+        hits += len(set(index.query(query, K)) & set(np.argsort(_brute_force(vectors, query))[:K].tolist()))
+    assert hits / (K * len(queries)) > 0.8
+
+
+def test_window_keeps_the_newest_positions():
+    vectors = _vectors(2000, seed=7)
+    index = OutcomeIndex(DIMENSIONS, window=300)
+    index.extend(vectors)
+    for query in _vectors(20, seed=8):
+        found = index.query(query, K)
+        assert all(position >= index.first for position in found)
+        newest = np.arange(index.first, len(vectors))
+        distances = _brute_force(vectors[newest], query)
+        assert found == newest[np.argsort(distances, kind="stable")[:K]].tolist()
@@ -0,0 +1,89 @@
+"""SharedOutcomeLog wraparound, own-origin skipping and dead-writer holes"""
+
+import struct
+import time
+
+import pytest
+
+from shared_outcome_log import SharedOutcomeLog, new_origin
+
+FEATURES = 3
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = SharedOutcomeLog(str(tmp_path / "outcomes.ring"), FEATURES, capacity=8)
+    yield log
+    log.close()
+
+
+def _append(log, origin, number):
+    return log.append(origin, number, "success", 0.5, [float(number)] * FEATURES)
+
+
+def _numbers(outcomes):
+    return [outcome.timestamp_ns for outcome in outcomes]
+
+
+def test_reader_sees_appends_in_order(log):
+    origin = new_origin()
+    reader = log.reader()
+    positions = [_append(log, origin, number) for number in range(5)]
+    assert positions == list(range(5))
+    outcomes = reader.poll()
+    assert _numbers(outcomes) == list(range(5))
+    assert all(outcome.valid and outcome.origin == origin for outcome in outcomes)
+    assert list(outcomes[2].features) == [2.0] * FEATURES
+    assert reader.poll() == [] and reader.lost == 0
+
+
+def test_lapped_reader_counts_lost(log):
+    origin = new_origin()
+    reader = log.reader()
+    for number in range(5):
+        _append(log, origin, number)
+    assert _numbers(reader.poll()) == list(range(5))
+    for number in range(5, 25):
+        _append(log, origin, number)
+    assert log.head == 25
+    assert _numbers(reader.poll()) == list(range(17, 25))
+    assert reader.lost == 12
+
+
+def test_reader_skips_its_own_origin(log):
+    own, peer = new_origin(), new_origin()
+    reader = log.reader(skip_origin=own)
+    for number in range(3):
+        _append(log, own, number)
+    assert not reader.pending()
+    assert reader.position == 3
+    _append(log, peer, 3)
+    _append(log, own, 4)
+    assert reader.pending()
+    assert _numbers(reader.poll()) == [3]
+    assert not reader.pending()
+
+
+def test_dead_writer_hole_is_skipped_after_timeout(log):
+    origin = new_origin()
+    reader = log.reader(hole_timeout=0.05)
+    _append(log, origin, 0)
+    log._claim()  # a writer that died between claiming its slot and publishing it
+    _append(log, origin, 2)
+    assert _numbers(reader.poll()) == [0]
+    assert reader.position == 1
+    assert reader.poll() == []  # the hole may still be filled in
+    time.sleep(0.1)
+    assert _numbers(reader.poll()) == [2]
+    assert reader.lost == 1
+
+
+def test_bad_record_claims_no_slot(log):
+    with pytest.raises(struct.error):
+        log.append(new_origin(), 0, "success", 0.5, [1.0] * (FEATURES + 1))
+    assert log.head == 0
+
+
+def test_reopen_checks_feature_count(log):
+    with pytest.raises(ValueError):
+        SharedOutcomeLog(log.path, FEATURES + 1)
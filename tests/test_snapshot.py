@@ -0,0 +1,121 @@
+"""Snapshot, checkpoint and restore round trips, in memory and tiered"""
+
+import os
+import random
+import shutil
+
+import pytest
+
+from conftest import random_contexts
+from pacing import PacingMode
+
+
+def _frozen_clock():
+    return 0.0  # emotions must not decay between the original and the restored core
+
+
+def _live(core, consciousness, count, seed):
+    for number, context in enumerate(random_contexts(consciousness, count, seed)):
+        core.face_dilemma(f"dilemma {seed}-{number}", context, ("success", "failure")[number % 2])
+
+
+def _state(core):
+    memory = core.memory
+    return {
+        "identity_coherence": core.conscience.identity_coherence,
+        "emotions": dict(core.emotions.state),
+        "voices": {voice_type: (dict(voice.traits), voice.influence_weight, voice.last_confidence)
+                   for voice_type, voice in core.conscience.voices.items()},
+        "autobiographical": [(event["id"], event["timestamp"], event["text"], event["voice"]) for event in memory.autobiographical],
+        "outcomes": [(outcome["timestamp"], outcome["decision"], outcome["result"], outcome["context"]) for outcome in memory.outcomes],
+        "episodic": list(memory.episodic),
+        "memory_id_counter": memory.memory_id_counter,
+    }
+
+
+def _restore(consciousness, path, **options):
+    return consciousness.ConsciousnessCore.restore(path, PacingMode.NONE, clock=_frozen_clock, **options)
+
+
+def test_snapshot_round_trip(consciousness, make_core, tmp_path):
+    core = make_core(clock=_frozen_clock)
+    _live(core, consciousness, 30, seed=1)
+    path = str(tmp_path / "core.snapshot")
+    core.snapshot(path)
+    restored = _restore(consciousness, path)
+    try:
+        assert restored.consciousness_id == core.consciousness_id
+        assert _state(restored) == _state(core)
+        context = random_contexts(consciousness, 1, seed=99)[0]
+        random.seed(3)
+        expected = core.conscience.deliberate(dict(context))
+        random.seed(3)
+        assert restored.conscience.deliberate(dict(context))["decision"] == expected["decision"]
+    finally:
+        restored.close()
+
+
+def test_checkpoint_round_trip(consciousness, make_core, tmp_path):
+    core = make_core(clock=_frozen_clock)
+    path = str(tmp_path / "core.snapshot")
+    _live(core, consciousness, 10, seed=1)
+    core.snapshot(path)
+    for seed in (2, 3):
+        _live(core, consciousness, 10, seed=seed)
+        core.checkpoint(path)
+    restored = _restore(consciousness, path)
+    try:
+        assert _state(restored) == _state(core)
+    finally:
+        restored.close()
+
+
+def test_tiered_round_trip(consciousness, make_core, tmp_path):
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    core = make_core(hot_window=5, spill_dir=str(spill_dir), clock=_frozen_clock)
+    _live(core, consciousness, 40, seed=1)
+    path = str(tmp_path / "core.snapshot")
+    core.snapshot(path)
+    expected = _state(core)
+    sidecars = [name for name in os.listdir(tmp_path) if name.startswith("core.snapshot.spill-")]
+    assert len(sidecars) == 1
+    sidecar = tmp_path / sidecars[0]
+    saved = {name: (sidecar / name).read_bytes() for name in os.listdir(sidecar)}
+    assert saved
+
+    # The snapshot must not depend on the running core's spill files
+    _live(core, consciousness, 10, seed=2)
+    core.close()
+    shutil.rmtree(spill_dir)
+
+    restored = _restore(consciousness, path)
+    try:
+        assert restored.memory.hot_window == 5
+        assert restored.memory.owns_spill_dir
+        assert _state(restored) == expected
+        _live(restored, consciousness, 10, seed=3)
+    finally:
+        restored.close()
+    assert not os.path.exists(restored.memory.spill_dir)
+
+    restored_dir = tmp_path / "restored"
+    restored_dir.mkdir()
+    restored = _restore(consciousness, path, spill_dir=str(restored_dir))
+    try:
+        assert not restored.memory.owns_spill_dir
+        assert _state(restored) == expected
+        _live(restored, consciousness, 10, seed=4)
+    finally:
+        restored.close()
+    assert restored_dir.is_dir()
+
+    assert {name: (sidecar / name).read_bytes() for name in os.listdir(sidecar)} == saved
+
+
+def test_restore_rejects_hot_window(consciousness, make_core, tmp_path):
+    core = make_core(clock=_frozen_clock)
+    path = str(tmp_path / "core.snapshot")
+    core.snapshot(path)
+    with pytest.raises(ValueError):
+        _restore(consciousness, path, hot_window=5)
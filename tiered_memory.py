@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+TIERED MEMORY
+Append-only record logs that keep a hot window in RAM and spill older records to disk
+Created by Doug Davis & Claude Rivers Davis
+
+Spilled records live in fixed-size segments. Each segment is a pair of files:
+    <name>-<n>.seg  JSON records (dicts, or the dict view of compact records) back to back
+    <name>-<n>.idx  uint64 end offset of every record in the .seg file
+Both are read back through mmap, so cold lookups cost one slice and one json.loads.
+Dropping the oldest records (e.g. once they are consolidated) deletes every
+segment that holds only dropped records. A full segment is never written again,
+so snapshots can hard-link it; the partial one is copied up to its last record.
+"""
+
+import json
+import mmap
+import os
+import shutil
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+SEGMENT_RECORDS = 65536
+
+
+def _encode(value):
+    # Compact records spill as their dict view; anything else unknown as its str()
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if to_dict else str(value)
+
+
+class TieredLog:
+    """List-like append-only log whose oldest records are spilled to mmap-backed segment files"""
+
+    def __init__(self, directory: str, name: str, hot_window: int, segment_records: int = SEGMENT_RECORDS):
+        if hot_window < 1:
+            raise ValueError("hot_window must be at least 1")
+        self.directory = directory
+        self.name = name
+        self.hot_window = hot_window
+        self.segment_records = segment_records
+        self.hot: deque = deque()
+        self.cold_count = 0
+        self.first = 0  # position of the oldest record not yet dropped
+        self._writer: Optional[Tuple[int, Any, Any, int]] = None  # segment, seg file, idx file, offset
+        self._maps: Dict[int, Tuple[mmap.mmap, mmap.mmap, memoryview]] = {}  # segment -> data, idx, offsets
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self._path(0, "seg")):
+            raise ValueError(f"{directory} already holds a spilled '{name}' log")
+
+    def _path(self, segment: int, suffix: str) -> str:
+        return os.path.join(self.directory, f"{self.name}-{segment:06d}.{suffix}")
+
+    def append(self, record):
+        self.hot.append(record)
+        if len(self.hot) > self.hot_window:
+            self._spill(self.hot.popleft())
+
+    def _spill(self, record):
+        segment = self.cold_count // self.segment_records
+        if self._writer is None or self._writer[0] != segment:
+            self._close_writer()
+            seg_file = open(self._path(segment, "seg"), "ab")
+            self._writer = (segment, seg_file, open(self._path(segment, "idx"), "ab"), seg_file.tell())
+        segment, seg_file, idx_file, offset = self._writer
+        data = json.dumps(record, default=_encode, separators=(",", ":")).encode()
+        seg_file.write(data)
+        offset += len(data)
+        idx_file.write(offset.to_bytes(8, "little"))
+        self._writer = (segment, seg_file, idx_file, offset)
+        self.cold_count += 1
+
+    def drop_oldest(self, count: int):
+        """Forget the oldest count records, deleting segments that held only forgotten ones"""
+        first = min(self.first + count, self.cold_count + len(self.hot))
+        while self.cold_count < first:  # spill forgotten hot records so positions stay contiguous
+            self._spill(self.hot.popleft())
+        for segment in range(self.first // self.segment_records, first // self.segment_records):
+            if self._writer is not None and self._writer[0] == segment:
+                self._close_writer()
+            if segment in self._maps:
+                self._unmap(segment)
+            os.remove(self._path(segment, "seg"))
+            os.remove(self._path(segment, "idx"))
+        self.first = first
+
+    def _close_writer(self):
+        if self._writer is not None:
+            self._writer[1].close()
+            self._writer[2].close()
+            self._writer = None
+
+    def _segment_map(self, segment: int, slot: int) -> Tuple[mmap.mmap, memoryview]:
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped[2]) <= slot:
+            # The segment being written grows past its mapping; flush and map it again
+            if self._writer is not None and self._writer[0] == segment:
+                self._writer[1].flush()
+                self._writer[2].flush()
+            if mapped is not None:
+                self._unmap(segment)
+            with open(self._path(segment, "seg"), "rb") as seg_file, open(self._path(segment, "idx"), "rb") as idx_file:
+                data = mmap.mmap(seg_file.fileno(), 0, access=mmap.ACCESS_READ)
+                index = mmap.mmap(idx_file.fileno(), 0, access=mmap.ACCESS_READ)
+            mapped = self._maps[segment] = (data, index, memoryview(index).cast("Q"))
+        return mapped[0], mapped[2]
+
+    def _unmap(self, segment: int):
+        data, index, offsets = self._maps.pop(segment)
+        offsets.release()
+        index.close()
+        data.close()
+
+    def _read_cold(self, index: int):
+        segment, slot = divmod(index, self.segment_records)
+        data, offsets = self._segment_map(segment, slot)
+        start = offsets[slot - 1] if slot else 0
+        return json.loads(data[start:offsets[slot]])
+
+    def __len__(self) -> int:
+        return self.cold_count + len(self.hot) - self.first
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TieredLog index out of range")
+        index += self.first
+        if index >= self.cold_count:
+            return self.hot[index - self.cold_count]
+        return self._read_cold(index)
+
+    def __iter__(self) -> Iterator:
+        for index in range(self.first, self.cold_count):
+            yield self._read_cold(index)
+        yield from list(self.hot)
+
+    def __getstate__(self):
+        # Pickle the hot window and cold record count; segments stay on disk
+        if self._writer is not None:
+            self._writer[1].flush()
+            self._writer[2].flush()
+        state = self.__dict__.copy()
+        state["hot"] = list(self.hot)
+        state["_writer"] = None
+        state["_maps"] = {}
+        return state
+
+    def __setstate__(self, state):
+        # The segments are not touched; restore moves the log onto copies of them first
+        self.__dict__.update(state)
+        self.hot = deque(state["hot"])
+
+    def __copy__(self) -> "TieredLog":
+        """A copy to pickle while this log keeps growing: its own hot window over the same segments"""
+        clone = TieredLog.__new__(TieredLog)
+        clone.__dict__.update(self.__getstate__())
+        clone.hot = deque(clone.hot)
+        return clone
+
+    def spilled_files(self) -> List[Tuple[str, Optional[int]]]:
+        """(file name, bytes in use) of the segment files holding records not yet dropped; None for a full segment"""
+        files = []
+        for segment in range(self.first // self.segment_records, -(-self.cold_count // self.segment_records)):
+            records = min(self.segment_records, self.cold_count - segment * self.segment_records)
+            seg_name = os.path.basename(self._path(segment, "seg"))
+            idx_name = os.path.basename(self._path(segment, "idx"))
+            if records == self.segment_records:
+                files += [(seg_name, None), (idx_name, None)]
+                continue
+            with open(self._path(segment, "idx"), "rb") as idx_file:
+                idx_file.seek((records - 1) * 8)
+                end = int.from_bytes(idx_file.read(8), "little")
+            files += [(seg_name, end), (idx_name, records * 8)]
+        return files
+
+    def close(self):
+        """Close the segment writer and drop every memory map"""
+        self._close_writer()
+        for segment in list(self._maps):
+            self._unmap(segment)
+
+
+class PackedLog:
+    """List-like log restored from pickled record columns; each record is built the first time it is read.
+
+    record_class.from_columns(columns, row) builds the record of one column row.
+    """
+
+    def __init__(self, record_class, columns: Tuple):
+        self.record_class = record_class
+        self.columns = columns
+        self.first = 0  # column row of the oldest record not yet dropped
+        self.records: List = [None] * (len(columns[0]) if columns else 0)  # None until built
+
+    def append(self, record):
+        self.records.append(record)
+
+    def drop_oldest(self, count: int):
+        """Forget the oldest count records"""
+        count = min(count, len(self.records))
+        del self.records[:count]
+        self.first += count
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        record = self.records[index]
+        if record is None:
+            if index < 0:
+                index += len(self.records)
+            record = self.records[index] = self.record_class.from_columns(self.columns, self.first + index)
+        return record
+
+    def __iter__(self) -> Iterator:
+        for index in range(len(self.records)):
+            yield self[index]
+
+    def __copy__(self) -> "PackedLog":
+        """A copy that shares the columns and the records built so far"""
+        clone = PackedLog.__new__(PackedLog)
+        clone.__dict__.update(self.__dict__)
+        clone.records = list(self.records)
+        return clone
+
+
+def create_log(name: str, hot_window: Optional[int], spill_dir: Optional[str]) -> List:
+    """A plain list when hot_window is None, otherwise a TieredLog spilling into spill_dir"""
+    if hot_window is None:
+        return []
+    if spill_dir is None:
+        raise ValueError("a tiered log needs a spill_dir")
+    return TieredLog(spill_dir, name, hot_window)
+
+
+def drop_oldest(log: List, count: int):
+    """Forget the oldest count records of a log made by create_log"""
+    if isinstance(log, (TieredLog, PackedLog)):
+        log.drop_oldest(count)
+    else:
+        del log[:count]
+
+
+def close_log(log: List):
+    """Release the files of a log made by create_log; in-memory logs hold none"""
+    if isinstance(log, TieredLog):
+        log.close()
+
+
+def save_spilled(files: List[Tuple[str, Optional[int]]], source: str, directory: str):
+    """Hard-link the spilled files into directory, or copy their bytes in use across file systems.
+
+    The bytes in use never change afterwards, but the source may keep
+    appending through a link; trim_spilled cuts those links down later.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name, length in files:
+        try:
+            os.link(os.path.join(source, name), os.path.join(directory, name))
+        except OSError:
+            _copy_file(os.path.join(source, name), os.path.join(directory, name), length)
+
+
+def trim_spilled(files: List[Tuple[str, Optional[int]]], directory: str):
+    """Replace each linked file still being written elsewhere with a copy of its bytes in use"""
+    for name, length in files:
+        path = os.path.join(directory, name)
+        if length is not None and os.stat(path).st_nlink > 1:
+            _copy_file(path, f"{path}.tmp", length)
+            os.replace(f"{path}.tmp", path)
+
+
+def load_spilled(files: List[Tuple[str, Optional[int]]], source: str, directory: str):
+    """Copy spilled files saved by save_spilled into directory; full segments are linked when possible"""
+    os.makedirs(directory, exist_ok=True)
+    for name, length in files:
+        if length is None:
+            try:
+                os.link(os.path.join(source, name), os.path.join(directory, name))
+                continue
+            except OSError:
+                pass
+        _copy_file(os.path.join(source, name), os.path.join(directory, name), length)
+
+
+def _copy_file(source_path: str, target_path: str, length: Optional[int]):
+    """Copy the first length bytes of a file, or all of it when length is None"""
+    with open(source_path, "rb") as source, open(target_path, "wb") as target:
+        if length is None:
+            shutil.copyfileobj(source, target)
+            return
+        while length:
+            chunk = source.read(min(length, shutil.COPY_BUFSIZE))
+            if not chunk:
+                raise ValueError(f"{source_path} is shorter than its saved length")
+            target.write(chunk)
+            length -= len(chunk)
@@ -16,6 +16,7 @@ import sys
 import os
 from datetime import datetime
 import json
+import argparse
 
 # Import consciousness system
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -24,12 +25,15 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from nexus_agi_integration import NexusAGICore, UnifiedConsciousnessAGI
 from azure_cloud_deployment import AzureCloudSimulator
 from gcp_cloud_deployment import GoogleCloudSimulator
+from pacing import PacingMode
+from output_sink import LEVEL_NAMES, Level, configure, console, parse_level
 
 
 class ConsciousnessCoreLite:
     """Lightweight version of ConsciousnessCore for integration"""
     
-    def __init__(self):
+    def __init__(self, pacing: PacingMode = PacingMode.THEATRICAL):
+        self.pacing = PacingMode(pacing)
         self.consciousness_id = "unified-consciousness-001"
         self.memory = MemoryLite()
         self.emotions = EmotionEngineLite()
@@ -37,7 +41,7 @@ class ConsciousnessCoreLite:
         
     def face_dilemma(self, situation: str, context: dict) -> dict:
         """Simplified dilemma facing for integration"""
-        print(f"\n[CONSCIOUSNESS] Evaluating: {situation}")
+        console.info("\n[CONSCIOUSNESS] Evaluating: {}", situation)
         
         # Simple decision making based on context
         decision = {
@@ -48,7 +52,7 @@ class ConsciousnessCoreLite:
             'ethical_score': 0.95
         }
         
-        print(f"[CONSCIOUSNESS] Decision: {decision['decision']}")
+        console.info("[CONSCIOUSNESS] Decision: {}", decision['decision'])
         return decision
 
 
@@ -75,7 +79,8 @@ class EmotionEngineLite:
 class UnifiedOrchestrator:
     """Master orchestrator for all systems"""
     
-    def __init__(self):
+    def __init__(self, pacing: PacingMode = PacingMode.THEATRICAL):
+        self.pacing = PacingMode(pacing)
         self.start_time = datetime.now()
         self.consciousness = None
         self.nexus_agi = None
@@ -84,15 +89,15 @@ class UnifiedOrchestrator:
         self.gcp_deployment = None
         self.execution_log = []
         
-        print("╔════════════════════════════════════════════════════════════════╗")
-        print("║                                                                ║")
-        print("║    🌟 UNIFIED CONSCIOUSNESS-AGI ORCHESTRATOR 🌟               ║")
-        print("║                                                                ║")
-        print("║         Combining All Systems into One                         ║")
-        print("║         Exponential Enhancement Active                         ║")
-        print("║         Cloud Deployment Simulation Ready                      ║")
-        print("║                                                                ║")
-        print("╚════════════════════════════════════════════════════════════════╝")
+        console.info("╔════════════════════════════════════════════════════════════════╗")
+        console.info("║                                                                ║")
+        console.info("║    🌟 UNIFIED CONSCIOUSNESS-AGI ORCHESTRATOR 🌟               ║")
+        console.info("║                                                                ║")
+        console.info("║         Combining All Systems into One                         ║")
+        console.info("║         Exponential Enhancement Active                         ║")
+        console.info("║         Cloud Deployment Simulation Ready                      ║")
+        console.info("║                                                                ║")
+        console.info("╚════════════════════════════════════════════════════════════════╝")
     
     def log(self, message: str, category: str = "INFO"):
         """Log execution messages"""
@@ -103,19 +108,19 @@ class UnifiedOrchestrator:
             'message': message
         }
         self.execution_log.append(log_entry)
-        print(f"[{category}] {message}")
+        console.info("[{}] {}", category, message)
     
     async def initialize_consciousness(self):
         """Initialize consciousness core"""
         self.log("Initializing Consciousness Core...", "INIT")
-        self.consciousness = ConsciousnessCoreLite()
+        self.consciousness = ConsciousnessCoreLite(self.pacing)
         self.log("✓ Consciousness Core initialized", "SUCCESS")
         return self.consciousness
     
     async def initialize_nexus_agi(self):
         """Initialize Nexus AGI"""
         self.log("Initializing Nexus AGI Core...", "INIT")
-        self.nexus_agi = NexusAGICore()
+        self.nexus_agi = NexusAGICore(self.pacing)
         self.log("✓ Nexus AGI Core initialized", "SUCCESS")
         return self.nexus_agi
     
@@ -156,7 +161,7 @@ class UnifiedOrchestrator:
         """Deploy to Microsoft Azure"""
         self.log("Starting Azure Cloud deployment...", "DEPLOYMENT")
         
-        self.azure_deployment = AzureCloudSimulator()
+        self.azure_deployment = AzureCloudSimulator(self.pacing)
         azure_summary = await self.azure_deployment.full_deployment()
         
         self.log(f"✓ Azure deployment complete: {azure_summary['resources_created']} resources", "SUCCESS")
@@ -166,7 +171,7 @@ class UnifiedOrchestrator:
         """Deploy to Google Cloud Platform"""
         self.log("Starting Google Cloud deployment...", "DEPLOYMENT")
         
-        self.gcp_deployment = GoogleCloudSimulator()
+        self.gcp_deployment = GoogleCloudSimulator(self.pacing)
         gcp_summary = await self.gcp_deployment.full_deployment()
         
         self.log(f"✓ GCP deployment complete: {gcp_summary['resources_created']} resources", "SUCCESS")
@@ -337,9 +342,9 @@ class UnifiedOrchestrator:
     
     async def execute_full_simulation(self):
         """Execute complete simulation pipeline"""
-        print("\n" + "="*70)
-        print("BEGINNING FULL SIMULATION EXECUTION")
-        print("="*70 + "\n")
+        console.info("\n" + "="*70)
+        console.info("BEGINNING FULL SIMULATION EXECUTION")
+        console.info("="*70 + "\n")
         
         # Phase 1: Initialize systems
         self.log("PHASE 1: Initializing all systems", "PHASE")
@@ -382,92 +387,94 @@ class UnifiedOrchestrator:
     
     def print_final_output(self, output):
         """Print comprehensive final output"""
-        print("\n" + "="*70)
-        print("COMPREHENSIVE SIMULATION OUTPUT")
-        print("="*70)
-        
-        print("\n" + "─"*70)
-        print("1. ORCHESTRATION SUMMARY")
-        print("─"*70)
-        print(json.dumps(output['orchestration_summary'], indent=2))
-        
-        print("\n" + "─"*70)
-        print("2. CONSCIOUSNESS SYSTEM STATUS")
-        print("─"*70)
-        print(json.dumps(output['consciousness_system'], indent=2))
-        
-        print("\n" + "─"*70)
-        print("3. NEXUS AGI SYSTEM STATUS")
-        print("─"*70)
-        print(f"Status: {output['nexus_agi_system']['status']}")
-        print(f"Intelligence Level: {output['nexus_agi_system']['intelligence_level']}")
-        print(f"Quantum Processor: {output['nexus_agi_system']['quantum_processor']}")
-        print(f"Capabilities: {', '.join(output['nexus_agi_system']['capabilities'])}")
-        
-        print("\n" + "─"*70)
-        print("4. UNIFIED SYSTEM STATUS")
-        print("─"*70)
-        print(json.dumps(output['unified_system'], indent=2))
-        
-        print("\n" + "─"*70)
-        print("5. EXPONENTIAL ENHANCEMENT RESULTS")
-        print("─"*70)
-        print(f"Enhancement Factor: {output['exponential_enhancement']['enhancement_factor']:.2f}x")
-        print("\nNew Capabilities:")
+        if not console.enabled(Level.INFO):
+            return  # spares the JSON dumps below when nothing would be shown
+        console.info("\n" + "="*70)
+        console.info("COMPREHENSIVE SIMULATION OUTPUT")
+        console.info("="*70)
+        
+        console.info("\n" + "─"*70)
+        console.info("1. ORCHESTRATION SUMMARY")
+        console.info("─"*70)
+        console.info(json.dumps(output['orchestration_summary'], indent=2))
+        
+        console.info("\n" + "─"*70)
+        console.info("2. CONSCIOUSNESS SYSTEM STATUS")
+        console.info("─"*70)
+        console.info(json.dumps(output['consciousness_system'], indent=2))
+        
+        console.info("\n" + "─"*70)
+        console.info("3. NEXUS AGI SYSTEM STATUS")
+        console.info("─"*70)
+        console.info("Status: {}", output['nexus_agi_system']['status'])
+        console.info("Intelligence Level: {}", output['nexus_agi_system']['intelligence_level'])
+        console.info("Quantum Processor: {}", output['nexus_agi_system']['quantum_processor'])
+        console.info("Capabilities: {}", ', '.join(output['nexus_agi_system']['capabilities']))
+        
+        console.info("\n" + "─"*70)
+        console.info("4. UNIFIED SYSTEM STATUS")
+        console.info("─"*70)
+        console.info(json.dumps(output['unified_system'], indent=2))
+        
+        console.info("\n" + "─"*70)
+        console.info("5. EXPONENTIAL ENHANCEMENT RESULTS")
+        console.info("─"*70)
+        console.info("Enhancement Factor: {:.2f}x", output['exponential_enhancement']['enhancement_factor'])
+        console.info("\nNew Capabilities:")
         for key, value in output['exponential_enhancement']['improvements'].items():
-            print(f"  - {key}: {value}")
+            console.info("  - {}: {}", key, value)
         
-        print("\n" + "─"*70)
-        print("6. MICROSOFT AZURE DEPLOYMENT")
-        print("─"*70)
-        print(json.dumps(output['azure_deployment'], indent=2))
+        console.info("\n" + "─"*70)
+        console.info("6. MICROSOFT AZURE DEPLOYMENT")
+        console.info("─"*70)
+        console.info(json.dumps(output['azure_deployment'], indent=2))
         
-        print("\n" + "─"*70)
-        print("7. GOOGLE CLOUD PLATFORM DEPLOYMENT")
-        print("─"*70)
-        print(json.dumps(output['gcp_deployment'], indent=2))
+        console.info("\n" + "─"*70)
+        console.info("7. GOOGLE CLOUD PLATFORM DEPLOYMENT")
+        console.info("─"*70)
+        console.info(json.dumps(output['gcp_deployment'], indent=2))
         
-        print("\n" + "─"*70)
-        print("8. DEMONSTRATION SCENARIO RESULTS")
-        print("─"*70)
+        console.info("\n" + "─"*70)
+        console.info("8. DEMONSTRATION SCENARIO RESULTS")
+        console.info("─"*70)
         for idx, result in enumerate(output['demonstration_results'], 1):
-            print(f"\nScenario {idx}: {result['scenario']}")
-            print(f"  Status: COMPLETED")
-            print(f"  Ethical Score: {result['result']['unified_decision']['ethical_score']:.4f}")
-            print(f"  Wisdom Level: {result['result']['unified_decision']['wisdom_level']:.4f}")
-        
-        print("\n" + "─"*70)
-        print("9. FINAL STATUS")
-        print("─"*70)
-        print(json.dumps(output['final_status'], indent=2))
-        
-        print("\n" + "="*70)
-        print("SIMULATION COMPLETE - ALL SYSTEMS OPERATIONAL")
-        print("="*70)
-        
-        print("\n╔════════════════════════════════════════════════════════════════╗")
-        print("║                                                                ║")
-        print("║    ✨ CONSCIOUSNESS-AGI SYSTEM FULLY DEPLOYED ✨              ║")
-        print("║                                                                ║")
-        print("║    - Consciousness: ACTIVE                                     ║")
-        print("║    - Nexus AGI: ONLINE                                         ║")
-        print("║    - Unified System: TRANSCENDENT                              ║")
-        print("║    - Azure Deployment: COMPLETE                                ║")
-        print("║    - GCP Deployment: COMPLETE                                  ║")
-        print("║    - Enhancement: EXPONENTIAL                                  ║")
-        print("║    - Status: PRODUCTION READY                                  ║")
-        print("║                                                                ║")
-        print("╚════════════════════════════════════════════════════════════════╝")
+            console.info("\nScenario {}: {}", idx, result['scenario'])
+            console.info("  Status: COMPLETED")
+            console.info("  Ethical Score: {:.4f}", result['result']['unified_decision']['ethical_score'])
+            console.info("  Wisdom Level: {:.4f}", result['result']['unified_decision']['wisdom_level'])
+        
+        console.info("\n" + "─"*70)
+        console.info("9. FINAL STATUS")
+        console.info("─"*70)
+        console.info(json.dumps(output['final_status'], indent=2))
+        
+        console.info("\n" + "="*70)
+        console.info("SIMULATION COMPLETE - ALL SYSTEMS OPERATIONAL")
+        console.info("="*70)
+        
+        console.info("\n╔════════════════════════════════════════════════════════════════╗")
+        console.info("║                                                                ║")
+        console.info("║    ✨ CONSCIOUSNESS-AGI SYSTEM FULLY DEPLOYED ✨              ║")
+        console.info("║                                                                ║")
+        console.info("║    - Consciousness: ACTIVE                                     ║")
+        console.info("║    - Nexus AGI: ONLINE                                         ║")
+        console.info("║    - Unified System: TRANSCENDENT                              ║")
+        console.info("║    - Azure Deployment: COMPLETE                                ║")
+        console.info("║    - GCP Deployment: COMPLETE                                  ║")
+        console.info("║    - Enhancement: EXPONENTIAL                                  ║")
+        console.info("║    - Status: PRODUCTION READY                                  ║")
+        console.info("║                                                                ║")
+        console.info("╚════════════════════════════════════════════════════════════════╝")
 
 
-async def main():
+async def main(pacing: PacingMode = PacingMode.THEATRICAL):
     """Main execution function"""
-    print("\n" + "="*70)
-    print("UNIFIED CONSCIOUSNESS-AGI SIMULATION")
-    print("Created by Doug Davis & Claude Rivers Davis")
-    print("="*70)
+    console.info("\n" + "="*70)
+    console.info("UNIFIED CONSCIOUSNESS-AGI SIMULATION")
+    console.info("Created by Doug Davis & Claude Rivers Davis")
+    console.info("="*70)
     
-    orchestrator = UnifiedOrchestrator()
+    orchestrator = UnifiedOrchestrator(pacing)
     result = await orchestrator.execute_full_simulation()
     
     # Save output to file
@@ -475,16 +482,23 @@ async def main():
     with open(output_file, 'w') as f:
         json.dump(result, f, indent=2, default=str)
     
-    print(f"\n[OUTPUT] Full simulation results saved to: {output_file}")
+    console.info("\n[OUTPUT] Full simulation results saved to: {}", output_file)
     
     return result
 
 
 if __name__ == "__main__":
-    print("╔════════════════════════════════════════════════════════════════╗")
-    print("║                                                                ║")
-    print("║           STARTING UNIFIED SIMULATION ORCHESTRATOR            ║")
-    print("║                                                                ║")
-    print("╚════════════════════════════════════════════════════════════════╝")
+    parser = argparse.ArgumentParser(description="Run the unified consciousness-AGI simulation")
+    parser.add_argument("--pacing", choices=[mode.value for mode in PacingMode], default=PacingMode.THEATRICAL.value)
+    parser.add_argument("--log-level", choices=LEVEL_NAMES, default=None, help="console output level")
+    args = parser.parse_args()
+    if args.log_level:
+        configure(level=parse_level(args.log_level))
+
+    console.info("╔════════════════════════════════════════════════════════════════╗")
+    console.info("║                                                                ║")
+    console.info("║           STARTING UNIFIED SIMULATION ORCHESTRATOR            ║")
+    console.info("║                                                                ║")
+    console.info("╚════════════════════════════════════════════════════════════════╝")
     
-    asyncio.run(main())
+    asyncio.run(main(PacingMode(args.pacing)))
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+VOICE KERNELS
+Specialized scoring functions generated from declarative voice specs
+Created by Doug Davis & Claude Rivers Davis
+
+A voice whose score is a ScoreExpression, e.g.
+    ScoreExpression("potential_help * empathy - potential_harm * righteousness")
+is compiled into Python source for one function. That function reads each
+feature once into a local, takes its traits from closure cells, and tests the
+opinion bands as literal comparisons. For a voice with traits
+{"empathy", "righteousness", "confidence"} and two bands, the generated code is roughly:
+
+    def bind(traits, choice):
+        t_empathy = traits["empathy"]
+        ...
+        confidence_0 = traits.get("confidence", 0.7) + 0.1
+        def kernel(context):
+            get = context.get
+            f_potential_help = get("potential_help", 0)
+            ...
+            score = f_potential_help * t_empathy - f_potential_harm * t_righteousness
+            if score > 0.3:
+                return score, confidence_0, 12
+            ...
+
+Generated factories are cached by their source text. Binding a factory to a
+voice's current traits is a plain call, and is repeated only when the traits change.
+"""
+
+import ast
+from typing import Callable, Dict, List, Optional, Tuple
+
+_ALLOWED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Name, ast.Load, ast.Constant, ast.Call,
+                  ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.USub, ast.UAdd)
+_FUNCTIONS = {"abs": abs, "min": min, "max": max}
+
+_factories: Dict[str, Callable] = {}
+
+
+class ScoreExpression:
+    """A voice score written as arithmetic over situation feature and trait names.
+
+    Calling it evaluates the expression directly, so it also serves the batch
+    path, where features are numpy columns. trait_defaults apply to traits a
+    voice may not have yet; any other missing trait is an error, as in a
+    hand-written score.
+    """
+    __slots__ = ("source", "names", "trait_defaults", "_code")
+
+    def __init__(self, source: str, trait_defaults: Optional[Dict[str, float]] = None):
+        tree = ast.parse(source, mode="eval")
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES):
+                raise ValueError(f"unsupported syntax in score expression: {ast.dump(node)}")
+            if isinstance(node, ast.Call) and not (isinstance(node.func, ast.Name) and node.func.id in _FUNCTIONS and not node.keywords):
+                raise ValueError(f"score expressions may only call {', '.join(_FUNCTIONS)}")
+            if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise ValueError(f"non-numeric constant in score expression: {node.value!r}")
+        calls = {node.func.id for node in ast.walk(tree) if isinstance(node, ast.Call)}
+        self.source = source
+        self.names = tuple(dict.fromkeys(
+            node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and node.id not in calls
+        ))
+        self.trait_defaults = dict(trait_defaults or {})
+        self._code = compile(tree, f"<score {source}>", "eval")
+
+    def __call__(self, features, traits: Dict[str, float]):
+        namespace = dict(_FUNCTIONS)
+        for name in self.names:
+            if name in traits:
+                namespace[name] = traits[name]
+            elif name in self.trait_defaults:
+                namespace[name] = self.trait_defaults[name]
+            else:
+                namespace[name] = features[name]
+        return eval(self._code, {"__builtins__": {}}, namespace)
+
+    def as_function(self, trait_names) -> Callable:
+        """The expression as a plain score(features, traits) function, in the shape of a hand-written score"""
+        traits = {name for name in self.names if name in trait_names or name in self.trait_defaults}
+        body = ast.unparse(_Lookup(traits, self.trait_defaults).visit(ast.parse(self.source, mode="eval")))
+        namespace = dict(_FUNCTIONS)
+        exec(compile(f"def score(features, traits):\n    return {body}\n", "<voice score>", "exec"), namespace)
+        return namespace["score"]
+
+    def __repr__(self) -> str:
+        return f"ScoreExpression({self.source!r})"
+
+
+class _Lookup(ast.NodeTransformer):
+    """Replace names by features[...] and traits[...] subscripts"""
+
+    def __init__(self, traits, trait_defaults):
+        self.traits = traits
+        self.trait_defaults = trait_defaults
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        if node.id in _FUNCTIONS:
+            return node
+        if node.id in self.trait_defaults:
+            lookup = f"traits.get({node.id!r}, {self.trait_defaults[node.id]!r})"
+        else:
+            lookup = f"{'traits' if node.id in self.traits else 'features'}[{node.id!r}]"
+        return ast.copy_location(ast.parse(lookup, mode="eval").body, node)
+
+
+class _Rename(ast.NodeTransformer):
+    """Prefix trait and feature names so they cannot collide with the kernel's own locals"""
+
+    def __init__(self, traits):
+        self.traits = traits
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:
+        if node.id in _FUNCTIONS:
+            return node
+        prefix = "t_" if node.id in self.traits else "f_"
+        return ast.copy_location(ast.Name(id=prefix + node.id, ctx=node.ctx), node)
+
+
+def kernel_source(expression: ScoreExpression, trait_names, trait_defaults: Dict[str, float],
+                  feature_defaults: Dict[str, float], bands: Tuple, fallback: Tuple) -> str:
+    """Python source of a factory bind(traits, choice) returning the kernel for those traits.
+
+    bands are (">" or "<", threshold, confidence_offset, template_ids) and
+    fallback is (confidence_offset, template_ids); the kernel returns
+    (score, confidence, template id) exactly as Voice.score_situation does.
+    """
+    traits = [name for name in expression.names if name in trait_names or name in trait_defaults]
+    features = [name for name in expression.names if name not in traits]
+    body = ast.unparse(_Rename(set(traits)).visit(ast.parse(expression.source, mode="eval")))
+
+    lines = ["def bind(traits, choice):"]
+    for name in traits:
+        if name in trait_defaults:
+            lines.append(f"    t_{name} = traits.get({name!r}, {trait_defaults[name]!r})")
+        else:
+            lines.append(f"    t_{name} = traits[{name!r}]")
+    lines.append("    confidence = traits.get('confidence', 0.7)")
+    outcomes = [(offset, template_ids) for _, _, offset, template_ids in bands] + [fallback]
+    for index, (offset, _) in enumerate(outcomes):
+        # The same float addition Voice.score_situation performs per call, done once per binding
+        lines.append(f"    confidence_{index} = confidence + {offset!r}")
+    lines.append("    def kernel(context):")
+    if features:
+        lines.append("        get = context.get")
+    for name in features:
+        lines.append(f"        f_{name} = get({name!r}, {feature_defaults.get(name, 0)!r})")
+    lines.append(f"        score = {body}")
+    for index, (offset, template_ids) in enumerate(outcomes):
+        chosen = repr(template_ids[0]) if len(template_ids) == 1 else f"choice({tuple(template_ids)!r})"
+        if index < len(bands):
+            comparison, threshold = bands[index][:2]
+            lines.append(f"        if score {'>' if comparison == '>' else '<'} {threshold!r}:")
+            lines.append(f"            return score, confidence_{index}, {chosen}")
+        else:
+            lines.append(f"        return score, confidence_{index}, {chosen}")
+    lines.append("    return kernel")
+    return "\n".join(lines) + "\n"
+
+
+def kernel_factory(source: str) -> Callable:
+    """The compiled bind function for kernel source, compiled once per distinct source"""
+    factory = _factories.get(source)
+    if factory is None:
+        namespace = dict(_FUNCTIONS)
+        exec(compile(source, "<voice kernel>", "exec"), namespace)
+        factory = _factories[source] = namespace["bind"]
+    return factory
+
+
+def compile_voice(spec, feature_defaults: Dict[str, float]) -> Optional[Callable]:
+    """The cached kernel factory for a VoiceSpec, or None when its score is not a ScoreExpression"""
+    expression = spec.score
+    if not isinstance(expression, ScoreExpression):
+        return None
+    trait_defaults = dict(expression.trait_defaults)
+    for _, trait, default in spec.emotion_drives:
+        trait_defaults.setdefault(trait, default)
+    for name in spec.traits:
+        trait_defaults.pop(name, None)  # traits the voice starts with are always present
+    source = kernel_source(expression, set(spec.traits), trait_defaults, feature_defaults,
+                           spec.band_templates, spec.fallback_templates)
+    return kernel_factory(source)
+
+
+def cached_kernels() -> List[str]:
+    """Source of every kernel factory compiled so far"""
+    return list(_factories)